@@ -0,0 +1,112 @@
+"""
+Бенчмарк пакетных эмбеддингов: прогоняет синтетические чанки через
+BatchedOllamaEmbeddings с разными размерами батча и параллельностью
+и печатает пропускную способность в чанках в секунду.
+
+По умолчанию поднимает локальную заглушку /api/embed, которая имитирует
+задержку Ollama (фиксированная часть на запрос + часть на каждый текст):
+
+    python bench_embeddings.py --batch-sizes 1,8,32 --concurrency 1,4,8
+
+Против настоящей Ollama (кэш эмбеддингов не используется):
+
+    python bench_embeddings.py --base-url http://localhost:11434 --chunks 256
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from embed_driver import BatchedOllamaEmbeddings
+from config import OLLAMA_EMBED_MODEL, CHUNK_SIZE
+
+
+def make_stub_handler(request_latency: float, item_latency: float, dim: int, max_parallel: int):
+    # Ограничение параллельности имитирует OLLAMA_NUM_PARALLEL: лишние запросы ждут в очереди.
+    slots = threading.Semaphore(max_parallel)
+
+    class StubEmbedHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != '/api/embed':
+                self.send_error(404)
+                return
+            payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            texts = payload['input']
+            texts = [texts] if isinstance(texts, str) else texts
+            with slots:
+                time.sleep(request_latency + item_latency * len(texts))
+            body = json.dumps({
+                'model': payload['model'],
+                'embeddings': [[(hash(text) % 1000) / 1000.0] * dim for text in texts]
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubEmbedHandler
+
+
+def start_stub_server(args) -> ThreadingHTTPServer:
+    handler = make_stub_handler(args.stub_request_ms / 1000, args.stub_item_ms / 1000, args.stub_dim, args.stub_parallel)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_chunks(count: int) -> list:
+    words = ['приказ', 'отпуск', 'сотрудник', 'договор', 'архив', 'документ', 'год', 'отдел']
+    rng = random.Random(42)
+    chunks = []
+    for i in range(count):
+        text = f'{i} ' + ' '.join(rng.choice(words) for _ in range(CHUNK_SIZE // 8))
+        chunks.append(text[:CHUNK_SIZE])
+    return chunks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default=None, help='Адрес Ollama; без него запускается заглушка')
+    parser.add_argument('--model', default=OLLAMA_EMBED_MODEL)
+    parser.add_argument('--chunks', type=int, default=512)
+    parser.add_argument('--batch-sizes', default='1,8,32,64')
+    parser.add_argument('--concurrency', default='1,2,4,8')
+    parser.add_argument('--stub-request-ms', type=float, default=20.0, help='Задержка заглушки на запрос')
+    parser.add_argument('--stub-item-ms', type=float, default=5.0, help='Задержка заглушки на каждый текст')
+    parser.add_argument('--stub-parallel', type=int, default=4, help='Сколько запросов заглушка обслуживает одновременно')
+    parser.add_argument('--stub-dim', type=int, default=1024)
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = start_stub_server(args)
+        base_url = f'http://127.0.0.1:{server.server_address[1]}'
+        print(f'Заглушка /api/embed на {base_url}')
+
+    chunks = make_chunks(args.chunks)
+    print(f"\n{'batch':>6} {'conc':>5} {'time':>9} {'chunks/s':>10} {'retries':>8}")
+    try:
+        for batch_size in (int(value) for value in args.batch_sizes.split(',')):
+            for concurrency in (int(value) for value in args.concurrency.split(',')):
+                emb = BatchedOllamaEmbeddings(
+                    args.model, base_url=base_url, batch_size=batch_size, concurrency=concurrency
+                )
+                started = time.perf_counter()
+                vectors = emb.embed_documents(chunks)
+                elapsed = time.perf_counter() - started
+                assert len(vectors) == len(chunks)
+                print(f'{batch_size:>6} {concurrency:>5} {elapsed:>8.2f}s {len(chunks) / elapsed:>10.1f} {emb.retries:>8}')
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
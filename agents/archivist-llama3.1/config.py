@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 DATA_DIR = Path(__file__).parent / 'data' / 'example_docs'
@@ -5,10 +6,28 @@ DATA_DIR = Path(__file__).parent / 'data' / 'example_docs'
 CHUNK_SIZE = 800
 CHUNK_OVERLAP = 120
 
+# Процессы для разбора и нарезки документов; 1 — разбирать в текущем процессе
+INGEST_WORKERS = max((os.cpu_count() or 2) - 1, 1)
+
 OLLAMA_EMBED_MODEL = 'mxbai-embed-large'
 OLLAMA_LLM_MODEL = 'llama3.1:8b'
+OLLAMA_BASE_URL = os.getenv('OLLAMA_HOST', 'http://localhost:11434')
+
+# Эмбеддинги при индексации: размер батча на один запрос к Ollama и число параллельных запросов
+EMBED_BATCH_SIZE = 32
+EMBED_CONCURRENCY = 4
+EMBED_MAX_RETRIES = 3
+EMBED_RETRY_BACKOFF = 0.5
+EMBED_REQUEST_TIMEOUT = 120
 
 INDEX_DIR = Path(__file__).parent / 'faiss_index'
+INDEX_MANIFEST_NAME = 'manifest.json'
+# Сколько завершённых задач индексации помнит сервер для GET /jobs/{id}
+INDEX_JOBS_HISTORY = 100
+
+EMBED_CACHE_PATH = Path(__file__).parent / 'embed_cache' / 'embeddings.sqlite3'
+# Лимит размера кэша эмбеддингов в байтах; 0 отключает кэш
+EMBED_CACHE_MAX_BYTES = 512 * 1024 * 1024
 
 TOP_K = 5
 
@@ -0,0 +1,118 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from langchain_core.embeddings import Embeddings
+from config import (
+    OLLAMA_BASE_URL,
+    EMBED_BATCH_SIZE,
+    EMBED_CONCURRENCY,
+    EMBED_MAX_RETRIES,
+    EMBED_RETRY_BACKOFF,
+    EMBED_REQUEST_TIMEOUT
+)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class EmbeddingRequestError(Exception):
+    pass
+
+
+def normalize_base_url(url: str) -> str:
+    # OLLAMA_HOST часто задают как host:port без схемы.
+    if '://' not in url:
+        url = f'http://{url}'
+    return url.rstrip('/')
+
+
+class BatchedOllamaEmbeddings(Embeddings):
+    """
+    Эмбеддинги через HTTP API Ollama (/api/embed): тексты режутся на батчи,
+    батчи отправляются параллельно в ограниченное число потоков, упавшие
+    запросы повторяются с экспоненциальной задержкой.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        base_url: str = OLLAMA_BASE_URL,
+        batch_size: int = EMBED_BATCH_SIZE,
+        concurrency: int = EMBED_CONCURRENCY,
+        max_retries: int = EMBED_MAX_RETRIES,
+        retry_backoff: float = EMBED_RETRY_BACKOFF,
+        timeout: float = EMBED_REQUEST_TIMEOUT,
+        on_progress: Optional[ProgressCallback] = None
+    ):
+        self.model = model
+        self.url = f'{normalize_base_url(base_url)}/api/embed'
+        self.batch_size = max(batch_size, 1)
+        self.concurrency = max(concurrency, 1)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+        self.on_progress = on_progress
+        self.retries = 0
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        attempt = 0
+        while True:
+            try:
+                response = self._session.post(
+                    self.url,
+                    json={'model': self.model, 'input': texts},
+                    timeout=self.timeout
+                )
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    raise EmbeddingRequestError(f'Ollama вернула {response.status_code}: {response.text[:200]}')
+                response.raise_for_status()
+                embeddings = response.json()['embeddings']
+                if len(embeddings) != len(texts):
+                    raise EmbeddingRequestError(
+                        f'Ollama вернула {len(embeddings)} эмбеддингов вместо {len(texts)}'
+                    )
+                return embeddings
+            except (requests.ConnectionError, requests.Timeout, EmbeddingRequestError) as e:
+                if attempt >= self.max_retries:
+                    raise EmbeddingRequestError(f'Не удалось получить эмбеддинги: {e}') from e
+                delay = self.retry_backoff * 2 ** attempt
+                attempt += 1
+                self.retries += 1
+                time.sleep(delay + random.uniform(0, delay))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        done = 0
+        lock = threading.Lock()
+
+        def run(batch: List[str]) -> List[List[float]]:
+            nonlocal done
+            vectors = self._embed_batch(batch)
+            with lock:
+                done += len(batch)
+                if self.on_progress is not None:
+                    self.on_progress(done, len(texts))
+            return vectors
+
+        if len(batches) == 1:
+            results = [run(batches[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(batches))) as executor:
+                # map сохраняет порядок батчей, так что векторы совпадают с текстами по индексу.
+                results = list(executor.map(run, batches))
+        return [vector for batch in results for vector in batch]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_batch([text])[0]
@@ -1,8 +1,173 @@
-from langchain_ollama.embeddings import OllamaEmbeddings
-from config import OLLAMA_EMBED_MODEL
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import List, Optional
 
+from langchain_core.embeddings import Embeddings
+from embed_driver import BatchedOllamaEmbeddings, ProgressCallback
+from config import OLLAMA_EMBED_MODEL, EMBED_CACHE_PATH, EMBED_CACHE_MAX_BYTES
 
-def get_ollama_embeddings(model_name: str = None):
-    model = OLLAMA_EMBED_MODEL
-    emb = OllamaEmbeddings(model=model)
-    return emb
\ No newline at end of file
+# После вытеснения кэш ужимается до этой доли лимита, чтобы не чистить его на каждой вставке.
+EVICTION_TARGET = 0.9
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Дисковый кэш эмбеддингов в SQLite: ключ — (модель, SHA-256 текста чанка),
+    значение — вектор float32. При превышении лимита по размеру вытесняются
+    давно не использованные записи.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Одно соединение на процесс; индексация и запросы могут идти из разных потоков.
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS embeddings ('
+            'model TEXT NOT NULL, hash TEXT NOT NULL, vector BLOB NOT NULL, '
+            'size INTEGER NOT NULL, last_used REAL NOT NULL, PRIMARY KEY (model, hash))'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS ix_embeddings_last_used ON embeddings (last_used)')
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM embeddings').fetchone()[0]
+
+    def get_many(self, model: str, hashes: List[str]) -> dict:
+        found = {}
+        unique = list(dict.fromkeys(hashes))
+        with self._lock:
+            # Держимся ниже лимита SQLite на число параметров в запросе.
+            for start in range(0, len(unique), 500):
+                batch = unique[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f'SELECT hash, vector FROM embeddings WHERE model = ? AND hash IN ({placeholders})',
+                    [model, *batch]
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array('f', blob).tolist()
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    'UPDATE embeddings SET last_used = ? WHERE model = ? AND hash = ?',
+                    [(now, model, key) for key in found]
+                )
+            self.hits += sum(1 for key in hashes if key in found)
+            self.misses += sum(1 for key in hashes if key not in found)
+        return found
+
+    def put_many(self, model: str, items: dict):
+        if not items:
+            return
+        now = time.time()
+        rows = []
+        for key, vector in items.items():
+            blob = array('f', vector).tobytes()
+            rows.append((model, key, blob, len(blob), now))
+        with self._lock:
+            self._conn.execute('BEGIN')
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO embeddings (model, hash, vector, size, last_used) '
+                'VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+            self._conn.execute('COMMIT')
+            self._total_bytes += sum(row[3] for row in rows)
+            if self.max_bytes and self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # Счётчик в памяти приблизительный (перезаписи, другие процессы), поэтому пересчитываем.
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM embeddings').fetchone()[0]
+        to_free = self._total_bytes - int(self.max_bytes * EVICTION_TARGET)
+        if to_free <= 0:
+            return
+        victims = []
+        freed = 0
+        for rowid, size in self._conn.execute('SELECT rowid, size FROM embeddings ORDER BY last_used'):
+            victims.append((rowid,))
+            freed += size
+            if freed >= to_free:
+                break
+        self._conn.execute('BEGIN')
+        self._conn.executemany('DELETE FROM embeddings WHERE rowid = ?', victims)
+        self._conn.execute('COMMIT')
+        self._total_bytes -= freed
+        self.evicted += len(victims)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM embeddings').fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'path': str(self.path),
+                'entries': entries,
+                'size_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evicted': self.evicted
+            }
+
+
+class CachedEmbeddings(Embeddings):
+    """Обёртка над моделью эмбеддингов: в Ollama уходят только тексты, которых нет в кэше."""
+
+    def __init__(self, underlying: Embeddings, model_name: str, cache: EmbeddingCache):
+        self.underlying = underlying
+        self.model_name = model_name
+        self.cache = cache
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        hashes = [text_sha256(text) for text in texts]
+        cached = self.cache.get_many(self.model_name, hashes)
+
+        missing = {}
+        for key, text in zip(hashes, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        if missing:
+            vectors = self.underlying.embed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            self.cache.put_many(self.model_name, computed)
+            cached.update(computed)
+
+        return [cached[key] for key in hashes]
+
+    def embed_query(self, text: str) -> List[float]:
+        # Ollama считает запрос так же, как документ, поэтому кэш общий.
+        return self.embed_documents([text])[0]
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache(EMBED_CACHE_PATH, EMBED_CACHE_MAX_BYTES)
+        return _cache
+
+
+def get_ollama_embeddings(model_name: str = None, on_progress: Optional[ProgressCallback] = None):
+    model = model_name or OLLAMA_EMBED_MODEL
+    emb = BatchedOllamaEmbeddings(model, on_progress=on_progress)
+    if not EMBED_CACHE_MAX_BYTES:
+        return emb
+    return CachedEmbeddings(emb, model, get_embedding_cache())
@@ -1,34 +1,280 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
 from pathlib import Path
+from typing import Callable, Optional
 from langchain.vectorstores import FAISS
-from langchain_ollama.embeddings import OllamaEmbeddings
 
-from loaders import load_documents_from_folder
-from splitter import split_documents
-from config import INDEX_DIR, DATA_DIR, OLLAMA_EMBED_MODEL
+from embeddings import get_ollama_embeddings, get_embedding_cache
+from ingest import IngestSummary, iter_ingested
+from loaders import iter_document_paths
+from config import (
+    INDEX_DIR,
+    DATA_DIR,
+    OLLAMA_EMBED_MODEL,
+    INDEX_MANIFEST_NAME,
+    EMBED_CACHE_MAX_BYTES,
+    EMBED_BATCH_SIZE,
+    EMBED_CONCURRENCY
+)
 
-def build_faiss_index(data_folder: str | Path = None, index_dir: str | Path = None, embed_model: str = None):
-    data_folder = data_folder or DATA_DIR
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class IndexBuildError(Exception):
+    pass
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(index_dir: Path) -> dict | None:
+    manifest_path = index_dir / INDEX_MANIFEST_NAME
+    if not manifest_path.is_file():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        print(f'Манифест индекса повреждён ({e}), индекс будет перестроен')
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(index_dir: Path, manifest: dict):
+    # Пишем во временный файл и подменяем, чтобы прерванная запись не оставила обрезанный JSON.
+    manifest_path = index_dir / INDEX_MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding='utf-8')
+    os.replace(tmp_path, manifest_path)
+
+
+def prune_index_versions(index_dir: Path, keep: set):
+    for path in index_dir.parent.glob(f'.{index_dir.name}-*'):
+        if path.is_dir() and not path.is_symlink() and path.resolve() not in keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def write_index(vectorstore, manifest: dict, index_dir: Path):
+    """
+    Сохраняет индекс и манифест в новую папку-версию рядом с index_dir и одним
+    os.replace переключает на неё симлинк index_dir, так что читатели видят
+    либо прежний индекс целиком, либо новый. Предыдущая версия сохраняется для
+    тех, кто как раз её загружает; более старые удаляются.
+    """
+    index_dir.parent.mkdir(parents=True, exist_ok=True)
+    version_dir = Path(tempfile.mkdtemp(prefix=f'.{index_dir.name}-', dir=index_dir.parent))
+    tmp_link = index_dir.with_name(f'.{index_dir.name}-link-{uuid.uuid4().hex}')
+    previous = index_dir.resolve() if index_dir.is_symlink() else None
+    try:
+        vectorstore.save_local(str(version_dir))
+        save_manifest(version_dir, manifest)
+        os.symlink(version_dir.name, tmp_link)
+        if index_dir.exists() and not index_dir.is_symlink():
+            # Индекс, собранный до перехода на версии, — обычная папка. Её один раз
+            # переносим в сторону; только в этот раз index_dir на миг отсутствует.
+            previous = index_dir.with_name(f'.{index_dir.name}-{uuid.uuid4().hex}')
+            os.rename(index_dir, previous)
+        os.replace(tmp_link, index_dir)
+    except BaseException:
+        if os.path.lexists(tmp_link):
+            os.unlink(tmp_link)
+        shutil.rmtree(version_dir, ignore_errors=True)
+        raise
+    prune_index_versions(index_dir, {version_dir.resolve(), previous})
+
+
+def load_existing_index(index_dir: Path, emb, manifest: dict | None, embed_model: str):
+    """
+    Возвращает сохранённый индекс, если его можно дополнять: есть манифест
+    и он построен той же моделью эмбеддингов. Иначе None — нужна полная сборка.
+    """
+    if manifest is None or manifest.get('embed_model') != embed_model:
+        return None
+    # Симлинк разрешается один раз, чтобы оба файла индекса читались из одной версии.
+    index_dir = index_dir.resolve()
+    if not (index_dir / 'index.faiss').is_file():
+        return None
+    return FAISS.load_local(str(index_dir), emb, allow_dangerous_deserialization=True)
+
+
+def update_faiss_index(
+    data_folder: str | Path = None,
+    index_dir: str | Path = None,
+    embed_model: str = None,
+    rebuild: bool = False,
+    on_progress: Optional[Callable[..., None]] = None
+) -> dict:
+    """
+    Инкрементально обновляет FAISS-индекс по содержимому папки.
+    Эмбеддинги считаются только для новых и изменённых файлов, векторы удалённых
+    файлов убираются из индекса. Соответствие файл → чанки хранится в манифесте рядом с индексом.
+    on_progress получает именованные счётчики: files_total, files_parsed, chunks_embedded.
+    Если при полной пересборке не разобран ни один файл, бросает IndexBuildError.
+    """
+    data_folder = Path(data_folder or DATA_DIR)
     index_dir = Path(index_dir or INDEX_DIR)
+    embed_model = embed_model or OLLAMA_EMBED_MODEL
+
+    def report(**progress):
+        if on_progress is not None:
+            on_progress(**progress)
+
+    emb = get_ollama_embeddings(embed_model)
+
+    manifest = None if rebuild else load_manifest(index_dir)
+    vectorstore = load_existing_index(index_dir, emb, manifest, embed_model)
+    if vectorstore is None:
+        print('Индекс будет собран заново')
+        old_files = {}
+    else:
+        old_files = manifest['files']
+
+    files = {}
+    changed = []
+    for path in iter_document_paths(data_folder):
+        key = str(path.resolve())
+        stat = path.stat()
+        entry = old_files.get(key)
+        if entry and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+            files[key] = entry
+            continue
+        sha256 = file_sha256(path)
+        if entry and entry['sha256'] == sha256:
+            # Файл «потрогали», но содержимое то же — эмбеддинги не нужны.
+            files[key] = {**entry, 'mtime': stat.st_mtime, 'size': stat.st_size}
+            continue
+        changed.append((key, path, stat, sha256))
+
+    # Чанки удалённых файлов убираются сразу; чанки изменённого файла — только
+    # после того, как его новая версия успешно разобрана.
+    changed_keys = {key for key, *_ in changed}
+    removed = [key for key in old_files if key not in files and key not in changed_keys]
+    stale_ids = [chunk_id for key in removed for chunk_id in old_files[key]['chunk_ids']]
 
-    print('Загрузка документов...')
-    docs = load_documents_from_folder(data_folder)
-    print(f'Загружено документов: {len(docs)}')
+    print(f'Файлов без изменений: {len(files)}, новых/изменённых: {len(changed)}, удалённых: {len(removed)}')
+    report(files_total=len(changed), files_parsed=0, chunks_embedded=0)
 
-    print('Разбиение на чанки...')
-    chunks = split_documents(docs)
-    print(f'Получено чанков: {len(chunks)}')
+    # Чанки копятся, пока не наберётся на полную загрузку эмбеддера, и уходят в индекс,
+    # пока пул процессов продолжает разбирать следующие файлы.
+    flush_size = EMBED_BATCH_SIZE * EMBED_CONCURRENCY
+    pending_chunks = []
+    pending_ids = []
+    added_chunks = 0
 
-    print('Создание эмбеддингов (Ollama)...')
-    emb = OllamaEmbeddings(model=OLLAMA_EMBED_MODEL) if OLLAMA_EMBED_MODEL else OllamaEmbeddings()
+    def flush():
+        nonlocal vectorstore, pending_chunks, pending_ids, added_chunks
+        if not pending_chunks:
+            return
+        if vectorstore is None:
+            vectorstore = FAISS.from_documents(pending_chunks, embedding=emb, ids=pending_ids)
+        else:
+            vectorstore.add_documents(pending_chunks, ids=pending_ids)
+        added_chunks += len(pending_chunks)
+        pending_chunks, pending_ids = [], []
+        report(chunks_embedded=added_chunks)
 
-    print('Индексирование в FAISS...')
-    vectorstore = FAISS.from_documents(chunks, embedding=emb)
+    changed_files = {key: (stat, sha256) for key, path, stat, sha256 in changed}
+    ingest = IngestSummary()
+    kept_on_failure = 0
+    for done, (key, chunks, file_report) in enumerate(iter_ingested(list(changed_files), ingest), start=1):
+        report(files_parsed=done)
+        if file_report.status != 'ok':
+            # Сбой разбора не должен стирать проиндексированную версию: старая запись
+            # остаётся в манифесте со старыми mtime/хэшем, и файл повторится в следующий раз.
+            if key in old_files:
+                files[key] = old_files[key]
+                kept_on_failure += 1
+            continue
+        if key in old_files:
+            stale_ids.extend(old_files[key]['chunk_ids'])
+        stat, sha256 = changed_files[key]
+        chunk_ids = [uuid.uuid4().hex for _ in chunks]
+        pending_chunks.extend(chunks)
+        pending_ids.extend(chunk_ids)
+        files[key] = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'sha256': sha256,
+            'chunk_ids': chunk_ids
+        }
+        if len(pending_chunks) >= flush_size:
+            flush()
+            print(f'Файлов разобрано: {done}/{len(changed_files)}, чанков в индексе: {added_chunks}')
+    flush()
 
-    index_dir.mkdir(parents=True, exist_ok=True)
-    vectorstore.save_local(str(index_dir))
+    if stale_ids:
+        # FAISS.delete падает на неизвестных id, поэтому берём только реально лежащие в индексе.
+        known_ids = set(vectorstore.index_to_docstore_id.values())
+        stale_ids = [chunk_id for chunk_id in stale_ids if chunk_id in known_ids]
+    if stale_ids:
+        print(f'Удаление устаревших чанков: {len(stale_ids)}')
+        vectorstore.delete(stale_ids)
+
+    if added_chunks and EMBED_CACHE_MAX_BYTES:
+        stats = get_embedding_cache().stats()
+        print(f"Кэш эмбеддингов: попаданий {stats['hits']}, промахов {stats['misses']} ({stats['hit_rate']:.0%})")
+
+    added_files = len(changed) - len(ingest.failed)
+    summary = {
+        'added_files': added_files,
+        'removed_files': len(removed),
+        'failed_files': len(ingest.failed),
+        'unchanged_files': len(files) - added_files - kept_on_failure,
+        'added_chunks': added_chunks,
+        'removed_chunks': len(stale_ids),
+        'index_dir': str(index_dir),
+        'ingest': ingest.as_dict()
+    }
+
+    if vectorstore is None and rebuild and ingest.failed:
+        # Прежний индекс сохраняется только при инкрементальном обновлении; запрошенная
+        # полная пересборка, в которой не разобрался ни один файл, — это ошибка.
+        raise IndexBuildError(
+            f'Полная пересборка не удалась: ни один из {len(ingest.failed)} файлов не разобран, '
+            f'прежний индекс не изменён'
+        )
+    if vectorstore is None:
+        print('Нет документов для индексации, индекс не изменён')
+        return summary
+
+    new_manifest = {
+        'version': MANIFEST_VERSION,
+        'embed_model': embed_model,
+        'files': files
+    }
+    if stale_ids or added_chunks:
+        write_index(vectorstore, new_manifest, index_dir)
+    else:
+        # Векторы не менялись, обновились только mtime в манифесте.
+        save_manifest(index_dir, new_manifest)
     print(f'Индекс сохранён в {index_dir}')
-    return vectorstore
+    return summary
+
+
+def build_faiss_index(data_folder: str | Path = None, index_dir: str | Path = None, embed_model: str = None):
+    """Полная пересборка индекса: все документы заново разбиваются и эмбеддятся."""
+    return update_faiss_index(data_folder, index_dir, embed_model, rebuild=True)
 
 
 if __name__ == '__main__':
-    build_faiss_index()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Обновление FAISS-индекса архивариуса')
+    parser.add_argument('--data-folder', default=None)
+    parser.add_argument('--full', action='store_true', help='Пересобрать индекс целиком')
+    args = parser.parse_args()
+    summary = update_faiss_index(data_folder=args.data_folder, rebuild=args.full)
+    for report in summary['ingest']['files']:
+        if report['status'] == 'failed':
+            print(f"Не удалось разобрать {report['path']}: {report['error']}")
+    print(f"Разбор: {summary['ingest']['parse_seconds']}s CPU в воркерах, {summary['ingest']['wall_seconds']}s всего")
@@ -0,0 +1,109 @@
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from langchain.schema import Document
+from loaders import load_document
+from splitter import split_documents
+from config import INGEST_WORKERS
+
+# Пул создаётся из потока фоновой задачи в многопоточном сервере; fork в такой
+# момент копирует чужие захваченные блокировки (импорт, sqlite-кэш, потоки /query)
+# и может повесить дочерний процесс, поэтому воркеры запускаются через spawn.
+MP_CONTEXT = multiprocessing.get_context('spawn')
+
+
+@dataclass
+class FileReport:
+    path: str
+    status: str
+    chunks: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class IngestSummary:
+    files: List[FileReport] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+    seconds: float = 0.0
+
+    @property
+    def failed(self) -> List[FileReport]:
+        return [report for report in self.files if report.status == 'failed']
+
+    def as_dict(self) -> dict:
+        return {
+            'files_total': len(self.files),
+            'files_failed': len(self.failed),
+            'chunks': sum(report.chunks for report in self.files),
+            'parse_seconds': round(sum(report.seconds for report in self.files), 3),
+            'wall_seconds': round(self.seconds, 3),
+            'files': [asdict(report) for report in self.files]
+        }
+
+
+def parse_and_split(path: str) -> Tuple[List[Document], FileReport]:
+    """
+    Единица работы пайплайна: разбор одного файла и нарезка его на чанки.
+    Выполняется в дочернем процессе; ошибка не пробрасывается, а попадает в отчёт.
+    """
+    started = time.perf_counter()
+    try:
+        chunks = split_documents(load_document(path))
+    except Exception as e:
+        return [], FileReport(path, 'failed', seconds=round(time.perf_counter() - started, 3), error=f'{type(e).__name__}: {e}')
+    return chunks, FileReport(path, 'ok', chunks=len(chunks), seconds=round(time.perf_counter() - started, 3))
+
+
+def iter_ingested(
+    paths: List[str | Path],
+    summary: IngestSummary,
+    workers: int = INGEST_WORKERS
+) -> Iterator[Tuple[str, List[Document], FileReport]]:
+    """
+    Разбирает файлы в пуле процессов и отдаёт (путь, чанки, отчёт) по мере готовности,
+    не дожидаясь остальных. В работе держится не больше 2×workers файлов, чтобы
+    чанки не копились в памяти, пока потребитель считает эмбеддинги.
+    """
+    paths = [str(path) for path in paths]
+    try:
+        if workers <= 1 or len(paths) <= 1:
+            for path in paths:
+                chunks, report = parse_and_split(path)
+                summary.files.append(report)
+                yield path, chunks, report
+            return
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths)), mp_context=MP_CONTEXT) as executor:
+            pending = deque(paths)
+            in_flight = {}
+            while pending or in_flight:
+                while pending and len(in_flight) < workers * 2:
+                    path = pending.popleft()
+                    try:
+                        in_flight[executor.submit(parse_and_split, path)] = path
+                    except BrokenProcessPool as e:
+                        report = FileReport(path, 'failed', error=f'{type(e).__name__}: {e}')
+                        summary.files.append(report)
+                        yield path, [], report
+                if not in_flight:
+                    continue
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = in_flight.pop(future)
+                    try:
+                        chunks, report = future.result()
+                    except Exception as e:
+                        # Упавший воркер (например, сегфолт в парсере PDF) ломает весь пул,
+                        # оставшиеся файлы тоже попадут в отчёт как ошибки.
+                        chunks, report = [], FileReport(path, 'failed', error=f'{type(e).__name__}: {e}')
+                    summary.files.append(report)
+                    yield path, chunks, report
+    finally:
+        summary.seconds = time.perf_counter() - summary.started
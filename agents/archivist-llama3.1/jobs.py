@@ -0,0 +1,140 @@
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from indexer import update_faiss_index
+from config import INDEX_DIR, INDEX_JOBS_HISTORY
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+@dataclass
+class IndexJob:
+    id: str
+    data_folder: str
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    files_total: Optional[int] = None
+    files_parsed: int = 0
+    chunks_embedded: int = 0
+    summary: Optional[dict] = None
+    error: Optional[str] = None
+    reload_error: Optional[str] = None
+
+    def eta_seconds(self) -> Optional[float]:
+        # Оценка по темпу разбора файлов: эмбеддинги идут следом за разбором.
+        if self.status != RUNNING or not self.files_total or not self.files_parsed:
+            return None
+        elapsed = time.time() - self.started_at
+        return round(elapsed / self.files_parsed * (self.files_total - self.files_parsed), 1)
+
+    def as_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'data_folder': self.data_folder,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'progress': {
+                'files_total': self.files_total,
+                'files_parsed': self.files_parsed,
+                'chunks_embedded': self.chunks_embedded,
+                'eta_seconds': self.eta_seconds()
+            },
+            'summary': self.summary,
+            'error': self.error,
+            'reload_error': self.reload_error
+        }
+
+
+class IndexJobQueue:
+    """
+    Очередь индексаций в отдельном потоке, чтобы сборка индекса не блокировала event loop.
+    Задачи выполняются по одной. Запрос на папку, для которой уже есть задача
+    в очереди, получает её id: ещё не начатая индексация и так увидит все файлы.
+    Если по папке идёт индексация, ставится одна новая задача — файлы, добавленные
+    после начала обхода, попадут в неё.
+    """
+
+    def __init__(self, on_complete: Optional[Callable[[IndexJob], None]] = None, history: int = INDEX_JOBS_HISTORY):
+        self.on_complete = on_complete
+        self.history = history
+        self._jobs: 'OrderedDict[str, IndexJob]' = OrderedDict()
+        self._queued_by_folder = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='index-job')
+
+    def submit(self, data_folder: str | Path) -> IndexJob:
+        folder = str(Path(data_folder).resolve())
+        with self._lock:
+            queued = self._queued_by_folder.get(folder)
+            if queued is not None:
+                return queued
+            job = IndexJob(id=uuid.uuid4().hex, data_folder=folder)
+            self._jobs[job.id] = job
+            self._queued_by_folder[folder] = job
+            self._trim()
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[IndexJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _trim(self):
+        # Храним ограниченную историю; незавершённые задачи не вытесняются.
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in (DONE, FAILED)]
+        for job_id in finished[:max(len(self._jobs) - self.history, 0)]:
+            del self._jobs[job_id]
+
+    def _progress(self, job: IndexJob, **progress):
+        with self._lock:
+            for name, value in progress.items():
+                setattr(job, name, value)
+
+    def _run(self, job: IndexJob):
+        with self._lock:
+            self._queued_by_folder.pop(job.data_folder, None)
+            job.status = RUNNING
+            job.started_at = time.time()
+        try:
+            summary = update_faiss_index(
+                data_folder=job.data_folder,
+                index_dir=INDEX_DIR,
+                on_progress=lambda **progress: self._progress(job, **progress)
+            )
+        except Exception as e:
+            traceback.print_exc()
+            with self._lock:
+                job.status = FAILED
+                job.error = str(e)
+                job.finished_at = time.time()
+            return
+        with self._lock:
+            job.summary = summary
+            job.status = DONE
+            job.finished_at = time.time()
+
+        # Индекс уже записан и подменён; сбой перезагрузки агента не делает задачу проваленной.
+        if self.on_complete is not None:
+            try:
+                self.on_complete(job)
+            except Exception as e:
+                traceback.print_exc()
+                with self._lock:
+                    job.reload_error = str(e)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
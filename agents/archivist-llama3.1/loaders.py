@@ -4,33 +4,31 @@ from langchain.schema import Document
 
 from langchain.document_loaders import PyPDFLoader, TextLoader, UnstructuredWordDocumentLoader
 
+SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.doc', '.txt', '.md'}
 
-def load_documents_from_folder(folder: str | Path) -> List[Document]:
+
+def iter_document_paths(folder: str | Path) -> List[Path]:
     """
-    Рекурсивно обходит папку и загружает PDF/DOCX/TXT в список Document.
-    Возвращает список langchain.schema.Document с метаданными (source, page и т.д.).
+    Рекурсивно собирает пути к поддерживаемым файлам в папке.
     """
     folder = Path(folder)
-    docs = []
-    for f in folder.rglob('*'):
-        if f.suffix.lower() == '.pdf':
-            try:
-                loader = PyPDFLoader(str(f))
-                docs.extend(loader.load())
-            except Exception as e:
-                print(f'Ошибка при загрузке PDF {f}: {e}')
-        elif f.suffix.lower() in ('.docx', '.doc'):
-            try:
-                loader = UnstructuredWordDocumentLoader(str(f))
-                docs.extend(loader.load())
-            except Exception as e:
-                print(f'Ошибка при загрузке DOCX {f}: {e}')
-        elif f.suffix.lower() in ('.txt', '.md'):
-            try:
-                loader = TextLoader(str(f), encoding='utf-8')
-                docs.extend(loader.load())
-            except Exception as e:
-                print(f'Ошибка при загрузке TXT {f}: {e}')
-        else:
-            continue
-    return docs
\ No newline at end of file
+    return sorted(f for f in folder.rglob('*') if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS)
+
+
+def load_document(f: str | Path) -> List[Document]:
+    """
+    Загружает один PDF/DOCX/TXT файл в список Document.
+    При ошибке разбора пробрасывает исключение — решение о пропуске принимает вызывающий код.
+    """
+    f = Path(f)
+    suffix = f.suffix.lower()
+    if suffix == '.pdf':
+        loader = PyPDFLoader(str(f))
+    elif suffix in ('.docx', '.doc'):
+        loader = UnstructuredWordDocumentLoader(str(f))
+    elif suffix in ('.txt', '.md'):
+        loader = TextLoader(str(f), encoding='utf-8')
+    else:
+        return []
+    return loader.load()
+
@@ -1,3 +1,4 @@
+from pathlib import Path
 from langchain.chains import RetrievalQA
 from langchain_ollama import OllamaLLM
 from langchain.vectorstores import FAISS
@@ -38,7 +39,10 @@ class QAAgent:
     def _load_vectorstore(self):
         """Загружает/перезагружает векторное хранилище"""
         emb = get_ollama_embeddings()
-        self.vectorstore = FAISS.load_local(str(self.index_dir), emb, allow_dangerous_deserialization=True)
+        # index_dir — симлинк на текущую версию индекса; разрешаем его один раз,
+        # чтобы index.faiss и index.pkl точно читались из одной версии.
+        index_dir = Path(self.index_dir).resolve()
+        self.vectorstore = FAISS.load_local(str(index_dir), emb, allow_dangerous_deserialization=True)
     
     def _create_qa_chain(self):
         # Основной промпт, который видит модель
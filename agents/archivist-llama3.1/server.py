@@ -1,4 +1,5 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from pathlib import Path
 import uvicorn
@@ -8,14 +9,26 @@ from typing import List
 import io
 import zipfile
 
-from indexer import build_faiss_index
+from jobs import IndexJobQueue
 from qa_agent import QAAgent
-from config import INDEX_DIR, DATA_DIR, ALLOWED_EXTENSIONS
+from embeddings import get_embedding_cache
+from config import INDEX_DIR, DATA_DIR, ALLOWED_EXTENSIONS, EMBED_CACHE_MAX_BYTES
 
 app = FastAPI(title='ИИ-архивариус API')
 
 _agent = None
 
+
+def _reload_agent(job):
+    # Новый агент собирается в потоке задачи и подменяет старый одной ссылкой:
+    # запросы, начатые до этого, дорабатывают на прежнем индексе.
+    global _agent
+    if _agent is not None:
+        _agent = QAAgent()
+
+
+_jobs = IndexJobQueue(on_complete=_reload_agent)
+
 class IndexRequest(BaseModel):
     data_folder: str
 
@@ -25,31 +38,33 @@ class QueryRequest(BaseModel):
 class DownloadAllRequest(BaseModel):
     source_paths: List[str]
 
-@app.post('/index')
+@app.post('/index', status_code=202)
 async def index(req: IndexRequest):
-    global _agent
     folder = Path(req.data_folder)
     if not folder.exists():
         raise HTTPException(status_code=400, detail='Папка не найдена')
-    try:
-        build_faiss_index(data_folder=folder, index_dir=INDEX_DIR)
-        if _agent is not None:
-            _agent.reload_index()
-        return {'status': 'ok', 'index_dir': str(INDEX_DIR)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    job = _jobs.submit(folder)
+    return {'status': 'accepted', 'index_dir': str(INDEX_DIR), 'job': job.as_dict()}
+
+
+@app.get('/jobs/{job_id}')
+async def get_job(job_id: str):
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail='Задача не найдена')
+    return job.as_dict()
 
 @app.post('/query')
 async def query(req: QueryRequest):
     global _agent
     if _agent is None:
         try:
-            _agent = QAAgent()
+            _agent = await run_in_threadpool(QAAgent)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f'Не удалось загрузить агент: {e}')
 
     try:
-        res = _agent.ask(req.query)
+        res = await run_in_threadpool(_agent.ask, req.query)
         return {
             'query': req.query,
             'answer': res['answer'],
@@ -99,28 +114,16 @@ async def add_files(files: list[UploadFile] = File(...)):
                 'path': str(file_path)
             })
         
-        try:
-            build_faiss_index(data_folder=data_dir, index_dir=INDEX_DIR)
-            
-            global _agent
-            if _agent is not None:
-                _agent.load_actual_index()
-                
-        except Exception as e:
-            return {
-                "status": "warning",
-                "message": f"Файлы загружены, но ошибка при обновлении индекса: {str(e)}",
-                "uploaded_files": uploaded_files,
-                "skipped_files": skipped_files
-            }
-        
+        job = _jobs.submit(data_dir) if uploaded_files else None
+
         return {
             "status": "success",
-            "message": f"Успешно загружено {len(uploaded_files)} файлов и обновлен индекс",
+            "message": f"Успешно загружено {len(uploaded_files)} файлов, индекс обновляется в фоне",
             "uploaded_files": uploaded_files,
             "skipped_files": skipped_files,
             "total_uploaded": len(uploaded_files),
-            "total_skipped": len(skipped_files)
+            "total_skipped": len(skipped_files),
+            "job_id": job.id if job is not None else None
         }
             
     except Exception as e:
@@ -177,10 +180,22 @@ async def download_all_files(req: DownloadAllRequest):
     )
 
 
+@app.get('/embed_cache')
+async def embed_cache_stats():
+    if not EMBED_CACHE_MAX_BYTES:
+        return {'enabled': False}
+    return {'enabled': True, **get_embedding_cache().stats()}
+
+
 @app.get('/health')
 async def health():
     return {'status': 'ok'}
 
 
+@app.on_event('shutdown')
+def shutdown_jobs():
+    _jobs.shutdown()
+
+
 if __name__ == '__main__':
     uvicorn.run('server:app', reload=True)
\ No newline at end of file
@@ -12,7 +12,6 @@ const AddAgentStep2: React.FC = () => {
   const [version, setVersion] = useState('1.0.0');
   const [changelog, setChangelog] = useState('');
   const [status, setStatus] = useState<'stable' | 'latest' | 'published'>('stable');
-  const [projectPath, setProjectPath] = useState('');
   const [archiveFile, setArchiveFile] = useState<File | null>(null); // ← новое поле
 
   const [loading, setLoading] = useState(false);
@@ -70,11 +69,6 @@ const AddAgentStep2: React.FC = () => {
       formData.append('version', version.trim());
       if (changelog.trim()) formData.append('changelog', changelog.trim());
       formData.append('status', status);
-      // Если загружен архив — project_path игнорируется (сервер сам запишет путь)
-      // Но если архива нет — отправляем project_path как fallback
-      if (!archiveFile && projectPath.trim()) {
-        formData.append('project_path', projectPath.trim());
-      }
       if (archiveFile) {
         formData.append('archive', archiveFile);
       }
@@ -211,26 +205,6 @@ const AddAgentStep2: React.FC = () => {
               </p>
             </div>
 
-            {/* Ссылка на проект (опционально, отключается при наличии архива) */}
-            <div className="mb-6">
-              <label className="block text-sm font-medium mb-1">
-                Ссылка на репозиторий (если не загружаете архив)
-              </label>
-              <input
-                type="url"
-                className={`form-input w-full ${archiveFile ? 'bg-gray-100 cursor-not-allowed' : ''}`}
-                value={projectPath}
-                onChange={(e) => setProjectPath(e.target.value)}
-                placeholder="https://github.com/user/repo"
-                disabled={!!archiveFile}
-              />
-              {archiveFile && (
-                <p className="text-xs text-gray-500 mt-1">
-                  Поле недоступно — архив будет сохранён на сервере.
-                </p>
-              )}
-            </div>
-
             <div className="flex gap-4 mt-4">
               <button
                 type="button"
@@ -4,7 +4,7 @@ import { useState, useEffect } from "react";
 import Link from "next/link";
 import { useRouter } from 'next/router';
 import { formatDate } from '@/utils/date';
-import { MediaItem } from '@/types/index';
+import { MediaItem, Page } from '@/types/index';
 import MediaCarousel from '@/components/MediaCarousel';
 import Footer from "@/components/Footer";
 import Header from "@/components/Header";
@@ -136,9 +136,9 @@ export default function AgentDetailsPage() {
           console.warn("Не удалось получить комментарии:", commentsResponse.statusText);
           setComments([]);
         } else {
-          const commentsData: Comment[] = await commentsResponse.json();
+          const commentsData: Page<Comment> = await commentsResponse.json();
           console.log(commentsData);
-          setComments(commentsData);
+          setComments(commentsData.items);
 
         }
 
@@ -146,8 +146,8 @@ export default function AgentDetailsPage() {
           headers: { Authorization: `Bearer ${token}` }
         });
         if (discussionsResponse.ok) {
-          const discussionsData: ContentRead[] = await discussionsResponse.json();
-          setDiscussions(discussionsData);
+          const discussionsData: Page<ContentRead> = await discussionsResponse.json();
+          setDiscussions(discussionsData.items);
         } else {
           console.warn("Не удалось получить обсуждения:", discussionsResponse.statusText);
           setDiscussions([]);
@@ -4,6 +4,7 @@ import { useRouter } from 'next/router';
 import { useAuth } from '@/context/AuthContext';
 import { formatDate } from '@/utils/date';
 import Header from '@/components/Header';
+import { Page } from '@/types';
 
 interface Article {
   id: string;
@@ -71,8 +72,8 @@ const ArticlePage: React.FC = () => {
         });
 
         if (commentsResponse.ok) {
-          const commentsData: Comment[] = await commentsResponse.json();
-          setComments(commentsData);
+          const commentsData: Page<Comment> = await commentsResponse.json();
+          setComments(commentsData.items);
         } else {
           console.warn("Не удалось получить комментарии:", commentsResponse.statusText);
           setComments([]);
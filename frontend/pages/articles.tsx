@@ -4,6 +4,7 @@ import { useAuth } from '@/context/AuthContext';
 import { formatDate } from '@/utils/date';
 import Header from '@/components/Header';
 import Footer from '@/components/Footer';
+import { Page } from '@/types';
 
 interface ContentBase {
   content_type_id: number;
@@ -53,7 +54,8 @@ const ArticlesPage = () => {
           throw new Error(errorData.detail || "Ошибка при получении статей");
         }
 
-        const data: ContentRead[] = await response.json();
+        const page: Page<ContentRead> = await response.json();
+        const data: ContentRead[] = page.items;
 
         const placeholders: ContentRead[] = [
          {
@@ -6,6 +6,7 @@ import { useRouter } from 'next/navigation';
 import { useAuth } from '@/context/AuthContext';
 import Header from '@/components/Header';
 import { formatDate } from '@/utils/date';
+import { Page } from '@/types';
 
 interface Comment {
   id: number;
@@ -72,7 +73,8 @@ const DiscussionPage: React.FC = () => {
         });
         // console.log(commentsRes.json())
         if (!commentsRes.ok) throw new Error(`HTTP ${commentsRes.status}`);
-        const rawComments: any[] = await commentsRes.json();
+        const commentsPage: Page<any> = await commentsRes.json();
+        const rawComments: any[] = commentsPage.items;
 
         const formattedComments = rawComments.map((c, idx) => ({
           id: c.id || idx + 1,
@@ -29,9 +29,9 @@ const DiscussionsListPage: React.FC = () => {
           headers: token ? { 'Authorization': `Bearer ${token}` } : {}
         });
         if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
-        const data = await response.json();
+        const page = await response.json();
         
-        const formattedData = data.map((item: any) => ({
+        const formattedData = page.items.map((item: any) => ({
           id: item.id,
           title: item.title || "Без заголовка",
           excerpt: item.content 
@@ -5,6 +5,7 @@ import Link from 'next/link';
 import { useRouter } from 'next/navigation';
 import Header from '@/components/Header';
 import Footer from '@/components/Footer';
+import { Page } from '@/types';
 
 
 // Типы данных согласно твоему API (см. ProjectsTab)
@@ -45,8 +46,8 @@ const HomePage: React.FC = () => {
           throw new Error(`HTTP ${response.status}: ${response.statusText}`);
         }
 
-        const data: Agent[] = await response.json();
-        setAgents(data);
+        const data: Page<Agent> = await response.json();
+        setAgents(data.items);
       } catch (err: any) {
         console.error('Ошибка загрузки агентов:', err);
         setError(err.message || 'Не удалось загрузить агентов');
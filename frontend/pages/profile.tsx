@@ -7,6 +7,7 @@ import ProjectsTab from '@/components/ProjectsTab';
 import SettingsTab from '@/components/SettingsTab';
 import Footer from '@/components/Footer';
 import Header from '@/components/Header';
+import { Page } from '@/types';
 
 interface Agent {
   id: string;
@@ -49,8 +50,8 @@ export default function ProfilePage() {
           throw new Error(`Ошибка: ${response.status} ${response.statusText}`);
         }
 
-        const agents: Agent[] = await response.json();
-        setProjects(agents);
+        const page: Page<Agent> = await response.json();
+        setProjects(page.items);
 
       } catch (err) {
         console.error("Не удалось получить проекты:", err);
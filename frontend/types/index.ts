@@ -47,4 +47,8 @@ export interface MediaItem {
   type: "image" | "video";
   src: string;
   alt?: string;
-}
\ No newline at end of file
+}
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
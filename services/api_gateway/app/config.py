@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 class Settings(BaseSettings):
     USER_SERVICE_URL: str
@@ -8,6 +9,23 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_CLIENT_TIMEOUT: float = 10.0
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 5.0
+    HTTP_CLIENT_HTTP2: bool = False
+    MEDIA_UPLOAD_TIMEOUT: float = 300.0
+
+    AGGREGATION_CALL_TIMEOUT: float = 3.0
+
+    REDIS_URL: Optional[str] = None
+    REDIS_PASSWORD: Optional[str] = None
+    RESPONSE_CACHE_TTL: int = 30
+    RESPONSE_CACHE_STALE_TTL: int = 120
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,103 @@
+import httpx
+from typing import Dict, Any
+from app.config import get_settings
+
+settings = get_settings()
+
+USER_SERVICE = "user"
+CATALOG_SERVICE = "catalog"
+COMMUNITY_SERVICE = "community"
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _service_urls() -> Dict[str, str]:
+    return {
+        USER_SERVICE: settings.USER_SERVICE_URL,
+        CATALOG_SERVICE: settings.CATALOG_SERVICE_URL,
+        COMMUNITY_SERVICE: settings.COMMUNITY_SERVICE_URL,
+    }
+
+
+def _build_client(name: str, base_url: str) -> httpx.AsyncClient:
+    stats = _stats.setdefault(name, {"requests": 0, "responses": 0, "errors_5xx": 0})
+
+    async def on_request(request: httpx.Request):
+        stats["requests"] += 1
+
+    async def on_response(response: httpx.Response):
+        stats["responses"] += 1
+        if response.status_code >= 500:
+            stats["errors_5xx"] += 1
+
+    return httpx.AsyncClient(
+        base_url=base_url,
+        http2=settings.HTTP_CLIENT_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.HTTP_CLIENT_TIMEOUT,
+            connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT,
+        ),
+        event_hooks={"request": [on_request], "response": [on_response]},
+    )
+
+
+def get_client(name: str) -> httpx.AsyncClient:
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        client = _build_client(name, _service_urls()[name])
+        _clients[name] = client
+    return client
+
+
+def get_user_client() -> httpx.AsyncClient:
+    return get_client(USER_SERVICE)
+
+
+def get_catalog_client() -> httpx.AsyncClient:
+    return get_client(CATALOG_SERVICE)
+
+
+def get_community_client() -> httpx.AsyncClient:
+    return get_client(COMMUNITY_SERVICE)
+
+
+async def start_http_clients():
+    for name in _service_urls():
+        get_client(name)
+
+
+async def close_http_clients():
+    for client in _clients.values():
+        await client.aclose()
+    _clients.clear()
+
+
+def _pool_snapshot(client: httpx.AsyncClient) -> Dict[str, int]:
+    pool = getattr(client._transport, "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    idle = sum(1 for conn in connections if conn.is_idle())
+    http2 = sum(1 for conn in connections if "HTTP/2" in repr(conn))
+    return {
+        "connections": len(connections),
+        "idle": idle,
+        "active": len(connections) - idle,
+        "http2": http2,
+    }
+
+
+def get_http_client_metrics() -> Dict[str, Any]:
+    metrics = {}
+    for name, client in _clients.items():
+        metrics[name] = {
+            "base_url": str(client.base_url),
+            "closed": client.is_closed,
+            "pool": _pool_snapshot(client),
+            **_stats.get(name, {}),
+        }
+    return metrics
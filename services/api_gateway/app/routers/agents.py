@@ -1,22 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, File, UploadFile, Form
-from typing import List, Optional
-from app.utils.auth import get_current_user, get_token_from_header
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Dict, List, Optional
+from app.utils.auth import get_current_user, get_token_from_header, get_optional_token_from_header
+from app.utils.cache import catalog_cache
 from app.services.catalog_service import (
     create_agent_in_catalog,
     upload_media_to_catalog,
+    request_media_upload_url_from_catalog,
+    complete_media_upload_in_catalog,
     get_agent_media_from_catalog,
     get_signed_media_from_catalog,
+    get_signed_media_batch_from_catalog,
     get_agents_by_user_id_from_catalog_service,
     update_agent_in_catalog_service,
     delete_agent_in_catalog_service,
     get_agents_with_developers_from_catalog_service,
     get_user_agents_from_catalog_service,
-    get_agent_by_id_from_catalog_service
+    get_agent_by_id_from_catalog_service,
+    get_developer_by_user_id_from_user_service,
+    search_agents_in_catalog_service
 )
 from app.services.community_service import get_discussions_by_agent_id_from_community_service
+from app.services.version_service import get_versions_by_agent_id_from_catalog_service
+from app.services.aggregation import gather_partial
 from app.services.user_service import verify_user_exists
-from app.schemas.agent import AgentCreate, AgentRead, AgentUpdate, AgentReadFull
+from app.schemas.agent import AgentCreate, AgentRead, AgentUpdate, AgentReadFull, AgentPage, AgentSearchResult
 from app.schemas.content import ContentRead
+from app.schemas.pagination import Page
+from app.schemas.media import MediaSize, MediaUploadUrlRequest, MediaUploadComplete, UploadUrlResponse
 
 router = APIRouter()
 
@@ -30,28 +41,83 @@ async def create_agent(
     
     try:
         created_agent = await create_agent_in_catalog(agent_data, token)
+        catalog_cache.invalidate_local()
         return created_agent
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-@router.post("/{agent_id}/media", response_model=dict)
+MEDIA_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                        "is_primary": {"type": "boolean", "default": False}
+                    }
+                }
+            }
+        }
+    }
+}
+
+@router.post("/{agent_id}/media", response_model=dict, openapi_extra=MEDIA_UPLOAD_OPENAPI)
 async def upload_agent_media(
     agent_id: str,
-    file: UploadFile = File(...),
-    is_primary: bool = Form(False),
+    request: Request,
     token: str = Depends(get_token_from_header)
 ):
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="Expected multipart/form-data")
+
     try:
         media_response = await upload_media_to_catalog(
             agent_id=agent_id,
-            file=file,
-            is_primary=is_primary,
+            body=request.stream(),
+            content_type=content_type,
+            content_length=request.headers.get("content-length"),
             token=token
         )
         return media_response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
+@router.post("/{agent_id}/media/upload-url", response_model=UploadUrlResponse)
+async def create_media_upload_url(
+    agent_id: str,
+    upload: MediaUploadUrlRequest,
+    token: str = Depends(get_token_from_header)
+):
+    try:
+        return await request_media_upload_url_from_catalog(agent_id, upload.model_dump(), token)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/{agent_id}/media/complete", response_model=dict)
+async def complete_media_upload(
+    agent_id: str,
+    completion: MediaUploadComplete,
+    token: str = Depends(get_token_from_header)
+):
+    try:
+        return await complete_media_upload_in_catalog(agent_id, completion.model_dump(), token)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/media/signed", response_model=Dict[str, list])
+async def get_signed_media_urls_batch(
+    agent_ids: List[str] = Query(..., description="Agent ids, repeated or comma-separated"),
+    size: MediaSize = Query("original", description="Smallest variant to return: thumbnail, medium or original")
+):
+    try:
+        return await get_signed_media_batch_from_catalog(agent_ids, size)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/{agent_id}/media", response_model=list)
 async def get_agent_media(
     agent_id: str,
@@ -66,50 +132,72 @@ async def get_agent_media(
 @router.get("/{agent_id}/media/signed")
 async def get_signed_media_urls(
     agent_id: str,
+    size: MediaSize = Query("original", description="Smallest variant to return: thumbnail, medium or original"),
     token: str = Depends(get_token_from_header)
 ):
     try:
-        media_list = await get_signed_media_from_catalog(agent_id, token)
+        media_list = await get_signed_media_from_catalog(agent_id, token, size)
         return media_list
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/", response_model=List[AgentReadFull])
+@router.get("/", response_model=Page[AgentReadFull])
 async def get_agents_list(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
-    limit: int = Query(100, le=1000, description="Max number of records to return"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's next_cursor"),
+    limit: int = Query(100, ge=1, le=1000, description="Max number of records to return"),
     category_id: Optional[str] = Query(None, description="Filter by category ID"),
     min_rating: Optional[float] = Query(None, ge=0.0, le=5.0, description="Minimum average rating"),
     max_price: Optional[float] = Query(None, gt=0, description="Maximum price"),
     search: Optional[str] = Query(None, description="Search in name or description"),
-    token: Optional[str] = Depends(get_token_from_header)  # ← может быть None, если эндпоинт публичный
+    token: Optional[str] = Depends(get_optional_token_from_header)
 ):
+    params = {
+        "cursor": cursor,
+        "limit": limit,
+        "category_id": category_id,
+        "min_rating": min_rating,
+        "max_price": max_price,
+        "search": search
+    }
     try:
-        agents = await get_agents_with_developers_from_catalog_service(
-            skip=skip,
-            limit=limit,
-            category_id=category_id,
-            min_rating=min_rating,
-            max_price=max_price,
-            search=search,
-            token=token
+        agents = await catalog_cache.get_or_fetch(
+            "agents",
+            params,
+            lambda: get_agents_with_developers_from_catalog_service(**params, token=token)
         )
         return agents
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-@router.get("/my", response_model=List[AgentRead])
+@router.get("/search", response_model=List[AgentSearchResult])
+async def search_agents(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms, matched as word prefixes"),
+    limit: int = Query(20, ge=1, le=100),
+    category_id: Optional[str] = Query(None, description="Filter by category ID")
+):
+    params = {"q": q, "limit": limit, "category_id": category_id}
+    try:
+        results = await catalog_cache.get_or_fetch(
+            "agents_search",
+            params,
+            lambda: search_agents_in_catalog_service(**params)
+        )
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+@router.get("/my", response_model=Page[AgentRead])
 async def get_my_agents(
     current_user: dict = Depends(get_current_user),
     token: str = Depends(get_token_from_header),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, le=1000)
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000)
 ):
     try:
         agents = await get_user_agents_from_catalog_service(
             user_id=str(current_user["user_id"]),
             token=token,
-            skip=skip,
+            cursor=cursor,
             limit=limit
         )
         return agents
@@ -139,14 +227,56 @@ async def get_agent_details(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
     
-@router.get("/{agent_id}/discussions", response_model=list[ContentRead])
+@router.get("/{agent_id}/page", response_model=AgentPage)
+async def get_agent_page(
+    agent_id: str,
+    current_user: dict = Depends(get_current_user),
+    token: str = Depends(get_token_from_header)
+):
+    agent_task = asyncio.create_task(get_agent_by_id_from_catalog_service(agent_id, token))
+
+    async def get_agent():
+        return await asyncio.shield(agent_task)
+
+    async def get_developer():
+        agent = await asyncio.shield(agent_task)
+        return await get_developer_by_user_id_from_user_service(agent["user_id"], token)
+
+    try:
+        results, errors = await gather_partial({
+            "agent": get_agent(),
+            "media": get_signed_media_from_catalog(agent_id, token),
+            "versions": get_versions_by_agent_id_from_catalog_service(agent_id, token),
+            "developer": get_developer(),
+            "discussions": get_discussions_by_agent_id_from_community_service(agent_id, token)
+        })
+    finally:
+        if not agent_task.done():
+            agent_task.cancel()
+
+    if "agent" in errors:
+        status_code = 404 if errors["agent"].endswith("Agent not found") else 500
+        raise HTTPException(status_code=status_code, detail=errors["agent"])
+
+    return AgentPage(
+        agent=results["agent"],
+        media=results["media"] or [],
+        versions=results["versions"] or {"items": []},
+        developer=results["developer"],
+        discussions=results["discussions"] or {"items": []},
+        errors=errors
+    )
+
+@router.get("/{agent_id}/discussions", response_model=Page[ContentRead])
 async def get_agent_discussions(
     agent_id: str,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's next_cursor"),
+    limit: int = Query(100, ge=1, le=1000),
     current_user: dict = Depends(get_current_user),
     token: str = Depends(get_token_from_header)
 ):
     try:
-        discussions = await get_discussions_by_agent_id_from_community_service(agent_id, token)
+        discussions = await get_discussions_by_agent_id_from_community_service(agent_id, token, cursor, limit)
         return discussions
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -160,6 +290,7 @@ async def update_my_agent(
 ):
     try:
         updated_agent = await update_agent_in_catalog_service(agent_id, agent_update.model_dump(mode='json'), token)
+        catalog_cache.invalidate_local()
         return updated_agent
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -172,6 +303,7 @@ async def delete_my_agent(
 ):
     try:
         result = await delete_agent_in_catalog_service(agent_id, token)
+        catalog_cache.invalidate_local()
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException, status, Depends
-import httpx
-from app.config import get_settings
+from app.http_client import get_user_client
 from app.schemas.auth import LoginRequest, ForgotPasswordRequest, ResetPasswordRequest
 from app.services.auth_service import (
     forgot_password_in_user_service,
@@ -8,21 +7,20 @@ from app.services.auth_service import (
 )
 # from app.utils.auth import create_access_token
 
-settings = get_settings()
 router = APIRouter()
 
 @router.post("/login")
 async def login_gateway(request: LoginRequest):
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{settings.USER_SERVICE_URL}/auth/login",
-            json={"email": request.email, "password": request.password}
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    client = get_user_client()
+    response = await client.post(
+        "/auth/login",
+        json={"email": request.email, "password": request.password}
+    )
+    if response.status_code != 200:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-        tokens = response.json()
-        return tokens
+    tokens = response.json()
+    return tokens
     
 @router.post("/forgot-password", status_code=status.HTTP_204_NO_CONTENT)
 async def forgot_password_request(
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+from app.services.catalog_service import get_categories_from_catalog_service
+from app.schemas.category import CategoryRead
+from app.schemas.pagination import Page
+from app.utils.cache import catalog_cache
+
+router = APIRouter()
+
+@router.get("/", response_model=Page[CategoryRead])
+async def get_categories(
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    try:
+        categories = await catalog_cache.get_or_fetch(
+            "categories",
+            {"cursor": cursor, "limit": limit},
+            lambda: get_categories_from_catalog_service(cursor=cursor, limit=limit)
+        )
+        return categories
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
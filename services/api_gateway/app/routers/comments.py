@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from app.utils.auth import get_current_user, get_token_from_header
 from app.schemas.comment import CommentCreate, CommentUpdate, CommentRead
+from app.schemas.pagination import Page
 from app.services.comment_service import (
     create_comment_in_catalog_service,
     get_comments_by_agent_id_from_catalog_service,
@@ -27,14 +28,16 @@ async def add_comment_to_agent(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{agent_id}/get_comments", response_model=list[CommentRead])
+@router.get("/{agent_id}/get_comments", response_model=Page[CommentRead])
 async def get_comments_for_agent(
     agent_id: str,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
     current_user: dict = Depends(get_current_user),
     token: str = Depends(get_token_from_header)
 ):
     try:
-        comments = await get_comments_by_agent_id_from_catalog_service(agent_id, token)
+        comments = await get_comments_by_agent_id_from_catalog_service(agent_id, token, cursor, limit)
         return comments
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from app.utils.auth import get_current_user, get_token_from_header
 from app.schemas.content import ContentCreate, ContentUpdate, ContentRead
 from app.schemas.community_comment import CommentCreate, CommentUpdate, CommentRead
+from app.schemas.pagination import Page
 from app.services.community_service import (
     create_content_in_community_service,
     get_content_by_id_from_community_service,
@@ -42,17 +43,17 @@ async def get_content(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/", response_model=list[ContentRead])
+@router.get("/", response_model=Page[ContentRead])
 async def get_contents(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
     content_type_id: int | None = None,
     user_id: str | None = None,
     current_user: dict = Depends(get_current_user),
     token: str = Depends(get_token_from_header)
 ):
     try:
-        contents = await get_contents_from_community_service(skip, limit, content_type_id, user_id, token)
+        contents = await get_contents_from_community_service(cursor, limit, content_type_id, user_id, token)
         return contents
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -97,14 +98,16 @@ async def add_comment_to_content(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{content_id}/comments", response_model=list[CommentRead])
+@router.get("/{content_id}/comments", response_model=Page[CommentRead])
 async def get_comments_for_content(
     content_id: str,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
     #current_user: dict = Depends(get_current_user),
     token: str = Depends(get_token_from_header)
 ):
     try:
-        comments = await get_comments_by_content_id_from_community_service(content_id, token)
+        comments = await get_comments_by_content_id_from_community_service(content_id, token, cursor, limit)
         return comments
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
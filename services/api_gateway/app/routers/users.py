@@ -12,6 +12,7 @@ from app.services.user_service import (
 from app.services.developer_service import (
     get_developer_profile_from_user_service
 )
+from app.services.aggregation import gather_partial
 from app.schemas.user import UserWithDeveloper, UserUpdate
 
 router = APIRouter()
@@ -31,21 +32,17 @@ async def get_my_profile(
     current_user: dict = Depends(get_current_user),
     token: str = Depends(get_token_from_header)
 ):
-    try:
-        user_profile = await get_user_profile_from_user_service(token)
-        developer_profile = None
-        try:
-            dev = await get_developer_profile_from_user_service(token)
-            developer_profile = dev
-        except Exception:
-            developer_profile = None
+    results, errors = await gather_partial({
+        "user": get_user_profile_from_user_service(token),
+        "developer": get_developer_profile_from_user_service(token)
+    })
+    if "user" in errors:
+        raise HTTPException(status_code=500, detail=errors["user"])
 
-        return UserWithDeveloper(
-            **user_profile,
-            developer=developer_profile
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return UserWithDeveloper(
+        **results["user"],
+        developer=results["developer"]
+    )
     # user_data = await get_user_profile(current_user["user_id"])
     # return user_data
 
@@ -1,12 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import Dict, List, Optional
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
 from app.utils.auth import get_current_user, get_token_from_header
-from app.schemas.version import VersionCreate, VersionUpdate, VersionRead
+from app.schemas.version import VersionCreate, VersionUpdate, VersionRead, ArchiveUploadUrlRequest, ArchiveUploadComplete
+from app.schemas.media import UploadUrlResponse
+from app.schemas.pagination import Page
 from app.services.version_service import (
     create_version_in_catalog_service,
     get_versions_by_agent_id_from_catalog_service,
     get_version_by_id_from_catalog_service,
     update_version_in_catalog_service,
-    delete_version_in_catalog_service
+    delete_version_in_catalog_service,
+    request_archive_upload_url_from_catalog_service,
+    complete_archive_upload_in_catalog_service,
+    stream_archive_to_catalog_service,
+    open_archive_download_from_catalog_service,
+    get_latest_versions_from_catalog_service
 )
 
 router = APIRouter()
@@ -27,18 +37,88 @@ async def add_version_to_agent(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{agent_id}/versions", response_model=list[VersionRead])
+@router.post("/{agent_id}/versions/archive/upload-url", response_model=UploadUrlResponse)
+async def create_archive_upload_url(
+    agent_id: str,
+    upload: ArchiveUploadUrlRequest,
+    current_user: dict = Depends(get_current_user),
+    token: str = Depends(get_token_from_header)
+):
+    try:
+        return await request_archive_upload_url_from_catalog_service(agent_id, upload.model_dump(), token)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+ARCHIVE_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/octet-stream": {"schema": {"type": "string", "format": "binary"}}
+        }
+    }
+}
+
+@router.put("/{agent_id}/versions/archive", response_model=VersionRead, openapi_extra=ARCHIVE_UPLOAD_OPENAPI)
+async def stream_version_archive(
+    agent_id: str,
+    request: Request,
+    version: str = Query(...),
+    status: str = Query(...),
+    changelog: Optional[str] = Query(None),
+    filename: Optional[str] = Query(None),
+    token: str = Depends(get_token_from_header)
+):
+    params = {"version": version, "status": status, "changelog": changelog, "filename": filename}
+    try:
+        return await stream_archive_to_catalog_service(
+            agent_id=agent_id,
+            body=request.stream(),
+            params={key: value for key, value in params.items() if value is not None},
+            content_type=request.headers.get("content-type"),
+            content_length=request.headers.get("content-length"),
+            token=token
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/{agent_id}/versions/archive/complete", response_model=VersionRead)
+async def complete_archive_upload(
+    agent_id: str,
+    completion: ArchiveUploadComplete,
+    current_user: dict = Depends(get_current_user),
+    token: str = Depends(get_token_from_header)
+):
+    try:
+        return await complete_archive_upload_in_catalog_service(agent_id, completion.model_dump(), token)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{agent_id}/versions", response_model=Page[VersionRead])
 async def get_versions_for_agent(
     agent_id: str,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's next_cursor"),
+    limit: int = Query(100, ge=1, le=1000),
     current_user: dict = Depends(get_current_user),
     token: str = Depends(get_token_from_header)
 ):
     try:
-        versions = await get_versions_by_agent_id_from_catalog_service(agent_id, token)
+        versions = await get_versions_by_agent_id_from_catalog_service(agent_id, token, cursor, limit)
         return versions
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/versions/latest", response_model=Dict[str, Optional[VersionRead]])
+async def get_latest_versions(
+    agent_ids: List[str] = Query(..., description="Agent ids, repeated or comma-separated"),
+    stable: bool = Query(False, description="Return each agent's newest stable version instead"),
+    current_user: dict = Depends(get_current_user),
+    token: str = Depends(get_token_from_header)
+):
+    try:
+        return await get_latest_versions_from_catalog_service(agent_ids, stable, token)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/versions/{version_id}", response_model=VersionRead)
 async def get_version(
     version_id: str,
@@ -51,6 +131,32 @@ async def get_version(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+ARCHIVE_RESPONSE_HEADERS = (
+    "accept-ranges",
+    "cache-control",
+    "content-disposition",
+    "content-length",
+    "content-range",
+    "content-type",
+    "etag",
+)
+
+@router.api_route("/versions/{version_id}/archive", methods=["GET", "HEAD"])
+async def download_version_archive(version_id: str, request: Request):
+    try:
+        upstream = await open_archive_download_from_catalog_service(version_id, request.method, dict(request.headers))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # Status (200/206/304/404/416) and caching headers pass through untouched.
+    headers = {key: value for key, value in upstream.headers.items() if key.lower() in ARCHIVE_RESPONSE_HEADERS}
+    return StreamingResponse(
+        upstream.aiter_raw(),
+        status_code=upstream.status_code,
+        headers=headers,
+        background=BackgroundTask(upstream.aclose)
+    )
+
 @router.put("/versions/{version_id}", response_model=VersionRead)
 async def update_version(
     version_id: str,
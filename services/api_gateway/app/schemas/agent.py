@@ -1,8 +1,11 @@
 from pydantic import BaseModel
 from uuid import UUID
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List
 from datetime import datetime
 from .user import DeveloperOut
+from .version import VersionRead
+from .content import ContentRead
+from .pagination import Page
 
 class AgentBase(BaseModel):
     name: str
@@ -14,8 +17,6 @@ class AgentBase(BaseModel):
     category_id: Optional[UUID] = None
     article_id: Optional[UUID] = None
     price: Optional[float] = None
-    avg_raiting: Optional[float] = None
-    reviews_count: Optional[int] = None
     
 class AgentCreate(AgentBase):
     pass
@@ -31,17 +32,37 @@ class AgentRead(AgentBase):
     user_id: UUID
     created_at: datetime
     updated_at: datetime
+    # Maintained by the catalog from comments; read-only.
+    avg_raiting: Optional[float] = None
+    reviews_count: Optional[int] = None
+    latest_version_id: Optional[UUID] = None
+    stable_version_id: Optional[UUID] = None
 
     class Config:
         from_attributes = True
         
+class AgentSearchResult(AgentRead):
+    rank: float
+    name_highlight: Optional[str] = None
+    description_highlight: Optional[str] = None
+
 class AgentReadFull(AgentBase):
     id: UUID
     user_id: UUID
     created_at: datetime
     updated_at: datetime
+    avg_raiting: Optional[float] = None
+    reviews_count: Optional[int] = None
 
     developer: Optional[DeveloperOut] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class AgentPage(BaseModel):
+    agent: AgentReadFull
+    media: List[dict] = []
+    versions: Page[VersionRead] = Page[VersionRead](items=[])
+    developer: Optional[DeveloperOut] = None
+    discussions: Page[ContentRead] = Page[ContentRead](items=[])
+    errors: Dict[str, str] = {}
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from uuid import UUID
+from typing import Optional
+
+class CategoryRead(BaseModel):
+    id: UUID
+    name: str
+    slug: str
+    description: Optional[str] = None
+    icon: Optional[str] = None
+
+    class Config:
+        from_attributes = True
\ No newline at end of file
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Dict, Literal
+
+MediaSize = Literal["thumbnail", "medium", "original"]
+
+class MediaUploadUrlRequest(BaseModel):
+    content_type: str
+    size: int = Field(..., gt=0)
+
+class UploadUrlResponse(BaseModel):
+    upload_url: str
+    object_name: str
+    expires_at: datetime
+    headers: Dict[str, str] = {}
+
+class MediaUploadComplete(BaseModel):
+    object_name: str
+    is_primary: bool = False
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
@@ -8,7 +8,6 @@ class VersionBase(BaseModel):
     version: str
     changelog: Optional[str] = None
     status: str
-    project_path: Optional[str] = None
 
 class VersionCreate(VersionBase):
     pass
@@ -17,11 +16,24 @@ class VersionUpdate(BaseModel):
     version: Optional[str] = None
     changelog: Optional[str] = None
     status: Optional[str] = None
-    project_path: Optional[str] = None
+
+class ArchiveUploadUrlRequest(BaseModel):
+    filename: str
+    size: int = Field(..., gt=0)
+    content_type: Optional[str] = None
+
+class ArchiveUploadComplete(BaseModel):
+    object_name: str
+    version: str
+    changelog: Optional[str] = None
+    status: str
 
 class VersionRead(VersionBase):
     id: UUID
     created_at: datetime
+    project_path: Optional[str] = None
+    archive_sha256: Optional[str] = None
+    archive_size: Optional[int] = None
 
     class Config:
         from_attributes = True
\ No newline at end of file
@@ -0,0 +1,36 @@
+import asyncio
+from typing import Any, Awaitable, Dict, Optional, Tuple
+from app.config import get_settings
+
+settings = get_settings()
+
+async def _run_call(name: str, call: Awaitable, timeout: float) -> Tuple[str, Any, Optional[str]]:
+    try:
+        return name, await asyncio.wait_for(call, timeout), None
+    except asyncio.TimeoutError:
+        return name, None, f"Timed out after {timeout}s"
+    except Exception as e:
+        return name, None, str(e)
+
+async def gather_partial(
+    calls: Dict[str, Awaitable],
+    timeouts: Optional[Dict[str, float]] = None,
+    default_timeout: Optional[float] = None
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    timeouts = timeouts or {}
+    default_timeout = default_timeout or settings.AGGREGATION_CALL_TIMEOUT
+
+    outcomes = await asyncio.gather(*(
+        _run_call(name, call, timeouts.get(name, default_timeout))
+        for name, call in calls.items()
+    ))
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for name, value, error in outcomes:
+        if error is None:
+            results[name] = value
+        else:
+            results[name] = None
+            errors[name] = error
+    return results, errors
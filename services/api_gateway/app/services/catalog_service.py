@@ -1,20 +1,24 @@
+import asyncio
 import httpx
-from fastapi import UploadFile
 from app.config import get_settings
-from typing import Dict, Any, Optional, List
+from app.http_client import get_catalog_client, get_user_client
+from app.utils.pagination import page_from_response
+from typing import AsyncIterator, Dict, Any, Optional, List
 
 settings = get_settings()
 
+DEVELOPER_BATCH_SIZE = 200
+
 async def create_agent_in_catalog(agent_data: dict, token: str) -> Dict[Any, Any]:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.CATALOG_SERVICE_URL}/agents/",
-                json=agent_data,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.post(
+            "/agents/",
+            json=agent_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
@@ -22,56 +26,100 @@ async def create_agent_in_catalog(agent_data: dict, token: str) -> Dict[Any, Any
     
 async def upload_media_to_catalog(
     agent_id: str,
-    file: UploadFile,
-    is_primary: bool,
+    body: AsyncIterator[bytes],
+    content_type: str,
+    content_length: Optional[str],
     token: str
 ) -> Dict[Any, Any]:
+    # The client's multipart body is relayed chunk by chunk; the gateway never parses or buffers it.
     try:
-        file_content = await file.read()
-        
-        async with httpx.AsyncClient() as client:
-            files = {"file": (file.filename, file_content, file.content_type)}
-            data = {"is_primary": str(is_primary).lower()}
+        client = get_catalog_client()
+        headers = {"Authorization": f"Bearer {token}", "Content-Type": content_type}
+        if content_length:
+            headers["Content-Length"] = content_length
 
-            response = await client.post(
-                f"{settings.CATALOG_SERVICE_URL}/agents/{agent_id}/media/",
-                files=files,
-                data=data,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await client.post(
+            f"/agents/{agent_id}/media/",
+            content=body,
+            headers=headers,
+            timeout=httpx.Timeout(settings.MEDIA_UPLOAD_TIMEOUT, connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT)
+        )
+        response.raise_for_status()
+        return response.json()
 
     except httpx.HTTPStatusError as e:
         raise Exception(f"Catalog Service media upload error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
         raise Exception(f"Catalog Service media connection error: {str(e)}")
-    finally:
-        await file.close()
         
 async def get_agent_media_from_catalog(agent_id: str, token: str) -> list:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/agents/{agent_id}/media",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.get(
+            f"/agents/{agent_id}/media",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+    
+async def request_media_upload_url_from_catalog(agent_id: str, upload: dict, token: str) -> dict:
+    try:
+        client = get_catalog_client()
+        response = await client.post(
+            f"/agents/{agent_id}/media/upload-url",
+            json=upload,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+
+async def complete_media_upload_in_catalog(agent_id: str, completion: dict, token: str) -> dict:
+    try:
+        client = get_catalog_client()
+        response = await client.post(
+            f"/agents/{agent_id}/media/complete",
+            json=completion,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+    
+async def get_signed_media_from_catalog(agent_id: str, token: str, size: str = "original") -> list:
+    try:
+        client = get_catalog_client()
+        response = await client.get(
+            f"/agents/{agent_id}/media/signed",
+            params={"size": size},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
         raise Exception(f"Catalog Service connection error: {str(e)}")
     
-async def get_signed_media_from_catalog(agent_id: str, token: str) -> list:
+async def get_signed_media_batch_from_catalog(agent_ids: List[str], size: str = "original") -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/agents/{agent_id}/media/signed",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.get(
+            "/agents/media/signed",
+            params={"agent_ids": agent_ids, "size": size}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
@@ -80,59 +128,78 @@ async def get_signed_media_from_catalog(agent_id: str, token: str) -> list:
 async def get_user_agents_from_catalog_service(
     user_id: str,
     token: str,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100
-) -> List[dict]:
+) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/agents/my",
-                params={
-                    "user_id": user_id,
-                    "skip": skip,
-                    "limit": limit
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        params = {"user_id": user_id, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/agents/my",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return page_from_response(response)
     except httpx.HTTPStatusError as e:
         raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
         raise Exception(f"Catalog Service connection error: {str(e)}")
     
 async def get_agents_from_catalog_service(
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     category_id: Optional[str] = None,
     min_rating: Optional[float] = None,
     max_price: Optional[float] = None,
     search: Optional[str] = None,
     token: Optional[str] = None
-) -> List[dict]:
+) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            params = {"skip": skip, "limit": limit}
-            if category_id:
-                params["category_id"] = category_id
-            if min_rating is not None:
-                params["min_rating"] = min_rating
-            if max_price is not None:
-                params["max_price"] = max_price
-            if search:
-                params["search"] = search
+        client = get_catalog_client()
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        if category_id:
+            params["category_id"] = category_id
+        if min_rating is not None:
+            params["min_rating"] = min_rating
+        if max_price is not None:
+            params["max_price"] = max_price
+        if search:
+            params["search"] = search
 
-            headers = {}
-            if token:
-                headers["Authorization"] = f"Bearer {token}"
+        headers = {}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
 
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/agents/",
-                params=params,
-                headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await client.get(
+            "/agents/",
+            params=params,
+            headers=headers
+        )
+        response.raise_for_status()
+        return page_from_response(response)
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+    
+async def search_agents_in_catalog_service(
+    q: str,
+    limit: int = 20,
+    category_id: Optional[str] = None
+) -> List[dict]:
+    try:
+        client = get_catalog_client()
+        params = {"q": q, "limit": limit}
+        if category_id:
+            params["category_id"] = category_id
+        response = await client.get("/agents/search", params=params)
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
@@ -140,15 +207,15 @@ async def get_agents_from_catalog_service(
     
 async def get_developer_by_user_id_from_user_service(user_id: str, token: str) -> Optional[dict]:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.USER_SERVICE_URL}/developers/{user_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.get(
+            f"/developers/{user_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return None
@@ -156,42 +223,89 @@ async def get_developer_by_user_id_from_user_service(user_id: str, token: str) -
     except Exception as e:
         raise Exception(f"User Service connection error: {str(e)}")
     
+async def get_developers_by_user_ids_from_user_service(user_ids: List[str], token: Optional[str] = None) -> Dict[str, dict]:
+    if not user_ids:
+        return {}
+
+    headers = {}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    async def fetch_batch(batch: List[str]) -> Dict[str, dict]:
+        client = get_user_client()
+        response = await client.get(
+            "/developers/batch",
+            params={"user_ids": ",".join(batch)},
+            headers=headers
+        )
+        response.raise_for_status()
+        return response.json()
+
+    batches = [
+        user_ids[i:i + DEVELOPER_BATCH_SIZE]
+        for i in range(0, len(user_ids), DEVELOPER_BATCH_SIZE)
+    ]
+    try:
+        results = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"User Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"User Service connection error: {str(e)}")
+
+    developers = {}
+    for result in results:
+        developers.update(result)
+    return developers
+
 async def get_agents_with_developers_from_catalog_service(
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
     category_id: Optional[str] = None,
     min_rating: Optional[float] = None,
     max_price: Optional[float] = None,
     search: Optional[str] = None,
     token: Optional[str] = None
-) -> List[dict]:
-    agents = await get_agents_from_catalog_service(skip, limit, category_id, min_rating, max_price, search, token)
+) -> dict:
+    page = await get_agents_from_catalog_service(cursor, limit, category_id, min_rating, max_price, search, token)
+    agents = page["items"]
+
+    user_ids = list(dict.fromkeys(str(agent["user_id"]) for agent in agents))
+    try:
+        developers = await get_developers_by_user_ids_from_user_service(user_ids, token)
+    except Exception:
+        developers = {}
 
-    enhanced_agents = []
     for agent in agents:
-        user_id = agent["user_id"]
-        developer = None
-        try:
-            dev = await get_developer_by_user_id_from_user_service(user_id, token)
-            if dev:
-                developer = dev
-        except Exception:
-            developer = None
+        agent["developer"] = developers.get(str(agent["user_id"]))
 
-        agent["developer"] = developer
-        enhanced_agents.append(agent)
+    return page
 
-    return enhanced_agents
+async def get_categories_from_catalog_service(cursor: Optional[str] = None, limit: int = 100) -> dict:
+    try:
+        client = get_catalog_client()
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/categories/",
+            params=params
+        )
+        response.raise_for_status()
+        return page_from_response(response)
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
 
 async def get_agents_by_user_id_from_catalog_service(user_id: str) -> list[dict]:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/agents/user",
-                params={"user_id": user_id}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.get(
+            "/agents/user",
+            params={"user_id": user_id}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return []
@@ -201,14 +315,14 @@ async def get_agents_by_user_id_from_catalog_service(user_id: str) -> list[dict]
 
 async def update_agent_in_catalog_service(agent_id: str, agent_update: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{settings.CATALOG_SERVICE_URL}/agents/{agent_id}",
-                json=agent_update,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.patch(
+            f"/agents/{agent_id}",
+            json=agent_update,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Agent not found")
@@ -220,13 +334,13 @@ async def update_agent_in_catalog_service(agent_id: str, agent_update: dict, tok
 
 async def delete_agent_in_catalog_service(agent_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{settings.CATALOG_SERVICE_URL}/agents/{agent_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.delete(
+            f"/agents/{agent_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Agent not found")
@@ -238,13 +352,13 @@ async def delete_agent_in_catalog_service(agent_id: str, token: str) -> dict:
     
 async def get_agent_by_id_from_catalog_service(agent_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/agents/{agent_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.get(
+            f"/agents/{agent_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Agent not found")
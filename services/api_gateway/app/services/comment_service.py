@@ -1,18 +1,17 @@
 import httpx
-from app.config import get_settings
-
-settings = get_settings()
+from app.http_client import get_catalog_client
+from app.utils.pagination import page_from_response
 
 async def create_comment_in_catalog_service(comment_data: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.CATALOG_SERVICE_URL}/comments/",
-                json=comment_data,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.post(
+            "/comments/",
+            json=comment_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Agent not found")
@@ -20,16 +19,19 @@ async def create_comment_in_catalog_service(comment_data: dict, token: str) -> d
     except Exception as e:
         raise Exception(f"Catalog Service connection error: {str(e)}")
 
-async def get_comments_by_agent_id_from_catalog_service(agent_id: str, token: str) -> list[dict]:
+async def get_comments_by_agent_id_from_catalog_service(agent_id: str, token: str, cursor: str | None = None, limit: int = 100) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/comments/",
-                params={"agent_id": agent_id},
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        params = {"agent_id": agent_id, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/comments/",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return page_from_response(response)
     except httpx.HTTPStatusError as e:
         raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
@@ -38,14 +40,14 @@ async def get_comments_by_agent_id_from_catalog_service(agent_id: str, token: st
 
 async def update_comment_in_catalog_service(comment_id: str, comment_update: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{settings.CATALOG_SERVICE_URL}/comments/{comment_id}",
-                json=comment_update,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.patch(
+            f"/comments/{comment_id}",
+            json=comment_update,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Comment not found")
@@ -57,13 +59,13 @@ async def update_comment_in_catalog_service(comment_id: str, comment_update: dic
 
 async def delete_comment_in_catalog_service(comment_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{settings.CATALOG_SERVICE_URL}/comments/{comment_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.delete(
+            f"/comments/{comment_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Comment not found")
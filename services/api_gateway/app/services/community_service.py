@@ -1,18 +1,17 @@
 import httpx
-from app.config import get_settings
-
-settings = get_settings()
+from app.http_client import get_community_client
+from app.utils.pagination import page_from_response
 
 async def create_content_in_community_service(content_data: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.COMMUNITY_SERVICE_URL}/contents/",
-                json=content_data,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        response = await client.post(
+            "/contents/",
+            json=content_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 400:
             raise Exception("Content type not found")
@@ -22,13 +21,13 @@ async def create_content_in_community_service(content_data: dict, token: str) ->
 
 async def get_content_by_id_from_community_service(content_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.COMMUNITY_SERVICE_URL}/contents/{content_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        response = await client.get(
+            f"/contents/{content_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Content not found")
@@ -36,40 +35,46 @@ async def get_content_by_id_from_community_service(content_id: str, token: str)
     except Exception as e:
         raise Exception(f"Community Service connection error: {str(e)}")
 
-async def get_contents_from_community_service(skip: int, limit: int, content_type_id: int | None, user_id: str | None, token: str) -> list[dict]:
+async def get_contents_from_community_service(cursor: str | None, limit: int, content_type_id: int | None, user_id: str | None, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            params = {"skip": skip, "limit": limit}
-            if content_type_id:
-                params["content_type_id"] = content_type_id
-            if user_id:
-                params["user_id"] = user_id
+        client = get_community_client()
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        if content_type_id:
+            params["content_type_id"] = content_type_id
+        if user_id:
+            params["user_id"] = user_id
 
-            response = await client.get(
-                f"{settings.COMMUNITY_SERVICE_URL}/contents/",
-                params=params,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await client.get(
+            "/contents/",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return page_from_response(response)
     except httpx.HTTPStatusError as e:
         raise Exception(f"Community Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
         raise Exception(f"Community Service connection error: {str(e)}")
     
-async def get_discussions_by_agent_id_from_community_service(agent_id: str, token: str) -> list[dict]:
+async def get_discussions_by_agent_id_from_community_service(agent_id: str, token: str, cursor: str | None = None, limit: int = 100) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.COMMUNITY_SERVICE_URL}/contents/",
-                params={
-                    "agent_id": agent_id,
-                    "content_type_name": "discussion"
-                },
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        params = {
+            "agent_id": agent_id,
+            "content_type_name": "discussion",
+            "limit": limit
+        }
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/contents/dis",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return page_from_response(response)
     except httpx.HTTPStatusError as e:
         raise Exception(f"Community Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
@@ -77,14 +82,14 @@ async def get_discussions_by_agent_id_from_community_service(agent_id: str, toke
 
 async def update_content_in_community_service(content_id: str, content_update: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{settings.COMMUNITY_SERVICE_URL}/contents/{content_id}",
-                json=content_update,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        response = await client.put(
+            f"/contents/{content_id}",
+            json=content_update,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Content not found")
@@ -96,13 +101,13 @@ async def update_content_in_community_service(content_id: str, content_update: d
 
 async def delete_content_in_community_service(content_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{settings.COMMUNITY_SERVICE_URL}/contents/{content_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        response = await client.delete(
+            f"/contents/{content_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Content not found")
@@ -112,14 +117,14 @@ async def delete_content_in_community_service(content_id: str, token: str) -> di
 
 async def create_comment_in_community_service(comment_data: dict, content_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.COMMUNITY_SERVICE_URL}/comments/?content_id={content_id}",
-                json=comment_data,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        response = await client.post(
+            f"/comments/?content_id={content_id}",
+            json=comment_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 400:
             raise Exception("Referenced content or parent comment not found")
@@ -127,16 +132,19 @@ async def create_comment_in_community_service(comment_data: dict, content_id: st
     except Exception as e:
         raise Exception(f"Community Service connection error: {str(e)}")
 
-async def get_comments_by_content_id_from_community_service(content_id: str, token: str) -> list[dict]:
+async def get_comments_by_content_id_from_community_service(content_id: str, token: str, cursor: str | None = None, limit: int = 100) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.COMMUNITY_SERVICE_URL}/comments/",
-                params={"content_id": content_id},
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        params = {"content_id": content_id, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/comments/",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return page_from_response(response)
     except httpx.HTTPStatusError as e:
         raise Exception(f"Community Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
@@ -144,14 +152,14 @@ async def get_comments_by_content_id_from_community_service(content_id: str, tok
 
 async def update_comment_in_community_service(comment_id: str, comment_update: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{settings.COMMUNITY_SERVICE_URL}/comments/{comment_id}",
-                json=comment_update,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        response = await client.put(
+            f"/comments/{comment_id}",
+            json=comment_update,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Comment not found")
@@ -163,13 +171,13 @@ async def update_comment_in_community_service(comment_id: str, comment_update: d
 
 async def delete_comment_in_community_service(comment_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{settings.COMMUNITY_SERVICE_URL}/comments/{comment_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_community_client()
+        response = await client.delete(
+            f"/comments/{comment_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Comment not found")
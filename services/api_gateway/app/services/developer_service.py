@@ -1,18 +1,16 @@
 import httpx
-from app.config import get_settings
-
-settings = get_settings()
+from app.http_client import get_user_client
 
 async def create_developer_profile_in_user_service(dev_data: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.USER_SERVICE_URL}/developers/",
-                json=dev_data,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.post(
+            "/developers/",
+            json=dev_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 400:
             raise Exception("Developer profile already exists")
@@ -22,13 +20,13 @@ async def create_developer_profile_in_user_service(dev_data: dict, token: str) -
 
 async def get_developer_profile_from_user_service(token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.USER_SERVICE_URL}/developers/me",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.get(
+            "/developers/me",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Developer profile not found")
@@ -38,14 +36,14 @@ async def get_developer_profile_from_user_service(token: str) -> dict:
 
 async def update_developer_profile_in_user_service(dev_update: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{settings.USER_SERVICE_URL}/developers/me",
-                json=dev_update,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.patch(
+            "/developers/me",
+            json=dev_update,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Developer profile not found")
@@ -55,13 +53,13 @@ async def update_developer_profile_in_user_service(dev_update: dict, token: str)
 
 async def delete_developer_profile_in_user_service(token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{settings.USER_SERVICE_URL}/developers/me",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.delete(
+            "/developers/me",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Developer profile not found")
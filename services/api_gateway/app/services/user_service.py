@@ -1,17 +1,18 @@
 import httpx
 from app.config import get_settings
+from app.http_client import get_user_client
 
 settings = get_settings()
 
 async def register_user_in_user_service(user_data: dict) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.USER_SERVICE_URL}/users/",
-                json=user_data
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.post(
+            "/users/",
+            json=user_data
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 400:
             raise ValueError(e.response.json().get("detail", "Bad Request"))
@@ -21,13 +22,13 @@ async def register_user_in_user_service(user_data: dict) -> dict:
 
 async def get_user_profile_from_user_service(token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.USER_SERVICE_URL}/users/me",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.get(
+            "/users/me",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("User not found")
@@ -37,12 +38,12 @@ async def get_user_profile_from_user_service(token: str) -> dict:
     
 async def get_other_profile_from_user_service(user_id: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.USER_SERVICE_URL}/users/{user_id}"
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.get(
+            f"/users/{user_id}"
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("User not found")
@@ -52,14 +53,14 @@ async def get_other_profile_from_user_service(user_id: str) -> dict:
     
 async def change_password_in_user_service(password_change_data: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.USER_SERVICE_URL}/users/change-password",
-                json=password_change_data,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.post(
+            "/users/change-password",
+            json=password_change_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 400:
             raise Exception("Old password is incorrect or new password is same as old")
@@ -87,15 +88,15 @@ async def change_password_in_user_service(password_change_data: dict, token: str
     
 async def get_users_nicknames_by_ids_from_user_service(user_ids: list[str], token: str) -> dict[str, str]:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.USER_SERVICE_URL}/users/nicknames",
-                json={"user_ids": user_ids},
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            data: dict[str, str] = response.json()
-            return data
+        client = get_user_client()
+        response = await client.post(
+            "/users/nicknames",
+            json={"user_ids": user_ids},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        data: dict[str, str] = response.json()
+        return data
     except httpx.HTTPStatusError as e:
         raise Exception(f"User Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
@@ -103,14 +104,14 @@ async def get_users_nicknames_by_ids_from_user_service(user_ids: list[str], toke
     
 async def update_user_profile_in_user_service(user_update: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{settings.USER_SERVICE_URL}/users/me",
-                json=user_update,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.patch(
+            "/users/me",
+            json=user_update,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("User not found")
@@ -120,13 +121,13 @@ async def update_user_profile_in_user_service(user_update: dict, token: str) ->
     
 async def delete_user_account_in_user_service(token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{settings.USER_SERVICE_URL}/users/me",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_user_client()
+        response = await client.delete(
+            "/users/me",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("User not found")
@@ -136,8 +137,8 @@ async def delete_user_account_in_user_service(token: str) -> dict:
     
 async def verify_user_exists(user_id: str) -> bool:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{settings.USER_SERVICE_URL}/users/{user_id}")
-            return response.status_code == 200
+        client = get_user_client()
+        response = await client.get(f"/users/{user_id}")
+        return response.status_code == 200
     except Exception:
         return False
\ No newline at end of file
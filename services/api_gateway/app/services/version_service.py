@@ -1,18 +1,21 @@
 import httpx
+from typing import AsyncIterator, List, Optional
 from app.config import get_settings
+from app.http_client import get_catalog_client
+from app.utils.pagination import page_from_response
 
 settings = get_settings()
 
 async def create_version_in_catalog_service(version_data: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{settings.CATALOG_SERVICE_URL}/versions/",
-                json=version_data,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.post(
+            "/versions/",
+            json=version_data,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Agent not found")
@@ -20,16 +23,117 @@ async def create_version_in_catalog_service(version_data: dict, token: str) -> d
     except Exception as e:
         raise Exception(f"Catalog Service connection error: {str(e)}")
 
-async def get_versions_by_agent_id_from_catalog_service(agent_id: str, token: str) -> list[dict]:
+async def request_archive_upload_url_from_catalog_service(agent_id: str, upload: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/versions/",
-                params={"agent_id": agent_id},
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.post(
+            f"/versions/{agent_id}/archive/upload-url",
+            json=upload,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+
+async def stream_archive_to_catalog_service(
+    agent_id: str,
+    body: AsyncIterator[bytes],
+    params: dict,
+    content_type: Optional[str],
+    content_length: Optional[str],
+    token: str
+) -> dict:
+    # Same relay as media uploads: the archive body is forwarded chunk by chunk, never buffered here.
+    try:
+        client = get_catalog_client()
+        headers = {"Authorization": f"Bearer {token}"}
+        if content_type:
+            headers["Content-Type"] = content_type
+        if content_length:
+            headers["Content-Length"] = content_length
+
+        response = await client.put(
+            f"/versions/{agent_id}/archive",
+            params=params,
+            content=body,
+            headers=headers,
+            timeout=httpx.Timeout(settings.MEDIA_UPLOAD_TIMEOUT, connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT)
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+
+ARCHIVE_REQUEST_HEADERS = ("range", "if-range", "if-none-match")
+
+async def open_archive_download_from_catalog_service(version_id: str, method: str, headers: dict) -> httpx.Response:
+    # Returns the catalog response unread; the caller streams it and must close it.
+    try:
+        client = get_catalog_client()
+        forwarded = {key: value for key, value in headers.items() if key.lower() in ARCHIVE_REQUEST_HEADERS}
+        request = client.build_request(
+            method,
+            f"/versions/{version_id}/archive",
+            headers=forwarded,
+            timeout=httpx.Timeout(settings.MEDIA_UPLOAD_TIMEOUT, connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT)
+        )
+        return await client.send(request, stream=True)
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+
+async def complete_archive_upload_in_catalog_service(agent_id: str, completion: dict, token: str) -> dict:
+    try:
+        client = get_catalog_client()
+        response = await client.post(
+            f"/versions/{agent_id}/archive/complete",
+            json=completion,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+
+async def get_versions_by_agent_id_from_catalog_service(
+    agent_id: str,
+    token: str,
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> dict:
+    try:
+        client = get_catalog_client()
+        params = {"agent_id": agent_id, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(
+            "/versions/",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return page_from_response(response)
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
+    except Exception as e:
+        raise Exception(f"Catalog Service connection error: {str(e)}")
+
+async def get_latest_versions_from_catalog_service(agent_ids: List[str], stable: bool, token: str) -> dict:
+    try:
+        client = get_catalog_client()
+        response = await client.get(
+            "/versions/latest",
+            params={"agent_ids": agent_ids, "stable": stable},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         raise Exception(f"Catalog Service error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
@@ -37,13 +141,13 @@ async def get_versions_by_agent_id_from_catalog_service(agent_id: str, token: st
 
 async def get_version_by_id_from_catalog_service(version_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.CATALOG_SERVICE_URL}/versions/{version_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.get(
+            f"/versions/{version_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Version not found")
@@ -53,14 +157,14 @@ async def get_version_by_id_from_catalog_service(version_id: str, token: str) ->
 
 async def update_version_in_catalog_service(version_id: str, version_update: dict, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{settings.CATALOG_SERVICE_URL}/versions/{version_id}",
-                json=version_update,
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.put(
+            f"/versions/{version_id}",
+            json=version_update,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Version not found")
@@ -72,13 +176,13 @@ async def update_version_in_catalog_service(version_id: str, version_update: dic
 
 async def delete_version_in_catalog_service(version_id: str, token: str) -> dict:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{settings.CATALOG_SERVICE_URL}/versions/{version_id}",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            response.raise_for_status()
-            return response.json()
+        client = get_catalog_client()
+        response = await client.delete(
+            f"/versions/{version_id}",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             raise Exception("Version not found")
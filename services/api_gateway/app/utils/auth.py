@@ -4,24 +4,38 @@ from jose import JWTError, jwt
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.config import get_settings
+from app.utils.token_cache import TokenClaimsCache
 
 settings = get_settings()
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+token_claims_cache = TokenClaimsCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
 
 def verify_token(token: str) -> Optional[dict]:
+    cached = token_claims_cache.get(token)
+    if cached is not None:
+        return dict(cached[0])
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
         role: str = payload.get("role")
         if user_id is None or role is None:
             return None
-        return {"user_id": user_id, "role": role}
+        claims = {"user_id": user_id, "role": role}
+        token_claims_cache.set(token, claims, payload.get("exp"))
+        return dict(claims)
     except JWTError:
         return None
     
 async def get_token_from_header(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
     return credentials.credentials
 
+async def get_optional_token_from_header(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> Optional[str]:
+    return credentials.credentials if credentials else None
+
 async def get_current_user(token: str = Depends(get_token_from_header)) -> dict:
     user_data = verify_token(token)
     if user_data is None:
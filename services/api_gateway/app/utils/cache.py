@@ -0,0 +1,173 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from app.config import get_settings
+from app.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+CATALOG_CACHE_GENERATION_KEY = "catalog:cache:generation"
+CATALOG_CACHE_INVALIDATE_CHANNEL = "catalog:cache:invalidate"
+
+# Opaque tokens must keep their exact bytes when folded into a cache key.
+CASE_SENSITIVE_PARAMS = {"cursor"}
+
+# value, fresh_until, stale_until
+CacheEntry = Tuple[Any, float, float]
+
+
+class ResponseCache:
+    def __init__(self, namespace: str, ttl: int, stale_ttl: int, max_entries: int):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.generation = 0
+        self._local: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def make_key(self, name: str, params: Dict[str, Any]) -> str:
+        normalized = {}
+        for key, value in params.items():
+            if value is None or value == "":
+                continue
+            if isinstance(value, str) and key not in CASE_SENSITIVE_PARAMS:
+                value = value.strip().lower()
+            elif isinstance(value, float):
+                value = round(value, 4)
+            normalized[key] = value
+        digest = hashlib.sha1(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+        return f"gateway:cache:{self.namespace}:{self.generation}:{name}:{digest}"
+
+    async def get_or_fetch(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        key = self.make_key(name, params)
+        now = time.time()
+
+        entry = self._local_get(key, now)
+        if entry is None:
+            entry = await self._redis_get(key, now)
+            if entry is not None:
+                self._local_set(key, entry)
+
+        if entry is not None:
+            value, fresh_until, _ = entry
+            if now >= fresh_until:
+                self._revalidate(key, fetch)
+            return value
+
+        return await asyncio.shield(self._fetch_once(key, fetch))
+
+    def invalidate_local(self, generation: Optional[int] = None):
+        if generation is not None:
+            self.generation = generation
+        self._local.clear()
+
+    def _local_get(self, key: str, now: float) -> Optional[CacheEntry]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        if now >= entry[2]:
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return entry
+
+    def _local_set(self, key: str, entry: CacheEntry):
+        self._local[key] = entry
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def _redis_get(self, key: str, now: float) -> Optional[CacheEntry]:
+        if redis_client is None:
+            return None
+        try:
+            cached_data = await redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed for {key}: {e}")
+            return None
+        if not cached_data:
+            return None
+        data = json.loads(cached_data)
+        if now >= data["stale_until"]:
+            return None
+        return data["value"], data["fresh_until"], data["stale_until"]
+
+    async def _redis_set(self, key: str, entry: CacheEntry):
+        if redis_client is None:
+            return
+        value, fresh_until, stale_until = entry
+        payload = json.dumps({"value": value, "fresh_until": fresh_until, "stale_until": stale_until})
+        try:
+            await redis_client.setex(key, self.ttl + self.stale_ttl, payload)
+        except Exception as e:
+            logger.warning(f"Response cache write failed for {key}: {e}")
+
+    def _fetch_once(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _fetch_and_store(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+        now = time.time()
+        entry = (value, now + self.ttl, now + self.ttl + self.stale_ttl)
+        self._local_set(key, entry)
+        await self._redis_set(key, entry)
+        return value
+
+    def _revalidate(self, key: str, fetch: Callable[[], Awaitable[Any]]):
+        if key in self._inflight:
+            return
+        task = self._fetch_once(key, fetch)
+        task.add_done_callback(self._log_refresh_error)
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background cache refresh failed: {task.exception()}")
+
+
+catalog_cache = ResponseCache(
+    namespace="catalog",
+    ttl=settings.RESPONSE_CACHE_TTL,
+    stale_ttl=settings.RESPONSE_CACHE_STALE_TTL,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES
+)
+
+
+async def listen_for_catalog_invalidation():
+    if redis_client is None:
+        return
+    while True:
+        try:
+            generation = await redis_client.get(CATALOG_CACHE_GENERATION_KEY)
+            catalog_cache.invalidate_local(int(generation or 0))
+            pubsub = redis_client.pubsub()
+            await pubsub.subscribe(CATALOG_CACHE_INVALIDATE_CHANNEL)
+            try:
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        catalog_cache.invalidate_local(int(message["data"]))
+            finally:
+                await pubsub.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Catalog cache invalidation listener error: {e}")
+            await asyncio.sleep(5)
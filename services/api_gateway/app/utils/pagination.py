@@ -0,0 +1,9 @@
+import httpx
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def page_from_response(response: httpx.Response) -> dict:
+    return {
+        "items": response.json(),
+        "next_cursor": response.headers.get(NEXT_CURSOR_HEADER)
+    }
@@ -0,0 +1,35 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+DEFAULT_TOKEN_TTL = 300
+
+
+def token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TokenClaimsCache:
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[dict, float]]" = OrderedDict()
+
+    def get(self, token: str) -> Optional[Tuple[dict, float]]:
+        key = token_hash(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry[1]:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, token: str, claims: dict, exp: Optional[float]):
+        expires_at = float(exp) if exp else time.time() + DEFAULT_TOKEN_TTL
+        key = token_hash(token)
+        self._entries[key] = (claims, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -1,6 +1,10 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import users, auth, agents, developers, comments, versions, community
+from app.routers import users, auth, agents, developers, comments, versions, community, categories
+from app.http_client import start_http_clients, close_http_clients, get_http_client_metrics
+from app.utils.cache import listen_for_catalog_invalidation
+from app.redis import redis_client
 
 app = FastAPI(title="API Gateway")
 
@@ -19,7 +23,27 @@ app.include_router(developers.router, prefix="/api/developers", tags=["Developer
 app.include_router(comments.router, prefix="/api/agents", tags=["Comments"])
 app.include_router(versions.router, prefix="/api/agents", tags=["Versions"])
 app.include_router(community.router, prefix="/api/contents", tags=["Community"])
+app.include_router(categories.router, prefix="/api/categories", tags=["Categories"])
+
+_background_tasks = []
+
+@app.on_event("startup")
+async def startup():
+    await start_http_clients()
+    _background_tasks.append(asyncio.create_task(listen_for_catalog_invalidation()))
+
+@app.on_event("shutdown")
+async def shutdown():
+    for task in _background_tasks:
+        task.cancel()
+    await close_http_clients()
+    if redis_client is not None:
+        await redis_client.close()
 
 @app.get("/")
 def root():
-    return {"message": "API Gateway"}
\ No newline at end of file
+    return {"message": "API Gateway"}
+
+@app.get("/metrics/http-clients")
+async def http_client_metrics():
+    return get_http_client_metrics()
\ No newline at end of file
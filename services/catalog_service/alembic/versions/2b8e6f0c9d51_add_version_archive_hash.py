@@ -0,0 +1,32 @@
+"""add version archive hash
+
+Revision ID: 2b8e6f0c9d51
+Revises: f1d9a3b6c428
+Create Date: 2026-01-30 14:03:51.772940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b8e6f0c9d51'
+down_revision: Union[str, Sequence[str], None] = 'f1d9a3b6c428'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('versions', sa.Column('archive_sha256', sa.String(length=64), nullable=True))
+    op.add_column('versions', sa.Column('archive_size', sa.BigInteger(), nullable=True))
+    op.create_index('ix_versions_archive_sha256', 'versions', ['archive_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_versions_archive_sha256', table_name='versions')
+    op.drop_column('versions', 'archive_size')
+    op.drop_column('versions', 'archive_sha256')
@@ -0,0 +1,56 @@
+"""add agent version pointers
+
+Revision ID: 4d6a1c8e2f97
+Revises: 2b8e6f0c9d51
+Create Date: 2026-02-02 09:41:27.318605
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d6a1c8e2f97'
+down_revision: Union[str, Sequence[str], None] = '2b8e6f0c9d51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (agent_id, created_at, id) from 5c1d7e2a9f40 already serves the newest-first
+    # lookups below; Postgres scans it backwards, so no separate DESC index is needed.
+    op.add_column('agents', sa.Column('latest_version_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('agents', sa.Column('stable_version_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key(
+        'fk_agents_latest_version_id', 'agents', 'versions',
+        ['latest_version_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_foreign_key(
+        'fk_agents_stable_version_id', 'agents', 'versions',
+        ['stable_version_id'], ['id'], ondelete='SET NULL'
+    )
+    op.execute("""
+        UPDATE agents SET
+            latest_version_id = (
+                SELECT v.id FROM versions v
+                WHERE v.agent_id = agents.id
+                ORDER BY v.created_at DESC, v.id DESC LIMIT 1
+            ),
+            stable_version_id = (
+                SELECT v.id FROM versions v
+                WHERE v.agent_id = agents.id AND v.status = 'stable'
+                ORDER BY v.created_at DESC, v.id DESC LIMIT 1
+            )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_agents_stable_version_id', 'agents', type_='foreignkey')
+    op.drop_constraint('fk_agents_latest_version_id', 'agents', type_='foreignkey')
+    op.drop_column('agents', 'stable_version_id')
+    op.drop_column('agents', 'latest_version_id')
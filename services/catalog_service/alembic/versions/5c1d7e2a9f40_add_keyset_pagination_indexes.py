@@ -0,0 +1,38 @@
+"""add keyset pagination indexes
+
+Revision ID: 5c1d7e2a9f40
+Revises: ab6411fb435e
+Create Date: 2026-01-12 10:14:37.218456
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1d7e2a9f40'
+down_revision: Union[str, Sequence[str], None] = 'ab6411fb435e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_agents_created_at_id', 'agents', ['created_at', 'id'], unique=False)
+    op.create_index('ix_agents_user_id_created_at_id', 'agents', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_versions_agent_id_created_at_id', 'versions', ['agent_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_comments_created_at_id', 'comments', ['created_at', 'id'], unique=False)
+    op.create_index('ix_comments_agent_id_created_at_id', 'comments', ['agent_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_categories_name_id', 'categories', ['name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_categories_name_id', table_name='categories')
+    op.drop_index('ix_comments_agent_id_created_at_id', table_name='comments')
+    op.drop_index('ix_comments_created_at_id', table_name='comments')
+    op.drop_index('ix_versions_agent_id_created_at_id', table_name='versions')
+    op.drop_index('ix_agents_user_id_created_at_id', table_name='agents')
+    op.drop_index('ix_agents_created_at_id', table_name='agents')
@@ -0,0 +1,52 @@
+"""add agent search vector
+
+Revision ID: 7a2f9c4e8b13
+Revises: 5c1d7e2a9f40
+Create Date: 2026-01-19 14:02:51.337910
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2f9c4e8b13'
+down_revision: Union[str, Sequence[str], None] = '5c1d7e2a9f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('simple', coalesce(tags, '[]'::jsonb), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(long_description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        'agents',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True)
+    )
+    op.create_index('ix_agents_search_vector', 'agents', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_agents_name_trgm', 'agents', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_agents_description_trgm', 'agents', ['description'], unique=False,
+        postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_agents_description_trgm', table_name='agents')
+    op.drop_index('ix_agents_name_trgm', table_name='agents')
+    op.drop_index('ix_agents_search_vector', table_name='agents')
+    op.drop_column('agents', 'search_vector')
@@ -0,0 +1,43 @@
+"""add agent rating sum
+
+Revision ID: 8e3b5d7f1a64
+Revises: 4d6a1c8e2f97
+Create Date: 2026-02-04 16:25:03.114872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3b5d7f1a64'
+down_revision: Union[str, Sequence[str], None] = '4d6a1c8e2f97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('agents', sa.Column('rating_sum', sa.BigInteger(), server_default='0', nullable=False))
+    # Totals are derived from comments from here on; the old reviews_count/avg_raiting were
+    # written by clients, so every agent is recomputed, including ones without comments.
+    op.execute("UPDATE agents SET reviews_count = 0, avg_raiting = NULL")
+    op.execute("""
+        UPDATE agents SET
+            rating_sum = totals.rating_sum,
+            reviews_count = totals.reviews_count,
+            avg_raiting = totals.rating_sum::float / totals.reviews_count
+        FROM (
+            SELECT agent_id, sum(rating) AS rating_sum, count(*) AS reviews_count
+            FROM comments
+            GROUP BY agent_id
+        ) AS totals
+        WHERE agents.id = totals.agent_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('agents', 'rating_sum')
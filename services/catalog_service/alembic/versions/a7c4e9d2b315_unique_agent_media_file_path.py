@@ -0,0 +1,33 @@
+"""unique agent media file path
+
+Revision ID: a7c4e9d2b315
+Revises: 8e3b5d7f1a64
+Create Date: 2026-02-06 11:42:17.508391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c4e9d2b315'
+down_revision: Union[str, Sequence[str], None] = '8e3b5d7f1a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Racing /complete calls may already have inserted duplicates; keep the oldest row per object.
+    op.execute(sa.text(
+        "DELETE FROM agent_media a USING agent_media b "
+        "WHERE a.file_path = b.file_path AND (a.created_at, a.id) > (b.created_at, b.id)"
+    ))
+    op.create_index('uq_agent_media_file_path', 'agent_media', ['file_path'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_agent_media_file_path', table_name='agent_media')
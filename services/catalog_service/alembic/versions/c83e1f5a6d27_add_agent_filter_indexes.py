@@ -0,0 +1,36 @@
+"""add agent filter indexes
+
+Revision ID: c83e1f5a6d27
+Revises: 7a2f9c4e8b13
+Create Date: 2026-01-26 11:47:09.561284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c83e1f5a6d27'
+down_revision: Union[str, Sequence[str], None] = '7a2f9c4e8b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # user_id and the versions/comments agent_id lookups are already led by the
+    # (..., created_at, id) keyset indexes from 5c1d7e2a9f40.
+    op.create_index('ix_agents_category_id_avg_raiting', 'agents', ['category_id', 'avg_raiting'], unique=False)
+    op.create_index('ix_agents_avg_raiting', 'agents', ['avg_raiting'], unique=False)
+    op.create_index('ix_agents_price', 'agents', ['price'], unique=False)
+    op.create_index('ix_agent_media_agent_id', 'agent_media', ['agent_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_agent_media_agent_id', table_name='agent_media')
+    op.drop_index('ix_agents_price', table_name='agents')
+    op.drop_index('ix_agents_avg_raiting', table_name='agents')
+    op.drop_index('ix_agents_category_id_avg_raiting', table_name='agents')
@@ -0,0 +1,30 @@
+"""add agent media derivatives
+
+Revision ID: f1d9a3b6c428
+Revises: c83e1f5a6d27
+Create Date: 2026-01-28 10:12:44.203517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d9a3b6c428'
+down_revision: Union[str, Sequence[str], None] = 'c83e1f5a6d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('agent_media', sa.Column('thumbnail_path', sa.Text(), nullable=True))
+    op.add_column('agent_media', sa.Column('medium_path', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('agent_media', 'medium_path')
+    op.drop_column('agent_media', 'thumbnail_path')
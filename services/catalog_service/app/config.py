@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 class Settings(BaseSettings):
     POSTGRES_DB: str
@@ -11,12 +12,46 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
     
     MINIO_ENDPOINT: str
     MINIO_ACCESS_KEY: str
     MINIO_SECRET_KEY: str
     MINIO_SECURE: bool = False
     MINIO_BUCKET_NAME: str = "agents-media"
+    MINIO_UPLOAD_PART_SIZE: int = 10 * 1024 * 1024
+    MINIO_PRESIGNED_UPLOAD_EXPIRY: int = 900
+    # Presigned uploads land here until /complete moves them; a bucket lifecycle
+    # rule expires whatever is never completed.
+    MINIO_PENDING_UPLOAD_PREFIX: str = "uploads/pending"
+    MINIO_PENDING_UPLOAD_EXPIRY_DAYS: int = 1
+    MINIO_REGION: Optional[str] = None
+    MINIO_EXECUTOR_WORKERS: int = 16
+    MINIO_CONNECT_TIMEOUT: float = 5.0
+    MINIO_READ_TIMEOUT: float = 60.0
+    MINIO_RETRY_ATTEMPTS: int = 3
+    MINIO_RETRY_BACKOFF: float = 0.2
+    MAX_ARCHIVE_SIZE: int = 500 * 1024 * 1024
+
+    MEDIA_THUMBNAIL_MAX_SIZE: int = 320
+    MEDIA_MEDIUM_MAX_SIZE: int = 1280
+    MEDIA_WEBP_QUALITY: int = 80
+    MEDIA_DERIVATIVE_CONCURRENCY: int = 2
+
+    SIGNED_URL_EXPIRY: int = 3600
+    SIGNED_URL_SAFETY_MARGIN: int = 300
+    SIGNED_URL_CACHE_MAX_ENTRIES: int = 10000
+
+    REDIS_URL: Optional[str] = None
+    REDIS_PASSWORD: Optional[str] = None
+
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
 
     class Config:
         env_file = ".env"
@@ -1,12 +1,32 @@
-from sqlalchemy import Column, Text, DateTime, Float, Integer, Numeric, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, Text, DateTime, Float, Integer, BigInteger, Numeric, ForeignKey, Index, Computed
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import uuid
 from app.core.base import Base
 
+# 'simple' keeps Russian and English descriptions searchable without a stemmer.
+SEARCH_CONFIG = 'simple'
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('simple', coalesce(tags, '[]'::jsonb), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(long_description, '')), 'C')"
+)
+
 class Agent(Base):
     __tablename__ = 'agents'
+    __table_args__ = (
+        Index('ix_agents_created_at_id', 'created_at', 'id'),
+        Index('ix_agents_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_agents_category_id_avg_raiting', 'category_id', 'avg_raiting'),
+        Index('ix_agents_avg_raiting', 'avg_raiting'),
+        Index('ix_agents_price', 'price'),
+        Index('ix_agents_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_agents_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_agents_description_trgm', 'description', postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     user_id = Column(UUID(as_uuid=True), nullable=False)
@@ -20,10 +40,24 @@ class Agent(Base):
     category_id = Column(UUID(as_uuid=True), ForeignKey('categories.id'), nullable=True)
     article_id = Column(UUID(as_uuid=True), nullable=True)
     price = Column(Numeric, nullable=True)
+    # Derived from comments by app.services.agent_ratings; never written by clients
     avg_raiting = Column(Float, nullable=True)
     reviews_count = Column(Integer, nullable=True)
+    rating_sum = Column(BigInteger, nullable=False, default=0, server_default='0')
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
+    # Denormalised pointers kept current by app.services.version_pointers
+    latest_version_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('versions.id', ondelete='SET NULL', use_alter=True, name='fk_agents_latest_version_id'),
+        nullable=True
+    )
+    stable_version_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey('versions.id', ondelete='SET NULL', use_alter=True, name='fk_agents_stable_version_id'),
+        nullable=True
+    )
 
     category = relationship('Category', backref='agents')
     comments = relationship('Comment', backref='agent', cascade='all, delete-orphan')
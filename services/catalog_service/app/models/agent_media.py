@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, DateTime, Boolean, UUID, ForeignKey
+from sqlalchemy import Column, Text, DateTime, Boolean, UUID, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -7,11 +7,18 @@ from app.core.base import Base
 
 class AgentMedia(Base):
     __tablename__ = 'agent_media'
+    __table_args__ = (
+        Index('ix_agent_media_agent_id', 'agent_id'),
+        Index('uq_agent_media_file_path', 'file_path', unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     agent_id = Column(UUID(as_uuid=True), ForeignKey('agents.id'), nullable=False)
     media_type = Column(ENUM('image', 'video', name='media_type_enum'), nullable=False)
     file_path = Column(Text, nullable=False)
+    # WebP derivatives under agents/{agent_id}/derived/, filled in by the derivative worker
+    thumbnail_path = Column(Text, nullable=True)
+    medium_path = Column(Text, nullable=True)
     is_primary = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Text
+from sqlalchemy import Column, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from app.core.base import Base
 
 class Category(Base):
     __tablename__ = 'categories'
+    __table_args__ = (
+        Index('ix_categories_name_id', 'name', 'id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     name = Column(Text, nullable=False)
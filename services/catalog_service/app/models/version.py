@@ -1,11 +1,11 @@
-from sqlalchemy import Column, Text, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Text, DateTime, Enum, ForeignKey, Index, String, BigInteger
 from enum import Enum
 from sqlalchemy.types import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 import uuid
 from app.core.base import Base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 class VersionStatusEnum(str, Enum):
     stable = 'stable'
@@ -15,6 +15,10 @@ class VersionStatusEnum(str, Enum):
 
 class Version(Base):
     __tablename__ = 'versions'
+    __table_args__ = (
+        Index('ix_versions_agent_id_created_at_id', 'agent_id', 'created_at', 'id'),
+        Index('ix_versions_archive_sha256', 'archive_sha256'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     agent_id = Column(UUID(as_uuid=True), ForeignKey('agents.id'), nullable=False)
@@ -23,5 +27,17 @@ class Version(Base):
     status = Column(SQLEnum(VersionStatusEnum, name='version_status_enum'), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     project_path = Column(Text, nullable=True)
+    # Set when the archive lives in MinIO under archives/sha256/<hash>
+    archive_sha256 = Column(String(64), nullable=True)
+    archive_size = Column(BigInteger, nullable=True)
 
-    agent = relationship('Agent')
+    agent = relationship('Agent', foreign_keys=[agent_id])
+
+    @validates('project_path')
+    def reset_archive_digest(self, key, value):
+        # The digest and size describe the archive at the old path; a stale one would
+        # make the download ETag answer 304 for a different file.
+        if self.project_path is not None and value != self.project_path:
+            self.archive_sha256 = None
+            self.archive_size = None
+        return value
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from typing import List, Optional
-from ..schemas.agent import AgentCreate, AgentUpdate, AgentRead, AgentReadFull
+from ..schemas.agent import AgentCreate, AgentUpdate, AgentRead, AgentReadFull, AgentSearchResult
 from ..models.agent import Agent
 from ..database import get_db
 from app.utils.auth import get_current_user
+from app.utils.cache import invalidate_catalog_cache
+from app.utils.pagination import keyset_paginate, keyset_page
+from app.services.agent_search import search_agents
 import uuid
 
 router = APIRouter(prefix="/agents", tags=["agents"])
@@ -23,12 +26,14 @@ async def create_agent(
     db.add(db_agent)
     await db.commit()
     await db.refresh(db_agent)
+    await invalidate_catalog_cache()
     return db_agent
 
 @router.get("/", response_model=list[AgentRead])
 async def get_agents(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, le=1000),
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
     category_id: Optional[str] = Query(None),
     min_rating: Optional[float] = Query(None, ge=0.0, le=5.0),
     max_price: Optional[float] = Query(None, gt=0),
@@ -49,11 +54,20 @@ async def get_agents(
             (Agent.name.ilike(search_lower)) | (Agent.description.ilike(search_lower))
         )
 
-    query = query.offset(skip).limit(limit)
+    query = keyset_paginate(query, Agent.created_at, Agent.id, cursor, limit)
     result = await db.execute(query)
-    agents = result.scalars().all()
+    agents, _ = keyset_page(result.scalars().all(), limit, response)
     return agents
 
+@router.get("/search", response_model=list[AgentSearchResult])
+async def search_agents_endpoint(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    category_id: Optional[uuid.UUID] = Query(None),
+    db: AsyncSession = Depends(get_db)
+):
+    return await search_agents(db, q, limit, category_id)
+
 # @router.get("/", response_model=List[AgentRead])
 # async def read_agents(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
 #     result = await db.execute(select(Agent).offset(skip).limit(limit))
@@ -76,14 +90,16 @@ async def get_agents(
 
 @router.get("/my", response_model=list[AgentRead])
 async def get_my_agents(
+    response: Response,
     current_user: dict = Depends(get_current_user),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, le=1000),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db)
 ):
-    stmt = select(Agent).where(Agent.user_id == current_user["user_id"]).offset(skip).limit(limit)
+    stmt = select(Agent).where(Agent.user_id == current_user["user_id"])
+    stmt = keyset_paginate(stmt, Agent.created_at, Agent.id, cursor, limit)
     result = await db.execute(stmt)
-    agents = result.scalars().all()
+    agents, _ = keyset_page(result.scalars().all(), limit, response)
     return agents
 
 @router.get("/{agent_id}", response_model=AgentReadFull)
@@ -114,6 +130,7 @@ async def update_agent(
         setattr(agent, key, value)
     await db.commit()
     await db.refresh(agent)
+    await invalidate_catalog_cache()
     return agent
 
 @router.delete("/{agent_id}", response_model=dict)
@@ -133,4 +150,5 @@ async def delete_agent(
     
     await db.delete(agent)
     await db.commit()
+    await invalidate_catalog_cache()
     return {"message": "Agent deleted"}
@@ -1,68 +1,97 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Query, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, File, UploadFile, Query, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from minio import Minio
+from sqlalchemy.exc import IntegrityError
 from minio.error import S3Error
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 import os
 import secrets
 import mimetypes
+from typing import Dict, List, Literal, Optional
 from app.database import get_db
 from app.utils.auth import get_current_user
 from app.services.agent_media import create_agent_media, get_agent_media_by_agent_id
-from app.schemas.agent_media import AgentMediaResponse, AgentMediaCreate
+from app.services.media_derivatives import ORIGINAL, generate_media_derivatives, media_path_for_size
+from app.schemas.agent_media import (
+    AgentMediaResponse,
+    AgentMediaCreate,
+    MediaUploadUrlRequest,
+    MediaUploadComplete,
+    UploadUrlResponse
+)
+from app.models.agent_media import AgentMedia
 from app.models.agent import Agent
-from app.utils.minio_client import minio_client
+from app.utils.storage import AsyncStorage, completed_upload_name, get_storage, pending_upload_name
+from app.utils.presign import signed_url_cache
 from app.config import get_settings
 
 settings = get_settings()
 
 router = APIRouter(prefix="/agents/{agent_id}/media", tags=["agent_media"])
+batch_router = APIRouter(prefix="/agents/media", tags=["agent_media"])
 
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp"}
 ALLOWED_VIDEO_TYPES = {"video/mp4", "video/quicktime", "video/x-matroska"}
 MAX_FILE_SIZE = 50 * 1024 * 1024
+MAX_SIGNED_BATCH_SIZE = 100
 
-def get_minio_client():
-    return minio_client
+async def get_owned_agent(db: AsyncSession, agent_id: UUID, current_user: dict) -> Agent:
+    agent_result = await db.execute(select(Agent).where(Agent.id == agent_id))
+    agent = agent_result.scalar_one_or_none()
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    if str(agent.user_id) != current_user["user_id"] and current_user.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return agent
+
+async def get_media_by_file_path(db: AsyncSession, file_path: str) -> Optional[AgentMedia]:
+    result = await db.execute(select(AgentMedia).where(AgentMedia.file_path == file_path))
+    return result.scalar_one_or_none()
+
+def media_type_for(content_type: Optional[str]) -> Optional[str]:
+    if content_type in ALLOWED_IMAGE_TYPES:
+        return "image"
+    if content_type in ALLOWED_VIDEO_TYPES:
+        return "video"
+    return None
+
+def new_media_object_name(agent_id: UUID, content_type: str) -> str:
+    extension = mimetypes.guess_extension(content_type) or ".bin"
+    return f"agents/{agent_id}/{secrets.token_urlsafe(16)}{extension}"
 
 @router.post("/", response_model=AgentMediaResponse)
 async def upload_agent_media(
     agent_id: UUID,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     is_primary: bool = Form(False),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
-    minio_client: Minio = Depends(get_minio_client)
+    storage: AsyncStorage = Depends(get_storage)
 ):
-    agent_result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    agent = agent_result.scalar_one_or_none()
-    if not agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
-    
-    if str(agent.user_id) != current_user["user_id"] and current_user.get("role") != "admin":
-        raise HTTPException(status_code=403, detail="Not authorized")
+    await get_owned_agent(db, agent_id, current_user)
 
     content_type = file.content_type
-    if content_type not in ALLOWED_IMAGE_TYPES and content_type not in ALLOWED_VIDEO_TYPES:
+    media_type = media_type_for(content_type)
+    if media_type is None:
         raise HTTPException(status_code=400, detail="Unsupported file type")
 
     if file.size is None or file.size > MAX_FILE_SIZE:
         raise HTTPException(status_code=400, detail="File too large or size unknown")
 
-    media_type = "image" if content_type in ALLOWED_IMAGE_TYPES else "video"
-
-    extension = mimetypes.guess_extension(content_type) or ".bin"
-    object_name = f"agents/{agent_id}/{secrets.token_urlsafe(16)}{extension}"
+    object_name = new_media_object_name(agent_id, content_type)
 
     try:
-        minio_client.put_object(
-            bucket_name=settings.MINIO_BUCKET_NAME,
-            object_name=object_name,
-            data=file.file,
-            length=file.size,
-            content_type=content_type
+        # Starlette has already spooled the part to disk; MinIO reads it back one
+        # part_size chunk at a time (multipart upload) in a storage worker thread.
+        await storage.put_object(
+            object_name,
+            file.file,
+            file.size,
+            content_type=content_type,
+            part_size=settings.MINIO_UPLOAD_PART_SIZE
         )
     except S3Error as e:
         raise HTTPException(status_code=500, detail=f"MinIO upload failed: {str(e)}")
@@ -76,7 +105,104 @@ async def upload_agent_media(
         "is_primary": is_primary
     }
     db_media = await create_agent_media(db, AgentMediaCreate(**media_in))
+    if media_type == "image":
+        background_tasks.add_task(generate_media_derivatives, db_media.id)
+
+    return db_media
+
+@router.post("/upload-url", response_model=UploadUrlResponse)
+async def create_media_upload_url(
+    agent_id: UUID,
+    upload: MediaUploadUrlRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    storage: AsyncStorage = Depends(get_storage)
+):
+    await get_owned_agent(db, agent_id, current_user)
+
+    if media_type_for(upload.content_type) is None:
+        raise HTTPException(status_code=400, detail="Unsupported file type")
+    if upload.size > MAX_FILE_SIZE:
+        raise HTTPException(status_code=400, detail="File too large")
+
+    object_name = pending_upload_name(new_media_object_name(agent_id, upload.content_type))
+    expires = timedelta(seconds=settings.MINIO_PRESIGNED_UPLOAD_EXPIRY)
+    try:
+        upload_url = await storage.presigned_put_object(object_name, expires)
+    except S3Error as e:
+        raise HTTPException(status_code=500, detail=f"MinIO presign failed: {str(e)}")
+
+    return UploadUrlResponse(
+        upload_url=upload_url,
+        object_name=object_name,
+        expires_at=datetime.now(timezone.utc) + expires,
+        headers={"Content-Type": upload.content_type}
+    )
+
+@router.post("/complete", response_model=AgentMediaResponse)
+async def complete_media_upload(
+    agent_id: UUID,
+    completion: MediaUploadComplete,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    storage: AsyncStorage = Depends(get_storage)
+):
+    await get_owned_agent(db, agent_id, current_user)
+
+    pending_name = completion.object_name
+    object_name = completed_upload_name(pending_name)
+    if object_name is None:
+        raise HTTPException(status_code=400, detail="Object was not issued by upload-url")
+    if not object_name.startswith(f"agents/{agent_id}/") or "/derived/" in object_name or ".." in object_name:
+        raise HTTPException(status_code=400, detail="Object does not belong to this agent")
 
+    existing_media = await get_media_by_file_path(db, object_name)
+    if existing_media:
+        return existing_media
+
+    try:
+        stat = await storage.stat_object(pending_name)
+    except S3Error:
+        # A racing /complete may have just moved the object and inserted the row.
+        existing_media = await get_media_by_file_path(db, object_name)
+        if existing_media:
+            return existing_media
+        raise HTTPException(status_code=404, detail="Uploaded object not found")
+
+    media_type = media_type_for(stat.content_type)
+    if media_type is None or stat.size > MAX_FILE_SIZE:
+        await storage.remove_object(pending_name)
+        raise HTTPException(status_code=400, detail="Uploaded object has an unsupported type or is too large")
+
+    try:
+        await storage.copy_object(pending_name, object_name)
+    except S3Error as e:
+        raise HTTPException(status_code=500, detail=f"MinIO copy failed: {str(e)}")
+
+    media_in = {
+        "agent_id": agent_id,
+        "media_type": media_type,
+        "file_path": object_name,
+        "is_primary": completion.is_primary
+    }
+    try:
+        db_media = await create_agent_media(db, AgentMediaCreate(**media_in))
+    except IntegrityError:
+        # A concurrent or retried /complete for the same object won the insert.
+        await db.rollback()
+        existing_media = await get_media_by_file_path(db, object_name)
+        if existing_media is None:
+            raise
+        return existing_media
+
+    try:
+        await storage.remove_object(pending_name)
+    except S3Error:
+        # Left for the pending-upload lifecycle rule to expire.
+        pass
+    if media_type == "image":
+        background_tasks.add_task(generate_media_derivatives, db_media.id)
     return db_media
 
 @router.get("/", response_model=list[AgentMediaResponse])
@@ -87,35 +213,65 @@ async def get_agent_media_list(
     media_list = await get_agent_media_by_agent_id(db, agent_id)
     return media_list
 
+MediaSize = Literal["thumbnail", "medium", "original"]
+
+def signed_media_item(media: AgentMedia, url: str) -> dict:
+    return {
+        "id": str(media.id),
+        "type": media.media_type,
+        "url": url,
+        "is_primary": media.is_primary
+    }
+
 @router.get("/signed")
 async def get_signed_media_urls(
     agent_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    minio_client: Minio = Depends(get_minio_client)
+    size: MediaSize = Query(ORIGINAL, description="Smallest variant to return: thumbnail, medium or original"),
+    db: AsyncSession = Depends(get_db)
 ):
-    agent_result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    agent = agent_result.scalar_one_or_none()
-    if not agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
-
     media_list = await get_agent_media_by_agent_id(db, agent_id)
-    signed_media = []
+    if not media_list:
+        agent_result = await db.execute(select(Agent.id).where(Agent.id == agent_id))
+        if agent_result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Agent not found")
+        return []
+
+    try:
+        paths = {media.id: media_path_for_size(media, size) for media in media_list}
+        urls = await signed_url_cache.get_many(paths.values())
+    except S3Error as e:
+        raise HTTPException(status_code=500, detail=f"Failed to sign media URLs: {e}")
+
+    return [signed_media_item(media, urls[paths[media.id]]) for media in media_list]
+
+@batch_router.get("/signed")
+async def get_signed_media_urls_batch(
+    agent_ids: List[str] = Query(..., description="Agent ids, repeated or comma-separated"),
+    size: MediaSize = Query(ORIGINAL, description="Smallest variant to return: thumbnail, medium or original"),
+    db: AsyncSession = Depends(get_db)
+):
+    try:
+        ids = list(dict.fromkeys(
+            UUID(value) for raw in agent_ids for value in raw.split(",") if value.strip()
+        ))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid agent id")
+    if len(ids) > MAX_SIGNED_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_SIGNED_BATCH_SIZE} agents per request"
+        )
+
+    result = await db.execute(select(AgentMedia).where(AgentMedia.agent_id.in_(ids)))
+    media_list = result.scalars().all()
+
+    try:
+        paths = {media.id: media_path_for_size(media, size) for media in media_list}
+        urls = await signed_url_cache.get_many(paths.values())
+    except S3Error as e:
+        raise HTTPException(status_code=500, detail=f"Failed to sign media URLs: {e}")
 
+    signed: Dict[str, List[dict]] = {str(agent_id): [] for agent_id in ids}
     for media in media_list:
-        try:
-            url = minio_client.presigned_get_object(
-                bucket_name=settings.MINIO_BUCKET_NAME,
-                object_name=media.file_path,
-                expires=timedelta(hours=1)
-            )
-            signed_media.append({
-                "id": str(media.id),
-                "type": media.media_type,
-                "url": url,
-                "is_primary": media.is_primary
-            })
-        except S3Error as e:
-            print(f"Ошибка генерации signed URL для {media.file_path}: {e}")
-            continue
-
-    return signed_media
\ No newline at end of file
+        signed[str(media.agent_id)].append(signed_media_item(media, urls[paths[media.id]]))
+    return signed
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List
+from typing import List, Optional
 from ..schemas.category import CategoryCreate, CategoryUpdate, CategoryRead, CategoryReadFull
 from ..models.category import Category
 from ..database import get_db
+from ..utils.cache import invalidate_catalog_cache
+from ..utils.pagination import keyset_paginate, keyset_page
 import uuid
 
 router = APIRouter(prefix="/categories", tags=["categories"])
@@ -15,12 +17,20 @@ async def create_category(category: CategoryCreate, db: AsyncSession = Depends(g
     db.add(db_category)
     await db.commit()
     await db.refresh(db_category)
+    await invalidate_catalog_cache()
     return db_category
 
 @router.get("/", response_model=List[CategoryRead])
-async def read_categories(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Category).offset(skip).limit(limit))
-    categories = result.scalars().all()
+async def read_categories(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    # Categories have no created_at, so they page alphabetically by (name, id).
+    query = keyset_paginate(select(Category), Category.name, Category.id, cursor, limit, descending=False)
+    result = await db.execute(query)
+    categories, _ = keyset_page(result.scalars().all(), limit, response, sort_attr="name")
     return categories
 
 @router.get("/{category_id}", response_model=CategoryReadFull)
@@ -41,6 +51,7 @@ async def update_category(category_id: uuid.UUID, category_update: CategoryUpdat
         setattr(category, key, value)
     await db.commit()
     await db.refresh(category)
+    await invalidate_catalog_cache()
     return category
 
 @router.delete("/{category_id}", response_model=dict)
@@ -51,4 +62,5 @@ async def delete_category(category_id: uuid.UUID, db: AsyncSession = Depends(get
         raise HTTPException(status_code=404, detail="Category not found")
     await db.delete(category)
     await db.commit()
+    await invalidate_catalog_cache()
     return {"ok": True}
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import List
+from typing import List, Optional
 from ..schemas.comment import CommentCreate, CommentUpdate, CommentRead, CommentReadFull
 from ..models.comment import Comment
 from ..database import get_db
 import uuid
 from ..utils.auth import get_current_user
+from ..utils.pagination import keyset_paginate, keyset_page
+from ..utils.cache import invalidate_catalog_cache
+from ..services.agent_ratings import apply_rating_change
 
 router = APIRouter(prefix="/comments", tags=["comments"])
 
@@ -21,14 +24,26 @@ async def create_comment(
     
     db_comment = Comment(**comment_data)
     db.add(db_comment)
+    await apply_rating_change(db, db_comment.agent_id, db_comment.rating, 1)
     await db.commit()
     await db.refresh(db_comment)
+    await invalidate_catalog_cache()
     return db_comment
 
 @router.get("/", response_model=List[CommentRead])
-async def read_comments(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Comment).offset(skip).limit(limit))
-    comments = result.scalars().all()
+async def read_comments(
+    response: Response,
+    agent_id: Optional[uuid.UUID] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db)
+):
+    query = select(Comment)
+    if agent_id:
+        query = query.where(Comment.agent_id == agent_id)
+    query = keyset_paginate(query, Comment.created_at, Comment.id, cursor, limit)
+    result = await db.execute(query)
+    comments, _ = keyset_page(result.scalars().all(), limit, response)
     return comments
 
 @router.get("/{comment_id}", response_model=CommentReadFull)
@@ -54,11 +69,17 @@ async def update_comment(
     if str(comment.user_id) != current_user["user_id"] and current_user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Not authorized to update this comment")
     
-    for key, value in comment_update.dict(exclude_unset=True).items():
+    previous_rating = comment.rating
+    for key, value in comment_update.dict(exclude_unset=True, exclude_none=True).items():
         setattr(comment, key, value)
-        
+
+    rating_changed = comment.rating != previous_rating
+    if rating_changed:
+        await apply_rating_change(db, comment.agent_id, comment.rating - previous_rating, 0)
     await db.commit()
     await db.refresh(comment)
+    if rating_changed:
+        await invalidate_catalog_cache()
     return comment
 
 @router.delete("/{comment_id}", response_model=dict)
@@ -76,5 +97,7 @@ async def delete_comment(
         raise HTTPException(status_code=403, detail="Not authorized to delete this comment")
     
     await db.delete(comment)
+    await apply_rating_change(db, comment.agent_id, -comment.rating, -1)
     await db.commit()
+    await invalidate_catalog_cache()
     return {"ok": True}
@@ -1,27 +1,73 @@
-import os
-import shutil
-from typing import Optional
+from typing import Dict, List, Optional
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import select
-from tempfile import NamedTemporaryFile
-from ..schemas.version import VersionCreate, VersionUpdate, VersionRead
+from datetime import datetime, timedelta, timezone
+from minio.error import S3Error
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import FileResponse, StreamingResponse
+from ..schemas.version import VersionUpdate, VersionRead, ArchiveUploadUrlRequest, ArchiveUploadComplete
+from ..schemas.agent_media import UploadUrlResponse
 from ..models.version import Version, VersionStatusEnum
 from ..models.agent import Agent
 from ..database import get_db
 import uuid
 from uuid import UUID as UUIDType
 from ..utils.auth import get_current_user
+from ..utils.pagination import keyset_paginate, keyset_page
+from ..utils.storage import AsyncStorage, completed_upload_name, get_storage, pending_upload_name
+from ..services.archive_storage import (
+    ArchiveTooLarge,
+    adopt_uploaded_archive,
+    archive_project_path,
+    content_addressed_name,
+    hash_file,
+    spool_archive,
+    store_archive,
+    store_hashed_archive
+)
+from ..services.archive_download import (
+    ARCHIVE_CACHE_CONTROL,
+    DOWNLOAD_CHUNK_SIZE,
+    RangeNotSatisfiable,
+    archive_filename,
+    etag_matches,
+    iter_file_range,
+    legacy_archive_path,
+    parse_range,
+    s3_object_name,
+    strong_etag
+)
+from ..services.version_pointers import get_current_versions, refresh_version_pointers
+from ..config import get_settings
+
+settings = get_settings()
 
 router = APIRouter(prefix="/versions", tags=["versions"])
 
-UPLOAD_ROOT = Path("/app/uploads")
-ARCHIVE_DIR = UPLOAD_ROOT / "archives"
-ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
-
-PUBLIC_UPLOAD_BASE_URL = os.getenv("PUBLIC_UPLOAD_BASE_URL", "/uploads")
+ARCHIVE_CONTENT_TYPES = {
+    "application/zip",
+    "application/x-zip-compressed",
+    "application/x-tar",
+    "application/gzip",
+    "application/x-gzip",
+}
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.gz', '.tar.gz')
+MAX_LATEST_BATCH_SIZE = 100
+
+def is_archive(filename: Optional[str], content_type: Optional[str]) -> bool:
+    return content_type in ARCHIVE_CONTENT_TYPES or (filename or "").lower().endswith(ARCHIVE_EXTENSIONS)
+
+async def get_owned_agent(db: AsyncSession, agent_id: uuid.UUID, current_user: dict) -> Agent:
+    result = await db.execute(select(Agent).where(Agent.id == agent_id))
+    agent = result.scalar_one_or_none()
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+    if str(agent.user_id) != current_user["user_id"] and current_user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized to add versions to this agent")
+    return agent
 
 @router.post("/{agent_id}/versions/", response_model=VersionRead)
 async def create_version_with_archive(
@@ -29,83 +75,321 @@ async def create_version_with_archive(
     version: str = Form(...),
     changelog: Optional[str] = Form(None),
     status: str = Form(...),
-    project_path: Optional[str] = Form(None),
     archive: Optional[UploadFile] = File(None),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
+    storage: AsyncStorage = Depends(get_storage),
 ):
+    # Checked before the archive is touched, so nobody can store data against someone else's agent.
+    await get_owned_agent(db, agent_id, current_user)
+
     try:
         status_enum = VersionStatusEnum(status)
     except ValueError:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=422,
             detail=f"Invalid status: {status}. Allowed: {list(VersionStatusEnum)}"
         )
 
-    final_project_path = project_path
+    # project_path is only ever written by the server, from the archive it stored itself.
+    final_project_path = None
+    stored = None
 
     if archive:
-        if archive.content_type not in [
-            "application/zip",
-            "application/x-zip-compressed",
-            "application/x-tar",
-            "application/gzip",
-            "application/x-gzip",
-        ] and not archive.filename.lower().endswith(('.zip', '.tar', '.gz', '.tar.gz')):
+        if not is_archive(archive.filename, archive.content_type):
             raise HTTPException(
                 status_code=400,
                 detail="Поддерживаются только .zip, .tar, .gz архивы"
             )
 
-        ext = Path(archive.filename or "archive.zip").suffix.lower()
-        safe_filename = f"{uuid.uuid4()}{ext}"
-        file_abs_path = ARCHIVE_DIR / safe_filename
-
         try:
-            with NamedTemporaryFile(delete=False) as tmp:
-                shutil.copyfileobj(archive.file, tmp)
-                tmp_path = Path(tmp.name)
-            shutil.move(str(tmp_path), file_abs_path)
-        except Exception as e:
-            if tmp_path.exists():
-                tmp_path.unlink()
+            stored = await store_archive(storage, archive.file, archive.content_type)
+        except ArchiveTooLarge:
+            raise HTTPException(status_code=413, detail="Archive too large")
+        except S3Error as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Ошибка сохранения архива: {str(e)}"
             )
         finally:
             await archive.close()
-        final_project_path = f"{PUBLIC_UPLOAD_BASE_URL}/archives/{safe_filename}"
+        final_project_path = archive_project_path(stored.object_name)
 
-    version_in = VersionCreate(
+    db_version = Version(
         agent_id=agent_id,
         version=version,
         changelog=changelog,
         status=status_enum,
         project_path=final_project_path,
+        archive_sha256=stored.sha256 if stored else None,
+        archive_size=stored.size if stored else None
     )
+    db.add(db_version)
+    await refresh_version_pointers(db, agent_id)
+    await db.commit()
+    await db.refresh(db_version)
+    return db_version
+
+@router.put("/{agent_id}/archive", response_model=VersionRead)
+async def stream_version_archive(
+    agent_id: uuid.UUID,
+    request: Request,
+    version: str = Query(...),
+    status: str = Query(...),
+    changelog: Optional[str] = Query(None),
+    filename: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    storage: AsyncStorage = Depends(get_storage),
+):
+    # Raw-body upload: nothing is read until the caller is authorised, and the body
+    # is hashed and spooled chunk by chunk off the event loop.
+    await get_owned_agent(db, agent_id, current_user)
+
+    try:
+        status_enum = VersionStatusEnum(status)
+    except ValueError:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid status: {status}. Allowed: {list(VersionStatusEnum)}"
+        )
+
+    content_type = request.headers.get("content-type")
+    if not is_archive(filename, content_type):
+        raise HTTPException(status_code=400, detail="Поддерживаются только .zip, .tar, .gz архивы")
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.MAX_ARCHIVE_SIZE:
+        raise HTTPException(status_code=413, detail="Archive too large")
+
+    try:
+        spooled = await spool_archive(request.stream(), settings.MAX_ARCHIVE_SIZE)
+    except ArchiveTooLarge:
+        raise HTTPException(status_code=413, detail="Archive too large")
 
-    db_version = Version(**version_in.model_dump())
+    try:
+        stored = await store_hashed_archive(storage, spooled.file, spooled.sha256, spooled.size, content_type)
+    except S3Error as e:
+        raise HTTPException(status_code=500, detail=f"MinIO archive store failed: {str(e)}")
+    finally:
+        await run_in_threadpool(spooled.file.close)
+
+    db_version = Version(
+        agent_id=agent_id,
+        version=version,
+        changelog=changelog,
+        status=status_enum,
+        project_path=archive_project_path(stored.object_name),
+        archive_sha256=stored.sha256,
+        archive_size=stored.size
+    )
     db.add(db_version)
+    await refresh_version_pointers(db, agent_id)
+    await db.commit()
+    await db.refresh(db_version)
+    return db_version
+
+@router.post("/{agent_id}/archive/upload-url", response_model=UploadUrlResponse)
+async def create_archive_upload_url(
+    agent_id: uuid.UUID,
+    upload: ArchiveUploadUrlRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    storage: AsyncStorage = Depends(get_storage),
+):
+    await get_owned_agent(db, agent_id, current_user)
+
+    if not is_archive(upload.filename, upload.content_type):
+        raise HTTPException(status_code=400, detail="Поддерживаются только .zip, .tar, .gz архивы")
+    if upload.size > settings.MAX_ARCHIVE_SIZE:
+        raise HTTPException(status_code=413, detail="Archive too large")
+
+    filename = upload.filename.lower()
+    ext = ".tar.gz" if filename.endswith(".tar.gz") else (Path(filename).suffix or ".zip")
+    object_name = pending_upload_name(f"archives/{agent_id}/{uuid.uuid4()}{ext}")
+    expires = timedelta(seconds=settings.MINIO_PRESIGNED_UPLOAD_EXPIRY)
+    try:
+        upload_url = await storage.presigned_put_object(object_name, expires)
+    except S3Error as e:
+        raise HTTPException(status_code=500, detail=f"MinIO presign failed: {str(e)}")
+
+    headers = {"Content-Type": upload.content_type} if upload.content_type else {}
+    return UploadUrlResponse(
+        upload_url=upload_url,
+        object_name=object_name,
+        expires_at=datetime.now(timezone.utc) + expires,
+        headers=headers
+    )
+
+@router.post("/{agent_id}/archive/complete", response_model=VersionRead)
+async def complete_archive_upload(
+    agent_id: uuid.UUID,
+    completion: ArchiveUploadComplete,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+    storage: AsyncStorage = Depends(get_storage),
+):
+    await get_owned_agent(db, agent_id, current_user)
+
+    try:
+        status_enum = VersionStatusEnum(completion.status)
+    except ValueError:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Invalid status: {completion.status}. Allowed: {list(VersionStatusEnum)}"
+        )
+
+    object_name = completion.object_name
+    staged_name = completed_upload_name(object_name)
+    if staged_name is None:
+        raise HTTPException(status_code=400, detail="Object was not issued by upload-url")
+    if not staged_name.startswith(f"archives/{agent_id}/") or ".." in object_name:
+        raise HTTPException(status_code=400, detail="Object does not belong to this agent")
+
+    try:
+        stat = await storage.stat_object(object_name)
+    except S3Error:
+        raise HTTPException(status_code=404, detail="Uploaded archive not found")
+
+    if stat.size > settings.MAX_ARCHIVE_SIZE:
+        await storage.remove_object(object_name)
+        raise HTTPException(status_code=413, detail="Archive too large")
+
+    try:
+        stored = await adopt_uploaded_archive(storage, object_name)
+    except S3Error as e:
+        raise HTTPException(status_code=500, detail=f"MinIO archive store failed: {str(e)}")
+
+    db_version = Version(
+        agent_id=agent_id,
+        version=completion.version,
+        changelog=completion.changelog,
+        status=status_enum,
+        project_path=archive_project_path(stored.object_name),
+        archive_sha256=stored.sha256,
+        archive_size=stored.size
+    )
+    db.add(db_version)
+    await refresh_version_pointers(db, agent_id)
     await db.commit()
     await db.refresh(db_version)
     return db_version
 
 @router.get("/", response_model=list[VersionRead])
 async def get_versions(
+    response: Response,
     agent_id: str = None,
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     query = select(Version)
     if agent_id:
         query = query.where(Version.agent_id == agent_id)
-    result = await db.execute(query.offset(skip).limit(limit))
-    versions = result.scalars().all()
+    query = keyset_paginate(query, Version.created_at, Version.id, cursor, limit)
+    result = await db.execute(query)
+    versions, _ = keyset_page(result.scalars().all(), limit, response)
     return versions
 
+@router.get("/latest", response_model=Dict[str, Optional[VersionRead]])
+async def get_latest_versions(
+    agent_ids: List[str] = Query(..., description="Agent ids, repeated or comma-separated"),
+    stable: bool = Query(False, description="Return each agent's newest stable version instead"),
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    try:
+        ids = list(dict.fromkeys(
+            UUIDType(value) for raw in agent_ids for value in raw.split(",") if value.strip()
+        ))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid agent id")
+    if len(ids) > MAX_LATEST_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_LATEST_BATCH_SIZE} agents per request")
+
+    versions = await get_current_versions(db, ids, stable=stable)
+    return {str(agent_id): versions.get(agent_id) for agent_id in ids}
+
+@router.api_route("/{version_id}/archive", methods=["GET", "HEAD"])
+async def download_version_archive(
+    version_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    storage: AsyncStorage = Depends(get_storage),
+):
+    result = await db.execute(select(Version).where(Version.id == version_id))
+    version = result.scalars().first()
+    if not version or version.status == VersionStatusEnum.unpublished:
+        raise HTTPException(status_code=404, detail="Version not found")
+
+    object_name = s3_object_name(version.project_path)
+    legacy_path = None
+    content_type = None
+    try:
+        if object_name:
+            # Only the content-addressed object the server hashed itself is served, never
+            # another object in the bucket (pending uploads, media) a path might point at.
+            if version.archive_sha256 is None or object_name != content_addressed_name(version.archive_sha256):
+                raise HTTPException(status_code=404, detail="Archive not found")
+            stat = await storage.stat_object_or_none(object_name)
+            if stat is None:
+                raise HTTPException(status_code=404, detail="Archive not found")
+            size, content_type = stat.size, stat.content_type
+        else:
+            legacy_path = await run_in_threadpool(legacy_archive_path, version.project_path)
+            if legacy_path is None:
+                raise HTTPException(status_code=404, detail="Archive not found")
+            size = (await run_in_threadpool(legacy_path.stat)).st_size
+            if version.archive_sha256 is None:
+                # Archives from before hashing get their digest on first download.
+                version.archive_sha256, version.archive_size = await run_in_threadpool(hash_file, legacy_path)
+                await db.commit()
+    except S3Error as e:
+        raise HTTPException(status_code=500, detail=f"MinIO archive lookup failed: {str(e)}")
+
+    etag = strong_etag(version.archive_sha256)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": ARCHIVE_CACHE_CONTROL,
+        "Content-Disposition": f'attachment; filename="{archive_filename(version.version, content_type, legacy_path)}"',
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range.strip() != etag:
+        range_header = None
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+    media_type = content_type or "application/octet-stream"
+    if byte_range:
+        start, end = byte_range
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    else:
+        start, end = 0, size - 1
+        status_code = 200
+    length = end - start + 1
+    headers["Content-Length"] = str(length)
+
+    if request.method == "HEAD":
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+    if legacy_path is not None and byte_range is None:
+        # FileResponse uses the server's zero-copy sendfile extension when it offers one.
+        return FileResponse(legacy_path, headers=headers, media_type=media_type)
+
+    if object_name:
+        body = storage.iter_object(object_name, offset=start, length=length, chunk_size=DOWNLOAD_CHUNK_SIZE)
+    else:
+        body = iter_file_range(legacy_path, start, length)
+    return StreamingResponse(body, status_code=status_code, headers=headers, media_type=media_type)
+
 @router.get("/{version_id}", response_model=VersionRead)
 async def get_version(
     version_id: uuid.UUID,
@@ -143,6 +427,7 @@ async def update_version(
     for key, value in version_update.dict(exclude_unset=True).items():
         setattr(version, key, value)
 
+    await refresh_version_pointers(db, version.agent_id)
     await db.commit()
     await db.refresh(version)
     return version
@@ -168,6 +453,7 @@ async def delete_version(
         raise HTTPException(status_code=403, detail="Not authorized to delete this version")
 
     await db.delete(version)
+    await refresh_version_pointers(db, agent.id)
     await db.commit()
     return {"message": "Version deleted"}
 
@@ -187,9 +473,8 @@ async def get_latest_archive_project_path(
 
     stmt = (
         select(Version.project_path)
-        .where(Version.agent_id == agent_uuid)
-        .order_by(Version.created_at.desc())
-        .limit(1)
+        .join(Agent, Agent.latest_version_id == Version.id)
+        .where(Agent.id == agent_uuid)
     )
 
     result = await db.execute(stmt)
@@ -203,56 +488,3 @@ async def get_latest_archive_project_path(
 
     return {"project_path": project_path}
 
-
-UPLOAD_DIR = Path("uploads/archives")
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-
-@router.post("/{agent_id}/versions/", response_model=VersionRead)
-async def create_version(
-    agent_id: uuid.UUID,
-    version: str = Form(...),
-    changelog: Optional[str] = Form(None),
-    status: VersionStatusEnum = Form(...),
-    project_path: Optional[str] = Form(None),
-    archive: Optional[UploadFile] = File(None),  # ← файл
-    db: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user)
-):
-    # Сохраняем файл, если загружен
-    saved_archive_path = project_path  # fallback — внешняя ссылка
-
-    if archive:
-        if archive.content_type not in [
-            'application/zip',
-            'application/x-zip-compressed',
-            'application/x-tar',
-            'application/gzip'
-        ]:
-            raise HTTPException(400, "Неподдерживаемый тип файла")
-
-        # Генерируем безопасное имя: agent_id + timestamp + расширение
-        ext = Path(archive.filename).suffix if archive.filename else ".zip"
-        filename = f"{agent_id}{ext}"
-        file_path = UPLOAD_DIR / filename
-
-        try:
-            with open(file_path, "wb") as f:
-                shutil.copyfileobj(archive.file, f)
-            saved_archive_path = f"/uploads/archives/{filename}"  # путь для БД
-        except Exception as e:
-            raise HTTPException(500, f"Ошибка сохранения файла: {str(e)}")
-        finally:
-            archive.file.close()
-
-    # Создаём запись в БД
-    db_version = Version(
-        agent_id=agent_id,
-        version=version,
-        changelog=changelog,
-        status=status,
-        project_path=saved_archive_path  # ← сохраняем путь к архиву/ссылке
-    )
-    db.add(db_version)
-    await db.commit()
-    await db.refresh(db_version)
-    return db_version
\ No newline at end of file
@@ -27,8 +27,6 @@ class AgentCreate(BaseModel):
     category_id: Optional[UUID] = None
     article_id: Optional[UUID] = None
     price: Optional[float] = None
-    avg_raiting: Optional[float] = None
-    reviews_count: Optional[int] = None
 
 class AgentUpdate(BaseModel):
     name: Optional[str] = None
@@ -40,13 +38,18 @@ class AgentUpdate(BaseModel):
     category_id: Optional[UUID] = None
     article_id: Optional[UUID] = None
     price: Optional[float] = None
-    avg_raiting: Optional[float] = None
-    reviews_count: Optional[int] = None
 
 class AgentRead(AgentBase):
     id: UUID
     created_at: datetime
     updated_at: datetime
+    latest_version_id: Optional[UUID] = None
+    stable_version_id: Optional[UUID] = None
+
+class AgentSearchResult(AgentRead):
+    rank: float
+    name_highlight: Optional[str] = None
+    description_highlight: Optional[str] = None
 
 class AgentReadFull(AgentRead):
     id: UUID
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from uuid import UUID
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 
 class AgentMediaBase(BaseModel):
@@ -15,8 +15,24 @@ class AgentMediaCreate(AgentMediaBase):
 class AgentMediaUpdate(BaseModel):
     is_primary: Optional[bool] = None
 
+class MediaUploadUrlRequest(BaseModel):
+    content_type: str
+    size: int = Field(..., gt=0)
+
+class UploadUrlResponse(BaseModel):
+    upload_url: str
+    object_name: str
+    expires_at: datetime
+    headers: Dict[str, str] = {}
+
+class MediaUploadComplete(BaseModel):
+    object_name: str
+    is_primary: bool = False
+
 class AgentMediaResponse(AgentMediaBase):
     id: UUID
+    thumbnail_path: Optional[str] = None
+    medium_path: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from typing import Optional
 from datetime import datetime
@@ -11,11 +11,11 @@ class CommentBase(BaseModel):
 
 class CommentCreate(BaseModel):
     agent_id: UUID
-    rating: int
+    rating: int = Field(..., ge=1, le=5)
     content: str
 
 class CommentUpdate(BaseModel):
-    rating: Optional[int] = None
+    rating: Optional[int] = Field(None, ge=1, le=5)
     content: Optional[str] = None
 
 class CommentRead(CommentBase):
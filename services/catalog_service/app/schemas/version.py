@@ -3,7 +3,7 @@ from uuid import UUID
 from typing import Optional
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
@@ -13,7 +13,6 @@ class VersionBase(BaseModel):
     version: str
     changelog: Optional[str] = None
     status: str  # enum: 'draft', 'published', 'deprecated'
-    project_path: Optional[str] = None
 
 class VersionCreate(VersionBase):
     pass
@@ -22,11 +21,24 @@ class VersionUpdate(BaseModel):
     version: Optional[str] = None
     changelog: Optional[str] = None
     status: Optional[str] = None  # enum: 'draft', 'published', 'deprecated'
-    project_path: Optional[str] = None
+
+class ArchiveUploadUrlRequest(BaseModel):
+    filename: str
+    size: int = Field(..., gt=0)
+    content_type: Optional[str] = None
+
+class ArchiveUploadComplete(BaseModel):
+    object_name: str
+    version: str
+    changelog: Optional[str] = None
+    status: str
 
 class VersionRead(VersionBase):
     id: UUID
     created_at: datetime
+    project_path: Optional[str] = None
+    archive_sha256: Optional[str] = None
+    archive_size: Optional[int] = None
 
     class Config:
         from_attributes = True
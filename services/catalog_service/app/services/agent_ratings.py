@@ -0,0 +1,51 @@
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Float, cast, func, select, update
+from app.models.agent import Agent
+from app.models.comment import Comment
+
+
+async def apply_rating_change(db: AsyncSession, agent_id: UUID, rating_delta: int, count_delta: int):
+    # A single UPDATE against the current row: concurrent comments serialise on the
+    # row lock instead of overwriting each other's totals. SET expressions see the
+    # old values, so the average is computed from old + delta.
+    new_sum = Agent.rating_sum + rating_delta
+    new_count = func.coalesce(Agent.reviews_count, 0) + count_delta
+    await db.execute(
+        update(Agent)
+        .where(Agent.id == agent_id)
+        .values(
+            rating_sum=new_sum,
+            reviews_count=new_count,
+            avg_raiting=cast(new_sum, Float) / func.nullif(new_count, 0)
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def backfill_agent_ratings(db: AsyncSession) -> int:
+    totals = (
+        select(
+            Comment.agent_id,
+            func.sum(Comment.rating).label("rating_sum"),
+            func.count(Comment.id).label("reviews_count")
+        )
+        .group_by(Comment.agent_id)
+        .subquery()
+    )
+    await db.execute(
+        update(Agent)
+        .values(rating_sum=0, reviews_count=0, avg_raiting=None)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(
+        update(Agent)
+        .where(Agent.id == totals.c.agent_id)
+        .values(
+            rating_sum=totals.c.rating_sum,
+            reviews_count=totals.c.reviews_count,
+            avg_raiting=cast(totals.c.rating_sum, Float) / totals.c.reviews_count
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
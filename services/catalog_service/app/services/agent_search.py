@@ -0,0 +1,72 @@
+import re
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy import func, literal_column, or_
+from app.models.agent import Agent, SEARCH_CONFIG
+from app.schemas.agent import AgentRead, AgentSearchResult
+
+HIGHLIGHT_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+TRIGRAM_WEIGHT = 0.5
+
+# Order matters: '&' first so the entities added afterwards aren't escaped again.
+HTML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#39;"))
+
+search_config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+def html_escaped(column):
+    # Names and descriptions are owner-controlled; escape them before ts_headline so
+    # the <mark> delimiters are the only markup a client ever renders. The default
+    # parser reads the entities as single tokens, so matching words are unaffected.
+    for char, entity in HTML_ESCAPES:
+        column = func.replace(column, char, entity)
+    return column
+
+def build_prefix_tsquery(q: str) -> Optional[str]:
+    # Only word characters reach to_tsquery, so user input can't break its syntax.
+    terms = re.findall(r"\w+", q.lower())
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+async def search_agents(
+    db: AsyncSession,
+    q: str,
+    limit: int = 20,
+    category_id: Optional[UUID] = None
+) -> List[AgentSearchResult]:
+    prefix_query = build_prefix_tsquery(q)
+    if prefix_query is None:
+        return []
+
+    ts_query = func.to_tsquery(search_config, prefix_query)
+    rank = (
+        func.ts_rank_cd(Agent.search_vector, ts_query)
+        + func.similarity(Agent.name, q) * TRIGRAM_WEIGHT
+    ).label("rank")
+    name_highlight = func.ts_headline(search_config, html_escaped(Agent.name), ts_query, HIGHLIGHT_OPTIONS)
+    description_highlight = func.ts_headline(search_config, html_escaped(Agent.description), ts_query, HIGHLIGHT_OPTIONS)
+
+    stmt = (
+        select(Agent, rank, name_highlight, description_highlight)
+        .where(or_(
+            Agent.search_vector.op("@@")(ts_query),
+            Agent.name.op("%")(q)
+        ))
+        .order_by(rank.desc(), Agent.id)
+        .limit(limit)
+    )
+    if category_id:
+        stmt = stmt.where(Agent.category_id == category_id)
+
+    result = await db.execute(stmt)
+    return [
+        AgentSearchResult(
+            **AgentRead.model_validate(agent, from_attributes=True).model_dump(),
+            rank=score,
+            name_highlight=name_hl,
+            description_highlight=description_hl
+        )
+        for agent, score, name_hl, description_hl in result.all()
+    ]
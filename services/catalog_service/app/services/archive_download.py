@@ -0,0 +1,109 @@
+import os
+import re
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from app.config import get_settings
+
+settings = get_settings()
+
+# Archives uploaded before content-addressed storage still live on the uploads volume.
+LEGACY_UPLOAD_ROOT = Path("/app/uploads")
+PUBLIC_UPLOAD_BASE_URL = os.getenv("PUBLIC_UPLOAD_BASE_URL", "/uploads")
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+ARCHIVE_CACHE_CONTROL = "public, max-age=3600"
+
+ARCHIVE_SUFFIXES = {
+    "application/zip": ".zip",
+    "application/x-zip-compressed": ".zip",
+    "application/x-tar": ".tar",
+    "application/gzip": ".tar.gz",
+    "application/x-gzip": ".tar.gz",
+}
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def strong_etag(sha256: str) -> str:
+    return f'"{sha256}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison, so W/"x" matches "x".
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (value.strip() for value in header.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    # Single byte ranges only; anything else (multipart ranges, other units) gets the full body.
+    if not header:
+        return None
+    match = RANGE_RE.match(header.replace(" ", ""))
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        # Syntactically invalid, so the header is ignored rather than refused.
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def s3_object_name(project_path: Optional[str]) -> Optional[str]:
+    prefix = f"s3://{settings.MINIO_BUCKET_NAME}/"
+    if project_path and project_path.startswith(prefix):
+        return project_path[len(prefix):]
+    return None
+
+
+def legacy_archive_path(project_path: Optional[str]) -> Optional[Path]:
+    if not project_path or not project_path.startswith(f"{PUBLIC_UPLOAD_BASE_URL}/archives/"):
+        return None
+    relative = project_path[len(PUBLIC_UPLOAD_BASE_URL):].lstrip("/")
+    path = (LEGACY_UPLOAD_ROOT / relative).resolve()
+    if LEGACY_UPLOAD_ROOT.resolve() not in path.parents or not path.is_file():
+        return None
+    return path
+
+
+def archive_filename(version: str, content_type: Optional[str], legacy_path: Optional[Path] = None) -> str:
+    if legacy_path is not None:
+        suffix = ".tar.gz" if legacy_path.name.endswith(".tar.gz") else legacy_path.suffix
+    else:
+        suffix = ARCHIVE_SUFFIXES.get(content_type or "", ".zip")
+    safe_version = re.sub(r"[^\w.-]+", "_", version)
+    return f"archive-{safe_version}{suffix}"
+
+
+async def iter_file_range(path: Path, start: int, length: int) -> AsyncIterator[bytes]:
+    handle = await run_in_threadpool(open, path, "rb")
+    try:
+        await run_in_threadpool(handle.seek, start)
+        remaining = length
+        while remaining > 0:
+            chunk = await run_in_threadpool(handle.read, min(DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        await run_in_threadpool(handle.close)
@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import tempfile
+from typing import AsyncIterator, BinaryIO, List, NamedTuple, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from app.config import get_settings
+from app.utils.storage import AsyncStorage
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+ARCHIVE_HASH_CHUNK_SIZE = 1024 * 1024
+CONTENT_ADDRESSED_PREFIX = "archives/sha256"
+
+
+class ArchiveTooLarge(ValueError):
+    pass
+
+
+class SpooledArchive(NamedTuple):
+    file: BinaryIO
+    sha256: str
+    size: int
+
+
+class StoredArchive(NamedTuple):
+    object_name: str
+    sha256: str
+    size: int
+    deduplicated: bool
+
+
+def content_addressed_name(sha256: str) -> str:
+    # Two-character fan-out keeps any one listing prefix small.
+    return f"{CONTENT_ADDRESSED_PREFIX}/{sha256[:2]}/{sha256}"
+
+
+def archive_project_path(object_name: str) -> str:
+    return f"s3://{settings.MINIO_BUCKET_NAME}/{object_name}"
+
+
+def hash_stream(stream: BinaryIO, max_size: Optional[int] = None) -> Tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := stream.read(ARCHIVE_HASH_CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise ArchiveTooLarge()
+    return digest.hexdigest(), size
+
+
+def hash_file(path) -> Tuple[str, int]:
+    with open(path, "rb") as handle:
+        return hash_stream(handle)
+
+
+async def spool_archive(chunks: AsyncIterator[bytes], max_size: int) -> SpooledArchive:
+    # Request chunks are small; batch them so each threadpool hop hashes and writes ~1 MiB.
+    spool = tempfile.TemporaryFile()
+    digest = hashlib.sha256()
+    size = 0
+    pending: List[bytes] = []
+    pending_size = 0
+
+    def flush(batch: List[bytes]):
+        data = b"".join(batch)
+        digest.update(data)
+        spool.write(data)
+
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > max_size:
+                raise ArchiveTooLarge()
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= ARCHIVE_HASH_CHUNK_SIZE:
+                await run_in_threadpool(flush, pending)
+                pending, pending_size = [], 0
+        if pending:
+            await run_in_threadpool(flush, pending)
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+    return SpooledArchive(spool, digest.hexdigest(), size)
+
+
+async def store_archive(
+    storage: AsyncStorage,
+    stream: BinaryIO,
+    content_type: Optional[str]
+) -> StoredArchive:
+    # Hash the spooled upload first so a re-published archive never goes over the wire again.
+    start = stream.tell()
+    sha256, size = await run_in_threadpool(hash_stream, stream, settings.MAX_ARCHIVE_SIZE)
+    stream.seek(start)
+    return await store_hashed_archive(storage, stream, sha256, size, content_type)
+
+
+async def store_hashed_archive(
+    storage: AsyncStorage,
+    stream: BinaryIO,
+    sha256: str,
+    size: int,
+    content_type: Optional[str]
+) -> StoredArchive:
+    object_name = content_addressed_name(sha256)
+
+    existing = await storage.stat_object_or_none(object_name)
+    if existing is not None and existing.size == size:
+        return StoredArchive(object_name, sha256, size, True)
+
+    await storage.put_object(
+        object_name,
+        stream,
+        size,
+        content_type=content_type or "application/octet-stream",
+        part_size=settings.MINIO_UPLOAD_PART_SIZE
+    )
+    return StoredArchive(object_name, sha256, size, False)
+
+
+async def adopt_uploaded_archive(storage: AsyncStorage, upload_name: str) -> StoredArchive:
+    # Direct (presigned) uploads land under a random name; hash them server side and
+    # move them into the content-addressed namespace, dropping the copy if it's a duplicate.
+    sha256, size = await storage.sha256_object(upload_name, ARCHIVE_HASH_CHUNK_SIZE)
+    object_name = content_addressed_name(sha256)
+
+    existing = await storage.stat_object_or_none(object_name)
+    deduplicated = existing is not None and existing.size == size
+    if not deduplicated:
+        await storage.copy_object(upload_name, object_name)
+    try:
+        await storage.remove_object(upload_name)
+    except Exception as e:
+        logger.warning(f"Could not remove staged archive {upload_name}: {e}")
+    return StoredArchive(object_name, sha256, size, deduplicated)
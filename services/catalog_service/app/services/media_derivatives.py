@@ -0,0 +1,91 @@
+import asyncio
+import io
+import logging
+from typing import Dict, Optional
+from uuid import UUID
+from PIL import Image, ImageOps, UnidentifiedImageError
+from minio.error import S3Error
+from sqlalchemy import update
+from starlette.concurrency import run_in_threadpool
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.agent_media import AgentMedia
+from app.services.agent_media import get_agent_media_by_id
+from app.utils.storage import storage
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+THUMBNAIL = "thumbnail"
+MEDIUM = "medium"
+ORIGINAL = "original"
+MEDIA_SIZES = (THUMBNAIL, MEDIUM, ORIGINAL)
+
+DERIVATIVE_MAX_SIZES = {
+    THUMBNAIL: settings.MEDIA_THUMBNAIL_MAX_SIZE,
+    MEDIUM: settings.MEDIA_MEDIUM_MAX_SIZE,
+}
+
+# Decoding and re-encoding are CPU heavy; cap how many images render at once.
+_render_slots = asyncio.Semaphore(settings.MEDIA_DERIVATIVE_CONCURRENCY)
+
+
+def derived_object_name(media: AgentMedia, size: str) -> str:
+    return f"agents/{media.agent_id}/derived/{media.id}-{size}.webp"
+
+
+def media_path_for_size(media: AgentMedia, size: str) -> str:
+    # Smallest variant that is at least the requested size; originals stand in
+    # for videos and for images whose derivatives are not ready yet.
+    if size == THUMBNAIL:
+        return media.thumbnail_path or media.medium_path or media.file_path
+    if size == MEDIUM:
+        return media.medium_path or media.file_path
+    return media.file_path
+
+
+def render_derivatives(original: bytes) -> Dict[str, bytes]:
+    with Image.open(io.BytesIO(original)) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        rendered = {}
+        for size, max_side in DERIVATIVE_MAX_SIZES.items():
+            variant = image.copy()
+            # Only ever shrinks; small originals keep their dimensions.
+            variant.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            variant.save(buffer, format="WEBP", quality=settings.MEDIA_WEBP_QUALITY, method=4)
+            rendered[size] = buffer.getvalue()
+        return rendered
+
+
+async def _store_derivatives(media: AgentMedia, rendered: Dict[str, bytes]) -> Dict[str, str]:
+    paths = {}
+    for size, data in rendered.items():
+        object_name = derived_object_name(media, size)
+        await storage.put_object(object_name, io.BytesIO(data), len(data), content_type="image/webp")
+        paths[f"{size}_path"] = object_name
+    return paths
+
+
+async def generate_media_derivatives(media_id: UUID) -> Optional[Dict[str, str]]:
+    async with AsyncSessionLocal() as db:
+        media = await get_agent_media_by_id(db, media_id)
+        if media is None or media.media_type != "image":
+            return None
+
+        try:
+            async with _render_slots:
+                original = await storage.get_object_bytes(media.file_path)
+                rendered = await run_in_threadpool(render_derivatives, original)
+            paths = await _store_derivatives(media, rendered)
+        except (S3Error, UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+            logger.warning(f"Derivatives for media {media_id} failed: {e}")
+            return None
+
+        await db.execute(update(AgentMedia).where(AgentMedia.id == media_id).values(**paths))
+        await db.commit()
+        return paths
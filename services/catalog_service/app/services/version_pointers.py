@@ -0,0 +1,38 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from app.models.agent import Agent
+from app.models.version import Version, VersionStatusEnum
+
+
+def _newest_version_id(agent_id: UUID, status: Optional[VersionStatusEnum] = None):
+    query = select(Version.id).where(Version.agent_id == agent_id)
+    if status is not None:
+        query = query.where(Version.status == status)
+    return query.order_by(Version.created_at.desc(), Version.id.desc()).limit(1).scalar_subquery()
+
+
+async def refresh_version_pointers(db: AsyncSession, agent_id: UUID):
+    # Call after any version write for the agent, before commit; recomputing from the
+    # (agent_id, created_at, id) index keeps this correct for status changes and deletes too.
+    await db.flush()
+    await db.execute(
+        update(Agent)
+        .where(Agent.id == agent_id)
+        .values(
+            latest_version_id=_newest_version_id(agent_id),
+            stable_version_id=_newest_version_id(agent_id, VersionStatusEnum.stable)
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_current_versions(db: AsyncSession, agent_ids: List[UUID], stable: bool = False) -> Dict[UUID, Version]:
+    pointer = Agent.stable_version_id if stable else Agent.latest_version_id
+    result = await db.execute(
+        select(Agent.id, Version)
+        .join(Version, Version.id == pointer)
+        .where(Agent.id.in_(agent_ids))
+    )
+    return {agent_id: version for agent_id, version in result.all()}
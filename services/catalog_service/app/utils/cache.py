@@ -0,0 +1,16 @@
+import logging
+from app.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CACHE_GENERATION_KEY = "catalog:cache:generation"
+CATALOG_CACHE_INVALIDATE_CHANNEL = "catalog:cache:invalidate"
+
+async def invalidate_catalog_cache():
+    if redis_client is None:
+        return
+    try:
+        generation = await redis_client.incr(CATALOG_CACHE_GENERATION_KEY)
+        await redis_client.publish(CATALOG_CACHE_INVALIDATE_CHANNEL, generation)
+    except Exception as e:
+        logger.warning(f"Catalog cache invalidation failed: {e}")
\ No newline at end of file
@@ -1,20 +1,28 @@
+import os
+import certifi
+import urllib3
 from minio import Minio
-from minio.error import S3Error
 from app.config import get_settings
 
 settings = get_settings()
 
+# One pooled connection per storage worker thread. Retries are handled by
+# AsyncStorage so they show up in its metrics instead of hiding in urllib3.
+http_client = urllib3.PoolManager(
+    timeout=urllib3.Timeout(connect=settings.MINIO_CONNECT_TIMEOUT, read=settings.MINIO_READ_TIMEOUT),
+    maxsize=settings.MINIO_EXECUTOR_WORKERS,
+    cert_reqs="CERT_REQUIRED",
+    ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+    retries=urllib3.Retry(connect=0, read=0, redirect=3)
+)
+
 minio_client = Minio(
     settings.MINIO_ENDPOINT,
     access_key=settings.MINIO_ACCESS_KEY,
     secret_key=settings.MINIO_SECRET_KEY,
-    secure=settings.MINIO_SECURE
+    secure=settings.MINIO_SECURE,
+    region=settings.MINIO_REGION,
+    http_client=http_client
 )
 
 bucket_name = settings.MINIO_BUCKET_NAME
-
-try:
-    if not minio_client.bucket_exists(bucket_name):
-        minio_client.make_bucket(bucket_name)
-except S3Error as e:
-    print(f"⚠️ MinIO bucket '{bucket_name}' creation failed: {e}")
\ No newline at end of file
@@ -0,0 +1,110 @@
+import logging
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, Iterable, List, Tuple
+from app.config import get_settings
+from app.redis import redis_client
+from app.utils.storage import storage
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+SIGNED_URL_KEY_PREFIX = "catalog:signed-url:"
+
+
+# Presigned GET URLs are reused until `margin` seconds before they expire.
+class PresignedUrlCache:
+    def __init__(self, expiry: int, margin: int, max_entries: int):
+        self.expiry = expiry
+        self.margin = margin
+        self.max_entries = max_entries
+        self._local: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    @property
+    def reuse_for(self) -> int:
+        return max(self.expiry - self.margin, 0)
+
+    async def get_many(self, object_names: Iterable[str]) -> Dict[str, str]:
+        object_names = list(dict.fromkeys(object_names))
+        now = time.time()
+        urls: Dict[str, str] = {}
+        missing: List[str] = []
+        for object_name in object_names:
+            url = self._local_get(object_name, now)
+            if url is None:
+                missing.append(object_name)
+            else:
+                urls[object_name] = url
+
+        if missing:
+            shared = await self._redis_get_many(missing)
+            for object_name, (url, reuse_until) in shared.items():
+                self._local_set(object_name, url, reuse_until)
+                urls[object_name] = url
+            missing = [object_name for object_name in missing if object_name not in shared]
+
+        if missing:
+            signed = await storage.presigned_get_many(missing, timedelta(seconds=self.expiry))
+            reuse_until = now + self.reuse_for
+            for object_name, url in signed.items():
+                self._local_set(object_name, url, reuse_until)
+            await self._redis_set_many(signed, reuse_until)
+            urls.update(signed)
+
+        return urls
+
+    async def get(self, object_name: str) -> str:
+        return (await self.get_many([object_name]))[object_name]
+
+    def _local_get(self, object_name: str, now: float):
+        entry = self._local.get(object_name)
+        if entry is None:
+            return None
+        url, reuse_until = entry
+        if now >= reuse_until:
+            del self._local[object_name]
+            return None
+        self._local.move_to_end(object_name)
+        return url
+
+    def _local_set(self, object_name: str, url: str, reuse_until: float):
+        self._local[object_name] = (url, reuse_until)
+        self._local.move_to_end(object_name)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    async def _redis_get_many(self, object_names: List[str]) -> Dict[str, Tuple[str, float]]:
+        if redis_client is None:
+            return {}
+        try:
+            values = await redis_client.mget([SIGNED_URL_KEY_PREFIX + name for name in object_names])
+        except Exception as e:
+            logger.warning(f"Signed URL cache read failed: {e}")
+            return {}
+        shared = {}
+        for object_name, value in zip(object_names, values):
+            if value:
+                # Stored as "<reuse_until> <url>" so local copies expire with the shared one.
+                reuse_until, url = value.split(" ", 1)
+                shared[object_name] = (url, float(reuse_until))
+        return shared
+
+    async def _redis_set_many(self, urls: Dict[str, str], reuse_until: float):
+        if redis_client is None or not urls or self.reuse_for <= 0:
+            return
+        try:
+            pipe = redis_client.pipeline()
+            for object_name, url in urls.items():
+                pipe.setex(SIGNED_URL_KEY_PREFIX + object_name, self.reuse_for, f"{reuse_until:.0f} {url}")
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Signed URL cache write failed: {e}")
+
+
+signed_url_cache = PresignedUrlCache(
+    expiry=settings.SIGNED_URL_EXPIRY,
+    margin=settings.SIGNED_URL_SAFETY_MARGIN,
+    max_entries=settings.SIGNED_URL_CACHE_MAX_ENTRIES
+)
@@ -0,0 +1,298 @@
+import asyncio
+import functools
+import hashlib
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Iterable, Optional, Tuple
+from minio import Minio
+from minio.commonconfig import ENABLED, CopySource, Filter
+from minio.lifecycleconfig import Expiration, LifecycleConfig, Rule
+from minio.error import S3Error, ServerError
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from app.config import get_settings
+from app.utils.minio_client import minio_client
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+RETRYABLE_S3_CODES = {
+    "InternalError",
+    "RequestTimeout",
+    "ServiceUnavailable",
+    "SlowDown",
+    "XMinioServerNotInitialized",
+}
+
+PENDING_UPLOAD_RULE_ID = "expire-pending-uploads"
+
+
+def pending_upload_name(object_name: str) -> str:
+    return f"{settings.MINIO_PENDING_UPLOAD_PREFIX}/{object_name}"
+
+
+def completed_upload_name(pending_name: str) -> Optional[str]:
+    # Final object name for a presigned upload, or None if it isn't under the pending prefix.
+    prefix = f"{settings.MINIO_PENDING_UPLOAD_PREFIX}/"
+    if not pending_name.startswith(prefix):
+        return None
+    return pending_name[len(prefix):]
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, S3Error):
+        return error.code in RETRYABLE_S3_CODES
+    return isinstance(error, (ServerError, Urllib3HTTPError, ConnectionError))
+
+
+# Every call runs on a dedicated executor, so slow S3 requests can neither block
+# the event loop nor starve the default threadpool that Starlette also uses.
+class AsyncStorage:
+    def __init__(
+        self,
+        client: Minio,
+        bucket: str,
+        max_workers: int,
+        retry_attempts: int,
+        retry_backoff: float,
+        pending_upload_prefix: Optional[str] = None,
+        pending_upload_expiry_days: int = 1
+    ):
+        self.client = client
+        self.bucket = bucket
+        self.pending_upload_prefix = pending_upload_prefix
+        self.pending_upload_expiry_days = pending_upload_expiry_days
+        self.retry_attempts = max(retry_attempts, 1)
+        self.retry_backoff = retry_backoff
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="storage")
+        self._max_workers = max_workers
+        self._bucket_ready = False
+        self._bucket_lock: Optional[asyncio.Lock] = None
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    async def _run(
+        self,
+        operation: str,
+        func: Callable,
+        *args,
+        before_retry: Optional[Callable[[], bool]] = None,
+        **kwargs
+    ) -> Any:
+        stats = self._stats.setdefault(
+            operation, {"calls": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs)
+        started = time.perf_counter()
+        attempt = 1
+        try:
+            while True:
+                try:
+                    return await loop.run_in_executor(self._executor, call)
+                except Exception as e:
+                    can_retry = (
+                        attempt < self.retry_attempts
+                        and is_retryable(e)
+                        and (before_retry is None or before_retry())
+                    )
+                    if not can_retry:
+                        stats["errors"] += 1
+                        raise
+                    delay = self.retry_backoff * 2 ** (attempt - 1)
+                    logger.warning(f"Storage {operation} failed ({e}), retry {attempt} in {delay:.2f}s")
+                    stats["retries"] += 1
+                    attempt += 1
+                    await asyncio.sleep(delay + random.uniform(0, delay))
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            stats["calls"] += 1
+            stats["total_ms"] += elapsed
+            stats["max_ms"] = max(stats["max_ms"], elapsed)
+
+    async def ensure_bucket(self):
+        if self._bucket_ready:
+            return
+        if self._bucket_lock is None:
+            self._bucket_lock = asyncio.Lock()
+        async with self._bucket_lock:
+            if not self._bucket_ready:
+                if not await self._run("bucket_exists", self.client.bucket_exists, self.bucket):
+                    await self._run("make_bucket", self.client.make_bucket, self.bucket)
+                if self.pending_upload_prefix:
+                    try:
+                        await self._run("set_bucket_lifecycle", self._ensure_pending_upload_rule)
+                    except Exception as e:
+                        # Not fatal: uploads still work, abandoned ones just aren't expired.
+                        logger.warning(f"Could not set lifecycle rule on '{self.bucket}': {e}")
+                self._bucket_ready = True
+
+    def _ensure_pending_upload_rule(self):
+        # Merge with any rules an operator configured instead of replacing them.
+        current = self.client.get_bucket_lifecycle(self.bucket)
+        rules = [rule for rule in (current.rules if current else []) if rule.rule_id != PENDING_UPLOAD_RULE_ID]
+        rules.append(Rule(
+            ENABLED,
+            rule_filter=Filter(prefix=f"{self.pending_upload_prefix}/"),
+            rule_id=PENDING_UPLOAD_RULE_ID,
+            expiration=Expiration(days=self.pending_upload_expiry_days),
+        ))
+        self.client.set_bucket_lifecycle(self.bucket, LifecycleConfig(rules))
+
+    async def put_object(
+        self,
+        object_name: str,
+        data: BinaryIO,
+        length: int,
+        content_type: str = "application/octet-stream",
+        part_size: int = 0
+    ):
+        await self.ensure_bucket()
+        # A failed attempt has consumed part of the stream; only retry when we can rewind it.
+        start = data.tell() if data.seekable() else None
+
+        def rewind() -> bool:
+            if start is None:
+                return False
+            data.seek(start)
+            return True
+
+        return await self._run(
+            "put_object",
+            self.client.put_object,
+            self.bucket,
+            object_name,
+            data,
+            length,
+            content_type=content_type,
+            part_size=part_size,
+            before_retry=rewind
+        )
+
+    async def get_object_bytes(self, object_name: str) -> bytes:
+        return await self._run("get_object", self._read_object, object_name)
+
+    def _read_object(self, object_name: str) -> bytes:
+        response = self.client.get_object(self.bucket, object_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def iter_object(
+        self,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+        chunk_size: int = 1024 * 1024
+    ) -> AsyncIterator[bytes]:
+        # Each read hops to the storage executor, so a slow client only ever holds one
+        # chunk in memory and never blocks the event loop.
+        response = await self._run(
+            "get_object", self.client.get_object, self.bucket, object_name, offset=offset, length=length
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                chunk = await loop.run_in_executor(self._executor, response.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            response.close()
+            response.release_conn()
+
+    async def stat_object(self, object_name: str):
+        return await self._run("stat_object", self.client.stat_object, self.bucket, object_name)
+
+    async def stat_object_or_none(self, object_name: str):
+        try:
+            return await self.stat_object(object_name)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchObject"):
+                return None
+            raise
+
+    async def copy_object(self, source_name: str, target_name: str):
+        return await self._run(
+            "copy_object", self.client.copy_object, self.bucket, target_name, CopySource(self.bucket, source_name)
+        )
+
+    async def sha256_object(self, object_name: str, chunk_size: int = 1024 * 1024) -> Tuple[str, int]:
+        return await self._run("sha256_object", self._sha256_object, object_name, chunk_size)
+
+    def _sha256_object(self, object_name: str, chunk_size: int) -> Tuple[str, int]:
+        digest = hashlib.sha256()
+        size = 0
+        response = self.client.get_object(self.bucket, object_name)
+        try:
+            for chunk in response.stream(chunk_size):
+                digest.update(chunk)
+                size += len(chunk)
+        finally:
+            response.close()
+            response.release_conn()
+        return digest.hexdigest(), size
+
+    async def remove_object(self, object_name: str):
+        return await self._run("remove_object", self.client.remove_object, self.bucket, object_name)
+
+    async def presigned_put_object(self, object_name: str, expires: timedelta) -> str:
+        await self.ensure_bucket()
+        return await self._run(
+            "presigned_put_object", self.client.presigned_put_object, self.bucket, object_name, expires
+        )
+
+    async def presigned_get_many(self, object_names: Iterable[str], expires: timedelta) -> Dict[str, str]:
+        # Signing is local HMAC work; one executor hop covers the whole batch.
+        return await self._run("presigned_get_object", self._sign_many, list(object_names), expires)
+
+    def _sign_many(self, object_names, expires: timedelta) -> Dict[str, str]:
+        return {
+            object_name: self.client.presigned_get_object(self.bucket, object_name, expires=expires)
+            for object_name in object_names
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        operations = {}
+        for operation, stats in self._stats.items():
+            operations[operation] = {
+                **stats,
+                "avg_ms": stats["total_ms"] / stats["calls"] if stats["calls"] else 0.0,
+            }
+        return {
+            "bucket": self.bucket,
+            "bucket_ready": self._bucket_ready,
+            "max_workers": self._max_workers,
+            "operations": operations,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+storage = AsyncStorage(
+    minio_client,
+    bucket=settings.MINIO_BUCKET_NAME,
+    max_workers=settings.MINIO_EXECUTOR_WORKERS,
+    retry_attempts=settings.MINIO_RETRY_ATTEMPTS,
+    retry_backoff=settings.MINIO_RETRY_BACKOFF,
+    pending_upload_prefix=settings.MINIO_PENDING_UPLOAD_PREFIX,
+    pending_upload_expiry_days=settings.MINIO_PENDING_UPLOAD_EXPIRY_DAYS
+)
+
+
+def get_storage() -> AsyncStorage:
+    return storage
+
+
+async def init_storage():
+    try:
+        await storage.ensure_bucket()
+    except Exception as e:
+        # Uploads call ensure_bucket again, so a MinIO that is still starting up
+        # does not keep the catalog from serving reads.
+        logger.warning(f"MinIO bucket '{storage.bucket}' is not ready yet: {e}")
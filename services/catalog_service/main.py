@@ -1,11 +1,16 @@
+import asyncio
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from app.routers.agent import router as agent_router
 from app.routers.version import router as version_router
 from app.routers.category import router as category_router
 from app.routers.comment import router as comment_router
-from app.routers.agent_media import router as agent_media_router
+from app.routers.agent_media import router as agent_media_router, batch_router as agent_media_batch_router
 from app.config import get_settings
+from app.redis import redis_client
+from app.database import engine, get_pool_metrics
+from app.utils.storage import storage, init_storage
+from app.utils.upload_limits import MULTIPART_OVERHEAD, UploadSizeLimitMiddleware
 
 app = FastAPI()
 settings = get_settings()
@@ -18,8 +23,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    routes=[
+        ("POST", r"^/versions/[^/]+/versions/?$"),
+        ("PUT", r"^/versions/[^/]+/archive$"),
+    ],
+    max_body_size=settings.MAX_ARCHIVE_SIZE + MULTIPART_OVERHEAD
+)
+
+app.include_router(agent_media_batch_router)
 app.include_router(agent_router)
 app.include_router(version_router)
 app.include_router(category_router)
 app.include_router(comment_router)
-app.include_router(agent_media_router)
\ No newline at end of file
+app.include_router(agent_media_router)
+
+@app.get("/metrics/db-pool")
+async def db_pool_metrics():
+    return get_pool_metrics()
+
+@app.get("/metrics/storage")
+async def storage_metrics():
+    return storage.get_metrics()
+
+@app.on_event("startup")
+async def startup():
+    # Warm the bucket check without holding up startup; uploads re-check lazily.
+    asyncio.create_task(init_storage())
+
+@app.on_event("shutdown")
+async def shutdown():
+    if redis_client is not None:
+        await redis_client.close()
+    await engine.dispose()
+    storage.shutdown()
\ No newline at end of file
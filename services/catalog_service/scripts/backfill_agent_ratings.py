@@ -0,0 +1,31 @@
+"""Recompute every agent's avg_raiting, reviews_count and rating_sum from comments.
+
+Migration 8e3b5d7f1a64 does the initial backfill. Run this to re-sync whenever the
+totals may have drifted (e.g. comments edited directly in the database):
+
+    python -m scripts.backfill_agent_ratings
+
+Runs in a single transaction; comment writes during the backfill wait on the row
+locks and are applied on top of the recomputed totals.
+"""
+import argparse
+import asyncio
+from app.database import AsyncSessionLocal, engine
+from app.services.agent_ratings import backfill_agent_ratings
+from app.utils.cache import invalidate_catalog_cache
+
+
+async def main():
+    argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter).parse_args()
+    try:
+        async with AsyncSessionLocal() as db:
+            updated = await backfill_agent_ratings(db)
+            await db.commit()
+        await invalidate_catalog_cache()
+        print(f"Recomputed ratings for {updated} agents with comments")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,207 @@
+"""Seed a local catalog database and benchmark the agent listing filters.
+
+Run from services/catalog_service against a throwaway Postgres with migrations applied:
+
+    python -m scripts.bench_agent_filters --seed 100000 --runs 20
+    python -m scripts.bench_agent_filters --cleanup
+
+Every query runs twice: once inside a transaction that drops the filter indexes
+(rolled back afterwards, so "before" never touches the real schema) and once with
+them in place. DROP INDEX takes an exclusive lock, so never point this at a shared DB.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+BENCH_SLUG_PREFIX = "bench-"
+
+FILTER_INDEXES = [
+    "ix_agents_category_id_avg_raiting",
+    "ix_agents_avg_raiting",
+    "ix_agents_price",
+    "ix_agents_user_id_created_at_id",
+    "ix_agents_name_trgm",
+    "ix_agents_description_trgm",
+    "ix_versions_agent_id_created_at_id",
+    "ix_comments_agent_id_created_at_id",
+    "ix_agent_media_agent_id",
+]
+
+LISTING = "SELECT * FROM agents {where} ORDER BY created_at DESC, id DESC LIMIT 101"
+
+# name -> (sql, needs) ; needs selects which sample value gets bound as :value
+CASES: Dict[str, Tuple[str, Optional[str]]] = {
+    "no filter": (LISTING.format(where=""), None),
+    "category": (LISTING.format(where="WHERE category_id = :category_id"), "category_id"),
+    "min_rating": (LISTING.format(where="WHERE avg_raiting >= 4.5"), None),
+    "max_price": (LISTING.format(where="WHERE price <= 5"), None),
+    "category + min_rating": (
+        LISTING.format(where="WHERE category_id = :category_id AND avg_raiting >= 4.5"), "category_id"
+    ),
+    "category + min_rating + max_price": (
+        LISTING.format(where="WHERE category_id = :category_id AND avg_raiting >= 4.5 AND price <= 5"), "category_id"
+    ),
+    "my agents (user_id)": (LISTING.format(where="WHERE user_id = :user_id"), "user_id"),
+    "search ILIKE": (
+        LISTING.format(where="WHERE name ILIKE '%agent 42%' OR description ILIKE '%agent 42%'"), None
+    ),
+    "versions by agent_id": (
+        "SELECT * FROM versions WHERE agent_id = :agent_id ORDER BY created_at DESC, id DESC LIMIT 101", "agent_id"
+    ),
+    "comments by agent_id": (
+        "SELECT * FROM comments WHERE agent_id = :agent_id ORDER BY created_at DESC, id DESC LIMIT 101", "agent_id"
+    ),
+    "media by agent_id": ("SELECT * FROM agent_media WHERE agent_id = :agent_id", "agent_id"),
+}
+
+
+def database_url() -> str:
+    from app.database import DATABASE_URL
+    return DATABASE_URL
+
+
+async def seed(conn: AsyncConnection, agents: int, categories: int, users: int):
+    await conn.execute(text("""
+        INSERT INTO categories (id, name, slug)
+        SELECT gen_random_uuid(), 'Bench category ' || g, :prefix || 'category-' || g
+        FROM generate_series(1, :categories) AS g
+        ON CONFLICT (slug) DO NOTHING
+    """), {"prefix": BENCH_SLUG_PREFIX, "categories": categories})
+    await conn.execute(text("""
+        WITH cats AS (
+            SELECT array_agg(id) AS ids FROM categories WHERE slug LIKE :prefix || '%'
+        ), owners AS (
+            SELECT array_agg(gen_random_uuid()) AS ids FROM generate_series(1, :users)
+        )
+        INSERT INTO agents (
+            id, user_id, name, slug, agent_url, description, tags,
+            category_id, price, avg_raiting, reviews_count, created_at, updated_at
+        )
+        SELECT
+            gen_random_uuid(),
+            owners.ids[1 + (g % :users)],
+            'Bench agent ' || g,
+            :prefix || 'agent-' || g,
+            'https://example.com/agents/' || g,
+            'Synthetic agent ' || g || ' for filter benchmarks',
+            jsonb_build_array('bench', 'tag' || (g % 50)),
+            cats.ids[1 + (g % :categories)],
+            round((random() * 100)::numeric, 2),
+            round((random() * 5)::numeric, 2),
+            (random() * 500)::int,
+            now() - (g || ' seconds')::interval,
+            now()
+        FROM generate_series(1, :agents) AS g, cats, owners
+        ON CONFLICT (slug) DO NOTHING
+    """), {"prefix": BENCH_SLUG_PREFIX, "agents": agents, "categories": categories, "users": users})
+    await conn.execute(text("""
+        INSERT INTO versions (id, agent_id, version, status, created_at)
+        SELECT gen_random_uuid(), a.id, '1.' || v, 'published', a.created_at + (v || ' minutes')::interval
+        FROM agents a, generate_series(1, 3) AS v
+        WHERE a.slug LIKE :prefix || '%'
+    """), {"prefix": BENCH_SLUG_PREFIX})
+    await conn.execute(text("ANALYZE agents"))
+    await conn.execute(text("ANALYZE versions"))
+
+
+async def cleanup(conn: AsyncConnection):
+    agent_ids = "SELECT id FROM agents WHERE slug LIKE :prefix || '%'"
+    params = {"prefix": BENCH_SLUG_PREFIX}
+    for table in ("versions", "comments", "agent_media"):
+        await conn.execute(text(f"DELETE FROM {table} WHERE agent_id IN ({agent_ids})"), params)
+    await conn.execute(text("DELETE FROM agents WHERE slug LIKE :prefix || '%'"), params)
+    await conn.execute(text("DELETE FROM categories WHERE slug LIKE :prefix || '%'"), params)
+
+
+async def sample_values(conn: AsyncConnection) -> Dict[str, str]:
+    row = (await conn.execute(text("""
+        SELECT category_id, user_id, id AS agent_id FROM agents
+        WHERE slug LIKE :prefix || '%' AND category_id IS NOT NULL
+        ORDER BY created_at DESC LIMIT 1
+    """), {"prefix": BENCH_SLUG_PREFIX})).mappings().first()
+    if row is None:
+        raise SystemExit("No benchmark rows found; run with --seed first.")
+    return {key: str(value) for key, value in row.items()}
+
+
+async def run_case(conn: AsyncConnection, sql: str, params: dict, runs: int) -> Tuple[List[str], float, float]:
+    plan = [line for (line,) in await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params)]
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await conn.execute(text(sql), params)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return plan, statistics.median(timings), p95
+
+
+async def run_suite(conn: AsyncConnection, values: Dict[str, str], runs: int) -> Dict[str, Tuple[List[str], float, float]]:
+    results = {}
+    for name, (sql, needs) in CASES.items():
+        params = {needs: values[needs]} if needs else {}
+        results[name] = await run_case(conn, sql, params, runs)
+    return results
+
+
+async def benchmark(engine, runs: int, verbose: bool):
+    async with engine.connect() as conn:
+        values = await sample_values(conn)
+
+        transaction = await conn.begin()
+        try:
+            for index in FILTER_INDEXES:
+                await conn.execute(text(f"DROP INDEX IF EXISTS {index}"))
+            before = await run_suite(conn, values, runs)
+        finally:
+            await transaction.rollback()
+
+        async with conn.begin():
+            after = await run_suite(conn, values, runs)
+
+    print(f"{'case':<36} {'before p50':>11} {'before p95':>11} {'after p50':>10} {'after p95':>10}")
+    for name in CASES:
+        _, before_p50, before_p95 = before[name]
+        _, after_p50, after_p95 = after[name]
+        print(f"{name:<36} {before_p50:>9.2f}ms {before_p95:>9.2f}ms {after_p50:>8.2f}ms {after_p95:>8.2f}ms")
+
+    for name in CASES:
+        print(f"\n== {name}")
+        for label, plan in (("before", before[name][0]), ("after", after[name][0])):
+            lines = plan if verbose else plan[:3]
+            print(f"-- {label}")
+            for line in lines:
+                print(f"   {line}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", help="SQLAlchemy async URL; defaults to the service settings")
+    parser.add_argument("--seed", type=int, default=0, help="Number of agents to insert before benchmarking")
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=20, help="Timed executions per query")
+    parser.add_argument("--cleanup", action="store_true", help="Delete benchmark rows and exit")
+    parser.add_argument("--verbose", action="store_true", help="Print full EXPLAIN output")
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.dsn or database_url())
+    try:
+        if args.cleanup:
+            async with engine.begin() as conn:
+                await cleanup(conn)
+            return
+        if args.seed:
+            async with engine.begin() as conn:
+                await seed(conn, args.seed, args.categories, args.users)
+        await benchmark(engine, args.runs, args.verbose)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""Upload archives concurrently to a running catalog and measure head-of-line blocking.
+
+While N uploads are in flight a probe keeps hitting a cheap endpoint; if archive
+writes blocked the event loop, probe latency would climb with the upload size.
+
+    python -m scripts.bench_archive_uploads --agent-id <uuid> --token <jwt> \\
+        --concurrency 1,4,8 --size-mb 50 --mode stream
+
+Needs httpx. Every upload gets unique content so dedup can't short-circuit it;
+created versions are deleted afterwards unless --keep is given, but the archives
+stay in MinIO under archives/sha256/.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from typing import AsyncIterator, List, Tuple
+import httpx
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def archive_body(size: int, block: bytes) -> AsyncIterator[bytes]:
+    # Unique prefix per upload, then a shared random block repeated up to `size`.
+    yield uuid.uuid4().bytes
+    sent = 16
+    while sent < size:
+        chunk = block[:min(len(block), size - sent)]
+        sent += len(chunk)
+        yield chunk
+
+
+async def upload(client: httpx.AsyncClient, args, block: bytes, index: int) -> Tuple[float, str]:
+    size = args.size_mb * 1024 * 1024
+    params = {"version": f"bench-{int(time.time())}-{index}", "status": "unpublished"}
+    started = time.perf_counter()
+    if args.mode == "stream":
+        response = await client.put(
+            f"/versions/{args.agent_id}/archive",
+            params={**params, "filename": "bench.zip"},
+            content=archive_body(size, block),
+            headers={"Content-Type": "application/zip"},
+        )
+    else:
+        data = b"".join([chunk async for chunk in archive_body(size, block)])
+        response = await client.post(
+            f"/versions/{args.agent_id}/versions/",
+            data=params,
+            files={"archive": ("bench.zip", data, "application/zip")},
+        )
+    response.raise_for_status()
+    return time.perf_counter() - started, response.json()["id"]
+
+
+async def probe(client: httpx.AsyncClient, path: str, interval: float, stop: asyncio.Event) -> List[float]:
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(path)
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def run_round(client: httpx.AsyncClient, args, block: bytes, concurrency: int):
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(client, args.probe_path, args.probe_interval, stop))
+    started = time.perf_counter()
+    results = await asyncio.gather(*(upload(client, args, block, i) for i in range(concurrency)))
+    wall = time.perf_counter() - started
+    stop.set()
+    latencies = await probe_task
+
+    if not args.keep:
+        for _, version_id in results:
+            await client.delete(f"/versions/{version_id}")
+
+    total_mb = args.size_mb * concurrency
+    upload_times = [seconds for seconds, _ in results]
+    print(
+        f"{concurrency:>5} {wall:>8.2f}s {total_mb / wall:>8.1f}MB/s {statistics.median(upload_times):>8.2f}s "
+        f"{statistics.median(latencies):>9.1f}ms {percentile(latencies, 0.95):>9.1f}ms {max(latencies):>9.1f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.getenv("CATALOG_URL", "http://localhost:8003"))
+    parser.add_argument("--token", default=os.getenv("CATALOG_TOKEN"), required=os.getenv("CATALOG_TOKEN") is None)
+    parser.add_argument("--agent-id", required=True, help="Agent owned by the token's user")
+    parser.add_argument("--concurrency", default="1,4,8", help="Comma-separated concurrent upload counts")
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--mode", choices=("stream", "multipart"), default="stream")
+    parser.add_argument("--probe-path", default="/metrics/storage")
+    parser.add_argument("--probe-interval", type=float, default=0.05)
+    parser.add_argument("--keep", action="store_true", help="Keep the created versions")
+    args = parser.parse_args()
+
+    block = os.urandom(CHUNK_SIZE)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {args.token}"},
+        timeout=httpx.Timeout(600.0, connect=10.0),
+        limits=httpx.Limits(max_connections=64),
+    ) as client:
+        stop = asyncio.Event()
+        idle_probe = asyncio.create_task(probe(client, args.probe_path, args.probe_interval, stop))
+        await asyncio.sleep(2)
+        stop.set()
+        idle = await idle_probe
+        print(f"idle probe: p50 {statistics.median(idle):.1f}ms  p95 {percentile(idle, 0.95):.1f}ms  max {max(idle):.1f}ms")
+        print(f"\n{'conc':>5} {'wall':>9} {'thruput':>10} {'upload p50':>9} {'probe p50':>11} {'probe p95':>11} {'probe max':>11}")
+        for concurrency in (int(value) for value in args.concurrency.split(",")):
+            await run_round(client, args, block, concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+"""add keyset pagination indexes
+
+Revision ID: 9e4b2c7d1a36
+Revises: 2ff76ba99cc8
+Create Date: 2026-01-12 10:21:05.903127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b2c7d1a36'
+down_revision: Union[str, Sequence[str], None] = '2ff76ba99cc8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_content_created_at_id', 'content', ['created_at', 'id'], unique=False)
+    op.create_index('ix_content_content_type_id_created_at_id', 'content', ['content_type_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_content_user_id_created_at_id', 'content', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_content_agent_id_created_at_id', 'content', ['agent_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_comments_content_id_created_at_id', 'comments', ['content_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_content_id_created_at_id', table_name='comments')
+    op.drop_index('ix_content_agent_id_created_at_id', table_name='content')
+    op.drop_index('ix_content_user_id_created_at_id', table_name='content')
+    op.drop_index('ix_content_content_type_id_created_at_id', table_name='content')
+    op.drop_index('ix_content_created_at_id', table_name='content')
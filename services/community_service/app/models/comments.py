@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, DateTime, SmallInteger, ForeignKey, Enum
+from sqlalchemy import Column, Text, DateTime, SmallInteger, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -8,6 +8,9 @@ from app.core.base import Base
 
 class Comment(Base):
     __tablename__ = 'comments'
+    __table_args__ = (
+        Index('ix_comments_content_id_created_at_id', 'content_id', 'created_at', 'id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     user_id = Column(UUID(as_uuid=True), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Text, DateTime, SmallInteger, ForeignKey, Enum
+from sqlalchemy import Column, Text, DateTime, SmallInteger, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -8,6 +8,12 @@ from app.core.base import Base
 
 class Content(Base):
     __tablename__ = 'content'
+    __table_args__ = (
+        Index('ix_content_created_at_id', 'created_at', 'id'),
+        Index('ix_content_content_type_id_created_at_id', 'content_type_id', 'created_at', 'id'),
+        Index('ix_content_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_content_agent_id_created_at_id', 'agent_id', 'created_at', 'id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
     content_type_id = Column(SmallInteger, ForeignKey('content_types.id'), nullable=False)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
@@ -9,6 +9,7 @@ from app.models.comments import Comment
 from app.models.content import Content
 from app.schemas.comments import CommentCreate, CommentUpdate, CommentRead, CommentReadFull
 from app.utils.auth import get_current_user
+from app.utils.pagination import keyset_paginate, keyset_page
 
 router = APIRouter(prefix="/comments", tags=["comments"])
 
@@ -81,18 +82,20 @@ async def read_comment(
 
 @router.get("/", response_model=list[CommentRead])
 async def read_comments(
+    response: Response,
     content_id: UUID = None,
-    skip: int = 0,
-    limit: int = 100,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     stmt = select(Comment)
     if content_id:
         stmt = stmt.where(Comment.content_id == content_id)
-    stmt = stmt.offset(skip).limit(limit)
+    stmt = keyset_paginate(stmt, Comment.created_at, Comment.id, cursor, limit)
     result = await db.execute(stmt)
-    return result.scalars().all()
+    comments, _ = keyset_page(result.scalars().all(), limit, response)
+    return comments
 
 
 @router.put("/{comment_id}", response_model=CommentRead)
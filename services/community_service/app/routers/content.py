@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
@@ -10,6 +10,7 @@ from app.models.content import Content
 from app.models.content_type import ContentType
 from app.schemas.content import ContentCreate, ContentUpdate, ContentRead, ContentReadFull
 from app.utils.auth import get_current_user
+from app.utils.pagination import keyset_paginate, keyset_page
 
 
 async def get_content_or_404(db: Session, content_id: UUID) -> Content:
@@ -60,6 +61,46 @@ async def create_content(
     return db_content
 
 
+# Must stay above /{content_id}: routes match in declaration order, and "dis" would be taken as a content id.
+@router.get("/dis", response_model=list[ContentRead])
+async def get_contents_filtered(
+    response: Response,
+    cursor: str | None = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    content_type_id: int | None = Query(None, description="Filter by content type ID"),
+    user_id: str | None = Query(None, description="Filter by user ID"),
+    agent_id: str | None = Query(None, description="Filter by agent ID"),
+    content_type_name: str | None = Query(None, description="Filter by content type name (e.g., 'discussion')"),
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    query = select(Content)
+
+    if content_type_id is not None:
+        query = query.where(Content.content_type_id == content_type_id)
+
+    if content_type_name is not None:
+        stmt = select(ContentType.id).where(ContentType.name == content_type_name)
+        result = await db.execute(stmt)
+        content_type_id_from_name = result.scalar_one_or_none()
+        if content_type_id_from_name:
+            query = query.where(Content.content_type_id == content_type_id_from_name)
+        else:
+            return []
+
+    if user_id is not None:
+        query = query.where(Content.user_id == user_id)
+
+    if agent_id is not None:
+        query = query.where(Content.agent_id == agent_id)
+
+    query = keyset_paginate(query, Content.created_at, Content.id, cursor, limit)
+
+    result = await db.execute(query)
+    contents, _ = keyset_page(result.scalars().all(), limit, response)
+    return contents
+
+
 @router.get("/{content_id}", response_model=ContentReadFull)
 async def read_content(
     content_id: UUID,
@@ -81,8 +122,9 @@ async def read_content(
 
 @router.get("/", response_model=list[ContentRead])
 async def read_contents(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
     content_type_id: int | None = None,
     user_id: UUID | None = None,
     current_user: dict = Depends(get_current_user),
@@ -95,46 +137,9 @@ async def read_contents(
     if user_id is not None:
         stmt = stmt.where(Content.user_id == user_id)
 
-    stmt = stmt.offset(skip).limit(limit)
+    stmt = keyset_paginate(stmt, Content.created_at, Content.id, cursor, limit)
     result = await db.execute(stmt)
-    contents = result.scalars().all()
-    return contents
-
-@router.get("/dis", response_model=list[ContentRead])
-async def get_contents_filtered(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, le=1000),
-    content_type_id: int | None = Query(None, description="Filter by content type ID"),
-    user_id: str | None = Query(None, description="Filter by user ID"),
-    agent_id: str | None = Query(None, description="Filter by agent ID"),
-    content_type_name: str | None = Query(None, description="Filter by content type name (e.g., 'discussion')"),
-    current_user: dict = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    query = select(Content)
-
-    if content_type_id is not None:
-        query = query.where(Content.content_type_id == content_type_id)
-
-    if content_type_name is not None:
-        stmt = select(ContentType.id).where(ContentType.name == content_type_name)
-        result = await db.execute(stmt)
-        content_type_id_from_name = result.scalar_one_or_none()
-        if content_type_id_from_name:
-            query = query.where(Content.content_type_id == content_type_id_from_name)
-        else:
-            return []
-
-    if user_id is not None:
-        query = query.where(Content.user_id == user_id)
-
-    if agent_id is not None:
-        query = query.where(Content.agent_id == agent_id)
-
-    query = query.offset(skip).limit(limit)
-
-    result = await db.execute(query)
-    contents = result.scalars().all()
+    contents, _ = keyset_page(result.scalars().all(), limit, response)
     return contents
 
 @router.put("/{content_id}", response_model=ContentRead)
@@ -4,6 +4,7 @@ from jose import JWTError, jwt
 from fastapi import HTTPException, status, Depends, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.config import get_settings
+from app.utils.token_cache import TokenClaimsCache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,19 +12,25 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 security = HTTPBearer()
 
+token_claims_cache = TokenClaimsCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
+
 def verify_token(token: str) -> Optional[dict]:
+    cached = token_claims_cache.get(token)
+    if cached is not None:
+        return dict(cached[0])
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
         role: str = payload.get("role")
         if user_id is None or role is None:
             return None
-        return {"user_id": user_id, "role": role}
+        user_data = {"user_id": user_id, "role": role}
+        token_claims_cache.set(token, user_data, payload.get("exp"))
+        return dict(user_data)
     except JWTError:
         return None
     
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    logger.info(f"Received Authorization header: {credentials.credentials}")
     token = credentials.credentials
     user_data = verify_token(token)
     
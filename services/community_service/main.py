@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine
+from app.database import engine, get_pool_metrics
 from app.routers.comments import router as comments_router
 from app.routers.content import router as content_router
 from app.routers.content_type import router as content_type_router
@@ -30,6 +30,10 @@ app.include_router(content_type_router)
 async def health_check():
     return {"status": "ok", "service": "community-service"}
 
+@app.get("/metrics/db-pool")
+async def db_pool_metrics():
+    return get_pool_metrics()
+
 @app.on_event("startup")
 async def startup():
     pass
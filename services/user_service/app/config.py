@@ -25,6 +25,14 @@ class Settings(BaseSettings):
     REDIS_URL: str
     REDIS_PASSWORD: str
 
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -5,6 +5,7 @@ from app.database import get_db
 from app.models.user import User
 from uuid import UUID
 from app.schemas.auth import LoginRequest, Token
+from app.schemas.user import UserOut
 from app.services.auth_service import login_user, refresh_user_token, logout_user
 from app.dependencies.auth import get_current_user
 from app.utils.auth import generate_reset_token, store_reset_token, verify_reset_token, delete_reset_token
@@ -89,6 +90,6 @@ async def refresh(refresh_token: str, db: AsyncSession = Depends(get_db)):
         )
         
 @router.post("/logout")
-async def logout(user_id: str = Depends(get_current_user)):
-    await logout_user(user_id)
+async def logout(current_user: UserOut = Depends(get_current_user)):
+    await logout_user(str(current_user.id))
     return {"message": "Successfully logged out"}
\ No newline at end of file
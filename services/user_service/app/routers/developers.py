@@ -1,22 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Dict, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.schemas.developer import DeveloperCreate, DeveloperUpdate, DeveloperOut
 from app.services.developer_service import (
     get_developer_by_user_id,
+    get_developers_by_user_ids,
     create_developer,
     update_developer,
     delete_developer
 )
 from app.dependencies.auth import get_current_user
-from app.models.user import User
+from app.schemas.user import UserOut
 
 router = APIRouter()
 
+MAX_BATCH_SIZE = 500
+
 @router.post("/", response_model=DeveloperOut, status_code=status.HTTP_201_CREATED)
 async def become_developer(
     dev_in: DeveloperCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     if current_user.role not in ["user", "creator"]:
@@ -33,13 +37,23 @@ async def become_developer(
     
 @router.get("/me", response_model=DeveloperOut)
 async def get_my_developer_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     dev = await get_developer_by_user_id(db, str(current_user.id))
     if not dev:
         raise HTTPException(status_code=404, detail="Developer profile not found")
     return dev
+
+@router.get("/batch", response_model=Dict[str, DeveloperOut])
+async def get_developer_profiles_batch(
+    user_ids: List[str] = Query(..., description="User IDs, repeated or comma-separated"),
+    db: AsyncSession = Depends(get_db)
+):
+    ids = [user_id.strip() for value in user_ids for user_id in value.split(",") if user_id.strip()]
+    if len(ids) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Too many user_ids (max {MAX_BATCH_SIZE})")
+    return await get_developers_by_user_ids(db, ids)
     
 @router.get("/{user_id}", response_model=DeveloperOut)
 async def get_developer_profile(
@@ -54,7 +68,7 @@ async def get_developer_profile(
 @router.patch("/me", response_model=DeveloperOut)
 async def update_my_developer_profile(
     dev_update: DeveloperUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     dev = await update_developer(db, str(current_user.id), dev_update)
@@ -66,7 +80,7 @@ async def update_my_developer_profile(
 async def update_developer_info(
     user_id: str,
     user_update: DeveloperUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     if current_user.role != "admin":
@@ -80,7 +94,7 @@ async def update_developer_info(
 
 @router.delete("/me")
 async def delete_my_developer_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     deleted = await delete_developer(db, str(current_user.id))
@@ -91,7 +105,7 @@ async def delete_my_developer_profile(
 @router.delete("/{user_id}")
 async def delete_developer_info(
     user_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     if current_user.role != "admin":
@@ -2,7 +2,6 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database import get_db
-from app.models.user import User
 from app.schemas.user import (
     UserCreate,
     UserOut,
@@ -34,7 +33,7 @@ async def register_user(
 @router.post("/change-password")
 async def change_password(
     change_password_request: ChangePasswordRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     try:
@@ -50,7 +49,7 @@ async def change_password(
 
 @router.get("/me", response_model=UserOut)
 async def get_my_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     return current_user
@@ -78,7 +77,7 @@ async def get_user_full_info(
 @router.patch("/me", response_model=UserOut)
 async def update_my_profile(
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     return await update_user(db, str(current_user.id), user_update)
@@ -87,7 +86,7 @@ async def update_my_profile(
 async def update_user_info(
     user_id: str,
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     if current_user.role != "admin":
@@ -101,7 +100,7 @@ async def update_user_info(
     
 @router.delete("/me")
 async def delete_my_account(
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     await delete_developer(db, str(current_user.id))
@@ -111,7 +110,7 @@ async def delete_my_account(
 @router.delete("/{user_id}")
 async def delete_user_info(
     user_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: UserOut = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     if current_user.role != "admin":
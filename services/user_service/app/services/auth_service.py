@@ -10,6 +10,8 @@ from app.utils.auth import (
     delete_refresh_token
 )
 from app.schemas.auth import LoginRequest
+from app.schemas.user import UserOut
+from app.utils.cache import set_user_in_cache
 from typing import Optional
 from jose import jwt
 from app.config import get_settings
@@ -37,6 +39,7 @@ async def login_user(db: AsyncSession, login_data: LoginRequest):
     refresh_token = create_refresh_token(data=refresh_token_data)
     
     await store_refresh_token(str(user.id), refresh_token)
+    await set_user_in_cache(str(user.id), UserOut.model_validate(user).model_dump(mode='json'))
 
     return {
         "access_token": access_token,
@@ -6,9 +6,12 @@ from app.schemas.developer import DeveloperCreate, DeveloperUpdate, DeveloperOut
 from app.utils.cache import (
     get_developer_from_cache,
     set_developer_in_cache,
-    delete_developer_from_cache
+    delete_developer_from_cache,
+    get_developers_from_cache,
+    set_developers_in_cache
 )
-from typing import Optional
+from typing import Optional, Dict, List
+from uuid import UUID
 
 async def get_developer_by_user_id(db: AsyncSession, user_id: str) -> Optional[DeveloperOut]:
     cached_dev = await get_developer_from_cache(user_id)
@@ -26,6 +29,32 @@ async def get_developer_by_user_id(db: AsyncSession, user_id: str) -> Optional[D
     
     return dev
 
+async def get_developers_by_user_ids(db: AsyncSession, user_ids: List[str]) -> Dict[str, DeveloperOut]:
+    unique_ids = []
+    for user_id in dict.fromkeys(user_ids):
+        try:
+            unique_ids.append(str(UUID(user_id)))
+        except ValueError:
+            continue
+
+    cached = await get_developers_from_cache(unique_ids)
+    developers = {
+        user_id: DeveloperOut.model_validate(dev_data)
+        for user_id, dev_data in cached.items()
+    }
+
+    missing_ids = [user_id for user_id in unique_ids if user_id not in developers]
+    if missing_ids:
+        result = await db.execute(select(Developer).where(Developer.user_id.in_(missing_ids)))
+        fetched = {}
+        for dev in result.scalars().all():
+            dev_out = DeveloperOut.model_validate(dev)
+            developers[str(dev.user_id)] = dev_out
+            fetched[str(dev.user_id)] = dev_out.model_dump(mode='json')
+        await set_developers_in_cache(fetched)
+
+    return developers
+
 async def create_developer(db: AsyncSession, user_id: str, dev_in: DeveloperCreate) -> Developer:
     existing = await get_developer_by_user_id(db, user_id)
     if existing:
@@ -1,5 +1,5 @@
 import json
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from app.redis import redis_client
 
 async def get_user_from_cache(user_id: str) -> Optional[Dict[str, Any]]:
@@ -77,4 +77,30 @@ async def delete_developer_from_cache(user_id: str):
     Удаляет профиль разработчика из Redis.
     """
     key = f"developer:profile:{user_id}"
-    await redis_client.delete(key)
\ No newline at end of file
+    await redis_client.delete(key)
+
+async def get_developers_from_cache(user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Получает профили нескольких разработчиков из Redis одним MGET.
+    Возвращает dict user_id -> профиль только для найденных в кэше.
+    """
+    if not user_ids:
+        return {}
+    keys = [f"developer:profile:{user_id}" for user_id in user_ids]
+    cached_data = await redis_client.mget(keys)
+    return {
+        user_id: json.loads(data)
+        for user_id, data in zip(user_ids, cached_data)
+        if data
+    }
+
+async def set_developers_in_cache(devs: Dict[str, Dict[str, Any]], ttl: int = 600):
+    """
+    Сохраняет профили нескольких разработчиков в Redis одним pipeline.
+    """
+    if not devs:
+        return
+    pipe = redis_client.pipeline()
+    for user_id, dev_data in devs.items():
+        pipe.setex(f"developer:profile:{user_id}", ttl, json.dumps(dev_data))
+    await pipe.execute()
@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine
+from app.database import engine, get_pool_metrics
 from app.models import Base
 from app.routers import users, developers, auth
 from app.config import get_settings
@@ -30,6 +30,10 @@ app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 async def health_check():
     return {"status": "ok", "service": "user-service"}
 
+@app.get("/metrics/db-pool")
+async def db_pool_metrics():
+    return get_pool_metrics()
+
 @app.on_event("startup")
 async def startup():
     try: